@@ -0,0 +1,51 @@
+"""Size and encode/decode time of the JSON, CBOR, MessagePack and container
+forms of the sample vCons.
+
+Usage: python benchmarks/bench_codecs.py [file ...]
+"""
+
+import glob
+import os
+import sys
+import time
+
+from vcon import Vcon
+
+SAMPLES = os.path.join(os.path.dirname(__file__), "..", "samples", "*.vcon.json")
+
+
+def bench(fn, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds * 1e3
+
+
+def main():
+    paths = sys.argv[1:] or sorted(glob.glob(SAMPLES))
+    codecs = {
+        "json": (lambda v: v.to_json(as_bytes=True), Vcon.build_from_json),
+        "cbor": (Vcon.to_cbor, Vcon.from_cbor),
+        "msgpack": (Vcon.to_msgpack, Vcon.from_msgpack),
+        "container": (Vcon.to_bytes, Vcon.from_bytes),
+    }
+    rounds = 50
+    for path in paths:
+        vcon = Vcon.load(path)
+        print(os.path.basename(path))
+        for name, (encode, decode) in codecs.items():
+            try:
+                data = encode(vcon)
+            except ImportError as e:
+                print(f"  {name:<10} skipped: {e}")
+                continue
+            encode_ms = bench(lambda: encode(vcon), rounds)
+            decode_ms = bench(lambda: decode(data), rounds)
+            print(
+                f"  {name:<10} {len(data):>9} bytes"
+                f"  encode {encode_ms:8.3f} ms  decode {decode_ms:8.3f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Size and load time of the binary container versus JSON.
+
+Usage: python benchmarks/bench_container.py
+"""
+
+import base64
+import os
+import time
+
+from vcon import Vcon
+
+
+def make_vcon(megabytes: int) -> Vcon:
+    vcon = Vcon.build_new()
+    for i in range(4):
+        audio = os.urandom(megabytes * 1024 * 1024 // 4)
+        vcon.vcon_dict["dialog"].append(
+            {
+                "type": "recording",
+                "start": "2024-10-20T15:02:54.888840",
+                "parties": [0, 1],
+                "mimetype": "audio/x-wav",
+                "body": base64.urlsafe_b64encode(audio).decode(),
+                "encoding": "base64url",
+            }
+        )
+    return vcon
+
+
+def bench(fn, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds * 1e3
+
+
+def main():
+    for megabytes, rounds in ((1, 50), (40, 3)):
+        vcon = make_vcon(megabytes)
+        text = vcon.to_json(as_bytes=True)
+        data = vcon.to_bytes()
+        print(f"{megabytes} MB of audio")
+        print(f"  size       json {len(text):>12}  container {len(data):>12}")
+        results = {
+            "to_json": bench(lambda: vcon.to_json(as_bytes=True), rounds),
+            "to_bytes": bench(vcon.to_bytes, rounds),
+            "build_from_json": bench(lambda: Vcon.build_from_json(text), rounds),
+            "from_bytes": bench(lambda: Vcon.from_bytes(data), rounds),
+            "from_bytes lazy": bench(lambda: Vcon.from_bytes(data, lazy=True), rounds),
+        }
+        for label, msec in results.items():
+            print(f"  {label:<16} {msec:10.2f} ms/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Peak memory of inlining an external recording, buffered versus streamed.
+
+Serves a recording from a local HTTP server and compares reading the whole
+response before encoding it with Dialog.to_inline_data, which hashes and
+encodes the response chunk by chunk.
+
+Usage: python benchmarks/bench_fetch.py [megabytes]
+"""
+
+import base64
+import hashlib
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from vcon.dialog import Dialog
+
+
+def serve(data: bytes) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "audio/x-wav")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def buffered(url: str) -> tuple:
+    raw = requests.get(url).content
+    body = base64.urlsafe_b64encode(raw).decode()
+    signature = base64.urlsafe_b64encode(hashlib.sha256(raw).digest()).decode()
+    return body, signature
+
+
+def streamed(url: str) -> tuple:
+    dialog = Dialog(type="recording", start="2024-10-20", parties=[0], url=url)
+    dialog.to_inline_data()
+    return dialog.body, dialog.signature
+
+
+def measure(fn, url: str):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn(url)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    data = os.urandom(megabytes * 1024 * 1024)
+    server = serve(data)
+    url = f"http://127.0.0.1:{server.server_port}/recording.wav"
+    print(f"{megabytes} MB recording")
+    results = []
+    for label, fn in (("buffered", buffered), ("streamed", streamed)):
+        result, elapsed, peak = measure(fn, url)
+        results.append(result)
+        print(
+            f"  {label:<10} {elapsed:8.2f} s  peak {peak / 2**20:8.1f} MB"
+            f"  ({peak / len(data):.2f}x)"
+        )
+    assert results[0] == results[1]
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Ingest throughput for audio-heavy vCons.
+
+Compares ``Vcon.build_from_json`` (which adopts the parsed dictionary) with
+the copying constructor path it used to take.
+
+Usage: python benchmarks/bench_ingest.py [dialogs] [body_kib] [rounds]
+"""
+
+import base64
+import json
+import os
+import sys
+import time
+
+from vcon import Vcon
+
+
+def make_vcon_json(dialogs: int, body_kib: int) -> str:
+    vcon = Vcon.build_new()
+    body = base64.urlsafe_b64encode(os.urandom(body_kib * 768)).decode()
+    for i in range(dialogs):
+        vcon.vcon_dict["dialog"].append(
+            {
+                "type": "recording",
+                "start": "2024-10-20T15:02:54.888840",
+                "parties": [0, 1],
+                "mimetype": "audio/x-wav",
+                "filename": f"recording-{i}.wav",
+                "body": body,
+                "encoding": "base64url",
+            }
+        )
+    return vcon.to_json()
+
+
+def bench(label, fn, json_string, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn(json_string)
+    elapsed = time.perf_counter() - start
+    mb = len(json_string) * rounds / 1e6
+    print(f"{label:<28} {rounds / elapsed:8.1f} vCons/s {mb / elapsed:8.1f} MB/s")
+
+
+def main():
+    dialogs = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    body_kib = int(sys.argv[2]) if len(sys.argv) > 2 else 2048
+    rounds = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+
+    json_string = make_vcon_json(dialogs, body_kib)
+    print(f"{dialogs} dialogs, {len(json_string) / 1e6:.1f} MB per vCon")
+    bench("copying constructor", lambda s: Vcon(json.loads(s)), json_string, rounds)
+    bench("build_from_json (adopt)", Vcon.build_from_json, json_string, rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Party lookups: the old pydash.get scan versus compiled paths and indexes.
+
+Usage: python benchmarks/bench_lookups.py [parties]
+"""
+
+import sys
+import time
+
+from vcon import Vcon
+from vcon.paths import compile_path
+
+try:
+    from pydash import get as pydash_get
+except ImportError:
+    pydash_get = None
+
+
+def make_vcon(parties: int) -> Vcon:
+    vcon = Vcon.build_new()
+    vcon.vcon_dict["parties"] = [
+        {
+            "tel": f"+1555{i:07d}",
+            "mailto": f"user{i}@example.com",
+            "civicaddress": {"country": "US" if i % 2 else "CA"},
+        }
+        for i in range(parties)
+    ]
+    return vcon
+
+
+def scan(parties: list, get, by: str, val) -> int:
+    return next((i for i, party in enumerate(parties) if get(party, by) == val), None)
+
+
+def bench(fn, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds * 1e6
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    vcon = make_vcon(count)
+    parties = vcon.vcon_dict["parties"]
+    target = f"+1555{count - 1:07d}"
+    rounds = max(10, 200000 // count)
+
+    def compiled_get(party, path):
+        return compile_path(path)(party)
+
+    results = {}
+    if pydash_get is not None:
+        results["pydash.get scan"] = bench(
+            lambda: scan(parties, pydash_get, "tel", target), rounds
+        )
+        results["pydash.get nested"] = bench(
+            lambda: scan(parties, pydash_get, "civicaddress.country", "XX"), rounds
+        )
+    results["compiled path scan"] = bench(
+        lambda: scan(parties, compiled_get, "tel", target), rounds
+    )
+    results["compiled path nested"] = bench(
+        lambda: scan(parties, compiled_get, "civicaddress.country", "XX"), rounds
+    )
+    results["find_party_index"] = bench(
+        lambda: vcon.find_party_index("tel", target), rounds
+    )
+    vcon.build_index("tel")
+    results["find_party_index indexed"] = bench(
+        lambda: vcon.find_party_index("tel", target), rounds * 100
+    )
+
+    print(f"{count} parties, last party looked up")
+    for label, usec in results.items():
+        print(f"  {label:<26} {usec:10.2f} us/lookup")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Memory per object and construction cost of the slotted models.
+
+The ``Legacy*`` classes reproduce the previous dict-based implementations,
+which populated ``__dict__`` from ``locals()``, for comparison. Construction
+is timed over N objects; memory is measured with tracemalloc over a sample
+of up to 100,000 objects.
+
+Usage: python benchmarks/bench_models.py [N]   (default 1,000,000)
+"""
+
+import sys
+import time
+import tracemalloc
+
+from vcon.civic_address import CivicAddress
+from vcon.dialog import Dialog
+from vcon.party import PartyHistory
+from vcon.timestamps import normalize_timestamp
+
+DIALOG_FIELDS = Dialog.FIELDS
+
+
+class LegacyDialog:
+    def __init__(self, type, start, parties, **kwargs):
+        start = normalize_timestamp(start)
+        for key, value in locals().items():
+            if value is not None and key not in ("self", "kwargs"):
+                setattr(self, key, value)
+        for key, value in kwargs.items():
+            if value is not None:
+                setattr(self, key, value)
+
+
+class LegacyPartyHistory:
+    def __init__(self, party, event, time):
+        self.party = party
+        self.event = event
+        self.time = time
+
+
+class LegacyCivicAddress:
+    def __init__(self, **kwargs):
+        for key in CivicAddress.FIELDS:
+            setattr(self, key, kwargs.get(key))
+
+
+def make_dialogs(count: int) -> list:
+    return [
+        {
+            "type": "recording",
+            "start": "2024-10-20T15:02:54.888840+00:00",
+            "parties": [0, 1],
+            "originator": i % 2,
+            "mimetype": "audio/x-wav",
+            "filename": f"call-{i}.wav",
+            "url": f"https://media.example.com/call-{i}.wav",
+            "duration": 52.68,
+        }
+        for i in range(count)
+    ]
+
+
+def construct(factory, data: list) -> float:
+    start = time.perf_counter()
+    for item in data:
+        factory(item)
+    return time.perf_counter() - start
+
+
+def memory(factory, data: list) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(item) for item in data]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / len(data)
+
+
+def report(title: str, count: int, data: list, factories: dict) -> None:
+    sample = data[:100000]
+    print(f"{title}, {count:,} objects")
+    for label, factory in factories.items():
+        seconds = construct(factory, data)
+        print(
+            f"  {label:<34} {seconds:8.2f} s {seconds / count * 1e6:8.2f} us/obj "
+            f"{memory(factory, sample):8.1f} bytes/obj"
+        )
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+    dialogs = make_dialogs(count)
+    report(
+        "Dialog",
+        count,
+        dialogs,
+        {
+            "legacy Dialog(**d)": lambda d: LegacyDialog(**d),
+            "Dialog(**d)": lambda d: Dialog(**d),
+            "Dialog.from_dict(d, trusted=True)": lambda d: Dialog.from_dict(
+                d, trusted=True
+            ),
+        },
+    )
+    del dialogs
+
+    history = [{"party": i % 4, "event": "join", "time": "t"} for i in range(count)]
+    report(
+        "PartyHistory",
+        count,
+        history,
+        {
+            "legacy PartyHistory(**d)": lambda d: LegacyPartyHistory(**d),
+            "PartyHistory(**d)": lambda d: PartyHistory(**d),
+            "PartyHistory.from_dict(d)": PartyHistory.from_dict,
+        },
+    )
+    del history
+
+    addresses = [
+        {"country": "US", "a1": "RI", "a3": "Newport", "pc": f"{i % 100000:05d}"}
+        for i in range(count)
+    ]
+    report(
+        "CivicAddress",
+        count,
+        addresses,
+        {
+            "legacy CivicAddress(**d)": lambda d: LegacyCivicAddress(**d),
+            "CivicAddress(**d)": lambda d: CivicAddress(**d),
+            "CivicAddress.from_dict(d)": CivicAddress.from_dict,
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
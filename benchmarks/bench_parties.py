@@ -0,0 +1,106 @@
+"""Party construction cost, memory and Vcon.parties access.
+
+``LegacyParty`` reproduces the previous dict-based, locals()-walking Party
+for comparison.
+
+Usage: python benchmarks/bench_parties.py [parties]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from vcon import Vcon
+from vcon.party import Party
+
+
+class LegacyParty:
+    def __init__(
+        self,
+        tel=None,
+        stir=None,
+        mailto=None,
+        name=None,
+        validation=None,
+        gmlpos=None,
+        civicaddress=None,
+        uuid=None,
+        role=None,
+        contact_list=None,
+        meta=None,
+        **kwargs,
+    ):
+        for key, value in locals().items():
+            if value is not None and key not in ("self", "kwargs"):
+                setattr(self, key, value)
+        for key, value in kwargs.items():
+            if value is not None:
+                setattr(self, key, value)
+
+
+def make_dicts(count: int) -> list:
+    return [
+        {"tel": f"+1555{i:07d}", "name": f"Party {i}", "role": "agent"}
+        for i in range(count)
+    ]
+
+
+def make_full_dicts(count: int) -> list:
+    return [{key: f"{key} {i}" for key in Party.FIELDS} for i in range(count)]
+
+
+def construct(factory, dicts: list) -> float:
+    start = time.perf_counter()
+    for d in dicts:
+        factory(d)
+    return (time.perf_counter() - start) / len(dicts) * 1e6
+
+
+def memory(factory, dicts: list) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(d) for d in dicts]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / len(dicts)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    factories = {
+        "legacy Party(**d)": lambda d: LegacyParty(**d),
+        "Party(**d)": lambda d: Party(**d),
+        "Party.from_dict(d)": Party.from_dict,
+    }
+    for kind, dicts in (
+        ("3 fields", make_dicts(count)),
+        ("all fields", make_full_dicts(count)),
+    ):
+        print(f"{count} parties, {kind}")
+        for label, factory in factories.items():
+            print(
+                f"  {label:<20} {construct(factory, dicts):8.2f} us/party "
+                f"{memory(factory, dicts):8.1f} bytes/party"
+            )
+
+    vcon = Vcon.build_new()
+    vcon.vcon_dict["parties"] = make_dicts(min(count, 1000))
+    n = len(vcon.vcon_dict["parties"])
+
+    start = time.perf_counter()
+    for i in range(n):
+        [LegacyParty(**p) for p in vcon.vcon_dict["parties"]][i]
+    legacy = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(n):
+        vcon.parties[i]
+    cached = time.perf_counter() - start
+    print(f"for i in range({n}): v.parties[i]")
+    print(f"  rebuilt every access {legacy * 1e3:10.2f} ms")
+    print(f"  cached               {cached * 1e3:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Timestamp parsing: dateutil versus the RFC 3339 fast path.
+
+Also reports the cost of constructing a Dialog, which normalizes its start
+time, with unique and with repeated timestamps.
+
+Usage: python benchmarks/bench_timestamps.py
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+from dateutil import parser
+
+from vcon.dialog import Dialog
+from vcon.timestamps import _parse_rfc3339, clear_cache, normalize_timestamp
+
+
+def make_timestamps(count: int) -> list:
+    base = datetime(2024, 10, 20, 15, 2, 54, 888840, tzinfo=timezone.utc)
+    return [(base + timedelta(seconds=i)).isoformat() for i in range(count)]
+
+
+def bench(fn, values: list) -> float:
+    start = time.perf_counter()
+    for value in values:
+        fn(value)
+    return (time.perf_counter() - start) / len(values) * 1e6
+
+
+def main():
+    unique = make_timestamps(100000)
+    repeated = unique[:100] * 1000
+
+    def make_dialog(start):
+        return Dialog(type="text", start=start, parties=[0, 1], body="hi")
+
+    results = {
+        "dateutil parse": bench(lambda s: parser.parse(s).isoformat(), unique),
+        "fast path, uncached": bench(lambda s: _parse_rfc3339(s).isoformat(), unique),
+    }
+    clear_cache()
+    results["normalize, unique"] = bench(normalize_timestamp, unique)
+    results["normalize, repeated"] = bench(normalize_timestamp, repeated)
+    clear_cache()
+    results["Dialog(), unique"] = bench(make_dialog, unique)
+    results["Dialog(), repeated"] = bench(make_dialog, repeated)
+
+    for label, usec in results.items():
+        print(f"{label:<22} {usec:8.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
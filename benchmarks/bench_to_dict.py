@@ -0,0 +1,57 @@
+"""Vcon.to_dict copy modes versus the old serialize-then-parse path.
+
+Usage: python benchmarks/bench_to_dict.py
+"""
+
+import json
+import time
+
+from vcon import Vcon
+
+
+def make_vcon(dialogs: int) -> Vcon:
+    vcon = Vcon.build_new()
+    vcon.vcon_dict["parties"] = [
+        {"tel": "+15551230000", "name": "Agent", "meta": {"role": "agent"}},
+        {"tel": "+15551230001", "name": "Customer", "meta": {"role": "customer"}},
+    ]
+    for i in range(dialogs):
+        vcon.vcon_dict["dialog"].append(
+            {
+                "type": "text",
+                "start": "2024-10-20T15:02:54.888840",
+                "parties": [0, 1],
+                "originator": i % 2,
+                "mimetype": "text/plain",
+                "body": f"message number {i}",
+                "meta": {"sequence": i},
+            }
+        )
+    return vcon
+
+
+def bench(fn, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds * 1e6
+
+
+def main():
+    for dialogs, rounds in ((1, 20000), (100, 2000), (10000, 20)):
+        vcon = make_vcon(dialogs)
+        results = {
+            "json round-trip": bench(
+                lambda: json.loads(json.dumps(vcon.vcon_dict)), rounds
+            ),
+            "deep": bench(lambda: vcon.to_dict(), rounds),
+            "shallow": bench(lambda: vcon.to_dict(mode="shallow"), rounds),
+            "cow": bench(lambda: vcon.to_dict(mode="cow"), rounds),
+        }
+        print(f"{dialogs} dialogs")
+        for label, usec in results.items():
+            print(f"  {label:<16} {usec:12.1f} us/call")
+
+
+if __name__ == "__main__":
+    main()
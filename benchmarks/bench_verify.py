@@ -0,0 +1,57 @@
+"""Media verification of one vCon: one thread versus a thread pool.
+
+Builds a vCon with signed base64url recordings and times Vcon.verify_media
+with increasing numbers of worker threads.
+
+Usage: python benchmarks/bench_verify.py [dialogs] [megabytes_per_dialog]
+"""
+
+import base64
+import hashlib
+import os
+import sys
+import time
+
+from vcon import Vcon
+
+
+def make_vcon(dialogs: int, megabytes: int) -> Vcon:
+    vcon = Vcon.build_new()
+    for i in range(dialogs):
+        data = os.urandom(megabytes * 1024 * 1024)
+        vcon.vcon_dict["dialog"].append(
+            {
+                "type": "recording",
+                "start": "2024-10-20T15:02:54",
+                "parties": [0],
+                "body": base64.urlsafe_b64encode(data).decode(),
+                "encoding": "base64url",
+                "alg": "sha256",
+                "signature": base64.urlsafe_b64encode(
+                    hashlib.sha256(data).digest()
+                ).decode(),
+            }
+        )
+    return vcon
+
+
+def main():
+    dialogs = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    megabytes = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    vcon = make_vcon(dialogs, megabytes)
+    print(f"{dialogs} dialogs of {megabytes} MB")
+    baseline = None
+    for workers in (0, 2, 4, os.cpu_count() or 1):
+        start = time.perf_counter()
+        report = vcon.verify_media(workers=workers)
+        elapsed = time.perf_counter() - start
+        assert report.ok and len(report.results) == dialogs
+        baseline = baseline or elapsed
+        print(
+            f"  workers={workers:<3} {elapsed:8.3f} s"
+            f"  {dialogs * megabytes / elapsed:8.0f} MB/s  ({baseline / elapsed:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
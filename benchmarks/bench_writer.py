@@ -0,0 +1,63 @@
+"""Peak memory of writing a vCon with large inline media to a file.
+
+Usage: python benchmarks/bench_writer.py [megabytes]
+"""
+
+import base64
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from vcon import Vcon
+
+
+def make_vcon(megabytes: int) -> Vcon:
+    vcon = Vcon.build_new()
+    audio = os.urandom(megabytes * 1024 * 1024 * 3 // 4)
+    vcon.vcon_dict["dialog"].append(
+        {
+            "type": "recording",
+            "start": "2024-10-20T15:02:54.888840",
+            "parties": [0, 1],
+            "mimetype": "audio/x-wav",
+            "body": base64.urlsafe_b64encode(audio).decode(),
+            "encoding": "base64url",
+        }
+    )
+    return vcon
+
+
+def measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    vcon = make_vcon(megabytes)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "out.json")
+
+        def to_json():
+            with open(path, "w") as f:
+                f.write(vcon.to_json(backend="json"))
+
+        def write_to():
+            with open(path, "wb") as f:
+                vcon.write_to(f)
+
+        print(f"{megabytes} MB inline body")
+        for label, fn in (("to_json + write", to_json), ("write_to", write_to)):
+            elapsed, peak = measure(fn)
+            print(f"  {label:<16} {elapsed:8.2f} s  peak {peak / 2**20:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
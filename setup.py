@@ -13,6 +13,9 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/vcon-dev/vcon-lib",
     packages=find_packages(),
+    entry_points={
+        "console_scripts": ["vcon-validate=vcon.cli:validate_main"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
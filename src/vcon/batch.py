@@ -0,0 +1,430 @@
+"""
+Parallel loading of many vCons.
+
+:func:`load_many` parses and validates vCon files, directories of files and
+JSONL/NDJSON streams in a process pool, applying the same ``Vcon.is_valid``
+rules as the single-document path. :func:`verify_many` checks the dialog
+media of such a corpus against the signatures in a thread pool.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+import requests
+
+from . import fetch
+from .cache import MediaCache
+from .json_backend import get_backend
+from .vcon import Vcon
+from .verify import MediaReport, verify_media
+
+JSONL_SUFFIXES = (".jsonl", ".ndjson")
+JSON_SUFFIXES = (".json",)
+
+# A unit of work: (label, path, json_text). Exactly one of path and
+# json_text is set; label names the document in results.
+Task = Tuple[str, Optional[str], Optional[Union[str, bytes]]]
+
+Source = Union[str, os.PathLike, Iterable[Any]]
+
+
+def iter_tasks(sources: Source) -> Iterator[Task]:
+    """
+    Expand sources into individual documents.
+
+    ``sources`` may be a file path, a ``*.jsonl``/``*.ndjson`` file (one
+    vCon per line), a directory (every JSON and JSONL file below it, in
+    sorted order), an open JSONL stream, or an iterable of any of these.
+
+    :param sources: the documents to load
+    :type sources: str, os.PathLike, file object or iterable
+    :return: the tasks, in order
+    :rtype: Iterator[Task]
+    """
+    if isinstance(sources, (str, os.PathLike)):
+        path = os.fspath(sources)
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.endswith(JSON_SUFFIXES + JSONL_SUFFIXES):
+                        yield from iter_tasks(os.path.join(root, name))
+        elif path.endswith(JSONL_SUFFIXES):
+            with open(path, "rb") as f:
+                yield from _iter_lines(path, f)
+        else:
+            yield path, path, None
+    elif hasattr(sources, "read"):
+        yield from _iter_lines(getattr(sources, "name", "<stream>"), sources)
+    else:
+        for source in sources:
+            yield from iter_tasks(source)
+
+
+def _iter_lines(name: str, stream) -> Iterator[Task]:
+    for lineno, line in enumerate(stream, 1):
+        if line.strip():
+            yield f"{name}:{lineno}", None, line
+
+
+def load_task(
+    task: Task, backend: Optional[str] = None
+) -> Tuple[str, Optional[Vcon], List[str], int]:
+    """
+    Read, parse and validate one document.
+
+    :param task: the document to load
+    :type task: Task
+    :param backend: the name of the JSON backend to parse with
+    :type backend: str or None
+    :return: the label, the vCon (None unless valid), the errors and the
+        size of the document in bytes
+    :rtype: tuple[str, Optional[Vcon], list[str], int]
+    """
+    label, path, data = task
+    if data is None:
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return label, None, ["File not found"], 0
+        except Exception as e:
+            return label, None, [f"Error reading file: {str(e)}"], 0
+
+    vcon, errors = Vcon._build_validated(data, backend)
+    return label, vcon if not errors else None, errors, len(data)
+
+
+def validate_task(
+    task: Task, backend: Optional[str] = None, stream: bool = False
+) -> Tuple[str, List[str], int]:
+    """
+    Validate one document without keeping the parsed vCon.
+
+    :param task: the document to validate
+    :type task: Task
+    :param backend: the name of the JSON backend to parse with
+    :type backend: str or None
+    :param stream: validate files incrementally, see ``Vcon.validate_file``
+    :type stream: bool
+    :return: the label, the errors and the size of the document in bytes
+    :rtype: tuple[str, list[str], int]
+    """
+    label, path, data = task
+    if stream and data is None:
+        errors = Vcon.validate_file(path, backend, stream=True)[1]
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            size = 0
+        return label, errors, size
+    label, _, errors, size = load_task(task, backend)
+    return label, errors, size
+
+
+def verify_task(
+    task: Task, backend: Optional[str] = None, **options: Any
+) -> MediaReport:
+    """
+    Check the dialog media of one document, see :func:`vcon.verify.verify_media`.
+
+    The document is parsed but not validated, so the media of vCons that
+    break other rules is still checked.
+
+    :param task: the document to check
+    :type task: Task
+    :param backend: the name of the JSON backend to parse with
+    :type backend: str or None
+    :param options: passed on to :func:`vcon.verify.verify_media`
+    :return: the report, labelled with the task label
+    :rtype: vcon.verify.MediaReport
+    """
+    label, path, data = task
+    try:
+        if data is None:
+            with open(path, "rb") as f:
+                data = f.read()
+        document = get_backend(backend).loads(data)
+    except OSError as e:
+        return MediaReport(label, [], f"Error reading file: {str(e)}")
+    except ValueError:
+        return MediaReport(label, [], "Invalid JSON format")
+    if not isinstance(document, dict):
+        return MediaReport(label, [], "Not a vCon object")
+    return verify_media(document, workers=0, label=label, **options)
+
+
+def _load_chunk(chunk: List[Task], backend: Optional[str]) -> list:
+    return [load_task(task, backend) for task in chunk]
+
+
+def _validate_chunk(chunk: List[Task], backend: Optional[str], stream: bool) -> list:
+    return [validate_task(task, backend, stream) for task in chunk]
+
+
+def _verify_chunk(chunk: List[Task], backend: Optional[str], **options) -> list:
+    return [verify_task(task, backend, **options) for task in chunk]
+
+
+def run_tasks(
+    tasks: Iterable[Task],
+    worker: Callable[[List[Task], Optional[str]], list],
+    workers: Optional[int] = None,
+    ordered: bool = True,
+    max_in_flight: Optional[int] = None,
+    chunksize: int = 1,
+    backend: Optional[str] = None,
+    pool: Callable[..., Executor] = ProcessPoolExecutor,
+) -> Iterator[Any]:
+    """
+    Run ``worker`` over chunks of ``tasks`` in a process (or thread) pool.
+
+    At most ``max_in_flight`` chunks are submitted at a time, so memory stays
+    bounded however many tasks there are.
+
+    :param tasks: the tasks to run
+    :type tasks: Iterable[Task]
+    :param worker: a function taking a chunk of tasks and the backend name
+        and returning one result per task; picklable and module-level for a
+        process pool
+    :type worker: Callable
+    :param workers: number of processes; None uses every CPU and 0 runs
+        everything in the current process
+    :type workers: int or None
+    :param ordered: yield results in input order instead of as completed
+    :type ordered: bool
+    :param max_in_flight: chunks submitted but not yet yielded, defaults to
+        four per worker
+    :type max_in_flight: int or None
+    :param chunksize: tasks sent to a worker at once
+    :type chunksize: int
+    :param backend: the name of the JSON backend the worker should use
+    :type backend: str or None
+    :param pool: the executor class, e.g. ``ThreadPoolExecutor`` for work
+        that waits on I/O or releases the GIL
+    :type pool: Callable
+    :return: the worker results
+    :rtype: Iterator[Any]
+    """
+    chunks = _chunked(tasks, chunksize)
+    if workers == 0:
+        for chunk in chunks:
+            yield from worker(chunk, backend)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 4
+    with pool(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(worker, chunk, backend))
+            if len(pending) >= max_in_flight:
+                yield from _drain(pending, ordered)
+        while pending:
+            yield from _drain(pending, ordered)
+
+
+def _drain(pending: deque, ordered: bool) -> Iterator[Any]:
+    if ordered:
+        yield from pending.popleft().result()
+        return
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        pending.remove(future)
+        yield from future.result()
+
+
+def _chunked(tasks: Iterable[Task], size: int) -> Iterator[List[Task]]:
+    chunk = []
+    for task in tasks:
+        chunk.append(task)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def load_many(
+    sources: Source,
+    workers: Optional[int] = None,
+    ordered: bool = True,
+    max_in_flight: Optional[int] = None,
+    chunksize: int = 1,
+    backend: Optional[str] = None,
+) -> Iterator[Union[Vcon, Tuple[str, List[str]]]]:
+    """
+    Load and validate many vCons in parallel.
+
+    Each document is parsed and checked with ``Vcon.is_valid`` in a worker
+    process. Valid documents are yielded as :class:`Vcon` objects; invalid or
+    unreadable ones as ``(label, errors)`` tuples, where ``label`` is the file
+    path (``path:line`` for JSONL input) and ``errors`` is what
+    ``Vcon.validate_file``/``Vcon.validate_json`` would report.
+
+    :param sources: files, directories, JSONL files or streams, see
+        :func:`iter_tasks`
+    :type sources: str, os.PathLike, file object or iterable
+    :param workers: number of processes; None uses every CPU and 0 runs
+        everything in the current process
+    :type workers: int or None
+    :param ordered: yield results in input order instead of as completed
+    :type ordered: bool
+    :param max_in_flight: chunks submitted but not yet yielded, defaults to
+        four per worker
+    :type max_in_flight: int or None
+    :param chunksize: documents sent to a worker at once; raise it for many
+        small documents
+    :type chunksize: int
+    :param backend: the name of the JSON backend to parse with
+    :type backend: str or None
+    :return: the loaded vCons and the errors
+    :rtype: Iterator[Union[Vcon, tuple[str, list[str]]]]
+    """
+    results = run_tasks(
+        iter_tasks(sources),
+        _load_chunk,
+        workers=workers,
+        ordered=ordered,
+        max_in_flight=max_in_flight,
+        chunksize=chunksize,
+        backend=backend,
+    )
+    for label, vcon, errors, _ in results:
+        if vcon is not None:
+            yield vcon
+        else:
+            yield label, errors
+
+
+def validate_many(
+    sources: Source,
+    workers: Optional[int] = None,
+    ordered: bool = True,
+    max_in_flight: Optional[int] = None,
+    chunksize: int = 1,
+    backend: Optional[str] = None,
+    stream: bool = False,
+) -> Iterator[Tuple[str, List[str], int]]:
+    """
+    Validate many vCons in parallel.
+
+    Like :func:`load_many`, but only the errors travel back from the worker
+    processes, which makes it cheaper when the vCons themselves are not
+    needed.
+
+    :param sources: files, directories, JSONL files or streams, see
+        :func:`iter_tasks`
+    :type sources: str, os.PathLike, file object or iterable
+    :param workers: number of processes; None uses every CPU and 0 runs
+        everything in the current process
+    :type workers: int or None
+    :param ordered: yield results in input order instead of as completed
+    :type ordered: bool
+    :param max_in_flight: chunks submitted but not yet yielded, defaults to
+        four per worker
+    :type max_in_flight: int or None
+    :param chunksize: documents sent to a worker at once
+    :type chunksize: int
+    :param backend: the name of the JSON backend to parse with
+    :type backend: str or None
+    :param stream: validate files incrementally, see ``Vcon.validate_file``
+    :type stream: bool
+    :return: ``(label, errors, size_in_bytes)`` for every document
+    :rtype: Iterator[tuple[str, list[str], int]]
+    """
+    return run_tasks(
+        iter_tasks(sources),
+        partial(_validate_chunk, stream=stream),
+        workers=workers,
+        ordered=ordered,
+        max_in_flight=max_in_flight,
+        chunksize=chunksize,
+        backend=backend,
+    )
+
+
+def verify_many(
+    sources: Source,
+    workers: Optional[int] = None,
+    ordered: bool = True,
+    max_in_flight: Optional[int] = None,
+    chunksize: int = 1,
+    backend: Optional[str] = None,
+    session: Optional[requests.Session] = None,
+    timeout: Optional[float] = fetch.DEFAULT_TIMEOUT,
+    retries: int = 0,
+    backoff: float = fetch.DEFAULT_BACKOFF,
+    cache: Optional[MediaCache] = None,
+) -> Iterator[MediaReport]:
+    """
+    Check the dialog media of many vCons against their signatures.
+
+    Documents are read, decoded and hashed in a thread pool: ``hashlib``
+    releases the GIL on large buffers and external media waits on the
+    network, so threads scale without pickling every document to another
+    process. The dialogs of one document are checked by the same thread.
+
+    :param sources: files, directories, JSONL files or streams, see
+        :func:`iter_tasks`
+    :type sources: str, os.PathLike, file object or iterable
+    :param workers: number of threads; None uses every CPU and 0 runs
+        everything in the current thread
+    :type workers: int or None
+    :param ordered: yield reports in input order instead of as completed
+    :type ordered: bool
+    :param max_in_flight: chunks submitted but not yet yielded, defaults to
+        four per worker
+    :type max_in_flight: int or None
+    :param chunksize: documents sent to a worker at once
+    :type chunksize: int
+    :param backend: the name of the JSON backend to parse with
+    :type backend: str or None
+    :param session: the session to fetch external media with; by default a
+        pooled session is shared by the workers and closed afterwards
+    :type session: requests.Session or None
+    :param timeout: the connect and read timeout in seconds
+    :type timeout: float or None
+    :param retries: how many times to retry transient fetch failures
+    :type retries: int
+    :param backoff: the delay before the first retry, in seconds
+    :type backoff: float
+    :param cache: the media cache to revalidate against and fill
+    :type cache: vcon.cache.MediaCache or None
+    :return: one report per document, labelled like :func:`load_many` errors
+    :rtype: Iterator[vcon.verify.MediaReport]
+    """
+    own_session = session is None
+    if own_session:
+        session = fetch.new_session(workers or os.cpu_count() or 1)
+    worker = partial(
+        _verify_chunk,
+        session=session,
+        timeout=timeout,
+        retries=retries,
+        backoff=backoff,
+        cache=cache,
+    )
+    try:
+        yield from run_tasks(
+            iter_tasks(sources),
+            worker,
+            workers=workers,
+            ordered=ordered,
+            max_in_flight=max_in_flight,
+            chunksize=chunksize,
+            backend=backend,
+            pool=ThreadPoolExecutor,
+        )
+    finally:
+        if own_session:
+            session.close()
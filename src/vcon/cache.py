@@ -0,0 +1,273 @@
+"""
+Content-addressed on-disk cache for fetched dialog media.
+
+Media is stored once per SHA-256 digest under ``objects/``, however many
+URLs point to it. For each URL the cache remembers the digest, size,
+content type and the ``ETag``/``Last-Modified`` validators of the response,
+so a later fetch can send a conditional GET and, on ``304 Not Modified``,
+read the media from disk instead of downloading it again. Only responses
+carrying a validator are cached.
+
+The cache is bounded by size: when it grows past ``max_bytes`` the least
+recently used objects are removed. Files are written atomically, so a cache
+directory can be shared by threads and processes.
+
+Pass a :class:`MediaCache` as ``cache`` to :meth:`Dialog.to_inline_data`,
+:meth:`Dialog.add_external_data`, :meth:`Dialog.is_external_data_changed` or
+:meth:`Vcon.inline_all_external`.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import IO, Any, Dict, Optional
+
+DEFAULT_MAX_BYTES = 1 << 30
+
+
+class MediaCache:
+    """
+    A size-bounded, content-addressed cache of media fetched by URL.
+
+    :param directory: where to keep the cache; created if missing
+    :type directory: str or os.PathLike
+    :param max_bytes: the total size of cached media to keep
+    :type max_bytes: int
+    """
+
+    def __init__(self, directory, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+        self._objects = os.path.join(self.directory, "objects")
+        self._urls = os.path.join(self.directory, "urls")
+        self._tmp = os.path.join(self.directory, "tmp")
+        for path in (self._objects, self._urls, self._tmp):
+            os.makedirs(path, exist_ok=True)
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self._objects, digest[:2], digest)
+
+    def _url_path(self, url: str) -> str:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self._urls, f"{key}.json")
+
+    def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the cache entry for ``url``, if its media is still cached.
+
+        :param url: the URL
+        :type url: str
+        :return: the entry, with the keys ``url``, ``sha256``, ``size``,
+            ``content_type``, ``etag`` and ``last_modified``
+        :rtype: dict or None
+        """
+        try:
+            with open(self._url_path(url), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get("url") != url or not os.path.exists(
+            self._object_path(entry["sha256"])
+        ):
+            return None
+        return entry
+
+    @staticmethod
+    def conditional_headers(entry: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Returns the request headers revalidating a cache entry.
+
+        :param entry: the cache entry
+        :type entry: dict
+        :return: ``If-None-Match`` and/or ``If-Modified-Since`` headers
+        :rtype: dict
+        """
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    @staticmethod
+    def headers(entry: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Returns the response headers recorded for a cache entry.
+
+        :param entry: the cache entry
+        :type entry: dict
+        :return: the headers
+        :rtype: dict
+        """
+        headers = {"Content-Length": str(entry["size"])}
+        for name, key in (
+            ("Content-Type", "content_type"),
+            ("ETag", "etag"),
+            ("Last-Modified", "last_modified"),
+        ):
+            if entry.get(key) is not None:
+                headers[name] = entry[key]
+        return headers
+
+    @staticmethod
+    def is_cacheable(headers) -> bool:
+        """
+        Checks whether a response can be revalidated later.
+
+        :param headers: the response headers
+        :type headers: Mapping
+        :return: True if the response has an ``ETag`` or ``Last-Modified``
+        :rtype: bool
+        """
+        return bool(headers.get("ETag") or headers.get("Last-Modified"))
+
+    def open(self, entry: Dict[str, Any]) -> IO[bytes]:
+        """
+        Opens the cached media of an entry and marks it as recently used.
+
+        :param entry: the cache entry
+        :type entry: dict
+        :return: the media file, opened for binary reading
+        :rtype: file object
+        :raises OSError: if the media was evicted in the meantime
+        """
+        path = self._object_path(entry["sha256"])
+        f = open(path, "rb")
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return f
+
+    def new_file(self) -> IO[bytes]:
+        """
+        Creates a temporary file to download media into, see :meth:`store`.
+
+        :return: the file, opened for binary writing
+        :rtype: file object
+        """
+        return tempfile.NamedTemporaryFile(dir=self._tmp, delete=False)
+
+    def discard_file(self, f: IO[bytes]) -> None:
+        """
+        Closes and removes a file from :meth:`new_file` that is not stored.
+
+        :param f: the file
+        :type f: file object
+        """
+        f.close()
+        try:
+            os.unlink(f.name)
+        except OSError:
+            pass
+
+    def store(
+        self, url: str, headers, f: IO[bytes], digest: str, size: int
+    ) -> Dict[str, Any]:
+        """
+        Adds downloaded media to the cache.
+
+        :param url: the URL the media was fetched from
+        :type url: str
+        :param headers: the response headers
+        :type headers: Mapping
+        :param f: the file from :meth:`new_file` holding the media
+        :type f: file object
+        :param digest: the hex SHA-256 digest of the media
+        :type digest: str
+        :param size: the size of the media in bytes
+        :type size: int
+        :return: the new cache entry
+        :rtype: dict
+        """
+        f.close()
+        path = self._object_path(digest)
+        added = 0
+        if os.path.exists(path):
+            os.unlink(f.name)
+            os.utime(path)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(f.name, path)
+            added = size
+        entry = {
+            "url": url,
+            "sha256": digest,
+            "size": size,
+            "content_type": headers.get("Content-Type"),
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+        }
+        self._write_entry(url, entry)
+        with self._lock:
+            if self._size is not None:
+                self._size += added
+        self.evict()
+        return entry
+
+    def _write_entry(self, url: str, entry: Dict[str, Any]) -> None:
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self._tmp, delete=False, encoding="utf-8"
+        ) as f:
+            json.dump(entry, f)
+        os.replace(f.name, self._url_path(url))
+
+    def discard(self, url: str) -> None:
+        """
+        Forgets ``url``; its media stays cached for other URLs.
+
+        :param url: the URL
+        :type url: str
+        """
+        try:
+            os.unlink(self._url_path(url))
+        except OSError:
+            pass
+
+    def _scan(self):
+        for prefix in os.scandir(self._objects):
+            if prefix.is_dir():
+                for item in os.scandir(prefix.path):
+                    try:
+                        stat = item.stat()
+                    except OSError:
+                        continue
+                    yield item.path, stat
+
+    @property
+    def size(self) -> int:
+        """
+        The total size of the cached media, in bytes.
+        """
+        with self._lock:
+            if self._size is None:
+                self._size = sum(stat.st_size for _, stat in self._scan())
+            return self._size
+
+    def evict(self) -> int:
+        """
+        Removes least recently used media until the cache fits ``max_bytes``.
+
+        :return: the number of bytes removed
+        :rtype: int
+        """
+        if self.size <= self.max_bytes:
+            return 0
+        with self._lock:
+            files = sorted(self._scan(), key=lambda item: item[1].st_mtime)
+            total = sum(stat.st_size for _, stat in files)
+            removed = 0
+            for path, stat in files:
+                if total - removed <= self.max_bytes:
+                    break
+                try:
+                    os.unlink(path)
+                except OSError:
+                    continue
+                removed += stat.st_size
+            self._size = total - removed
+            return removed
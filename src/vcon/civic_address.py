@@ -1,25 +1,60 @@
 from typing import Optional
-from typing import Optional
+
 
 class CivicAddress:
-    def __init__(self,
-                 country: Optional[str] = None,
-                 a1: Optional[str] = None,
-                 a2: Optional[str] = None,
-                 a3: Optional[str] = None,
-                 a4: Optional[str] = None,
-                 a5: Optional[str] = None,
-                 a6: Optional[str] = None,
-                 prd: Optional[str] = None,
-                 pod: Optional[str] = None,
-                 sts: Optional[str] = None,
-                 hno: Optional[str] = None,
-                 hns: Optional[str] = None,
-                 lmk: Optional[str] = None,
-                 loc: Optional[str] = None,
-                 flr: Optional[str] = None,
-                 nam: Optional[str] = None,
-                 pc: Optional[str] = None):
+    """
+    A civic address (RFC 5139).
+
+    Every standard field is stored in a slot and always set, possibly to
+    None. Unknown extension keys from :meth:`from_dict` go to the instance
+    ``__dict__``.
+    """
+
+    FIELDS = (
+        "country",
+        "a1",
+        "a2",
+        "a3",
+        "a4",
+        "a5",
+        "a6",
+        "prd",
+        "pod",
+        "sts",
+        "hno",
+        "hns",
+        "lmk",
+        "loc",
+        "flr",
+        "nam",
+        "pc",
+    )
+
+    __slots__ = FIELDS + ("__dict__",)
+
+    # dir() order, which to_dict has always used
+    _SORTED_FIELDS = tuple(sorted(FIELDS))
+
+    def __init__(
+        self,
+        country: Optional[str] = None,
+        a1: Optional[str] = None,
+        a2: Optional[str] = None,
+        a3: Optional[str] = None,
+        a4: Optional[str] = None,
+        a5: Optional[str] = None,
+        a6: Optional[str] = None,
+        prd: Optional[str] = None,
+        pod: Optional[str] = None,
+        sts: Optional[str] = None,
+        hno: Optional[str] = None,
+        hns: Optional[str] = None,
+        lmk: Optional[str] = None,
+        loc: Optional[str] = None,
+        flr: Optional[str] = None,
+        nam: Optional[str] = None,
+        pc: Optional[str] = None,
+    ):
         """
         Initialize a new CivicAddress object.
 
@@ -76,6 +111,21 @@ class CivicAddress:
         self.nam = nam
         self.pc = pc
 
+    @classmethod
+    def from_dict(cls, address_dict: dict) -> "CivicAddress":
+        """
+        Build a CivicAddress from its dictionary form.
+
+        :param address_dict: the address as stored in a vCon
+        :type address_dict: dict
+        :return: the address
+        :rtype: CivicAddress
+        """
+        address = cls()
+        for key, value in address_dict.items():
+            setattr(address, key, value)
+        return address
+
     def to_dict(self) -> dict[str, Optional[str]]:
         """
         Convert the CivicAddress object to a dictionary.
@@ -86,5 +136,16 @@ class CivicAddress:
         :return: A dictionary of the object's attributes
         :rtype: dict[str, Optional[str]]
         """
-        return {attr: getattr(self, attr) for attr in dir(self) if not attr.startswith("_") and getattr(self, attr) is not None and not callable(getattr(self, attr))}
-
+        extra = self.__dict__
+        if extra:
+            keys = sorted(
+                {*self.FIELDS, *(key for key in extra if not key.startswith("_"))}
+            )
+        else:
+            keys = self._SORTED_FIELDS
+        address_dict = {}
+        for key in keys:
+            value = getattr(self, key)
+            if value is not None and not callable(value):
+                address_dict[key] = value
+        return address_dict
@@ -0,0 +1,136 @@
+"""
+Command line tools.
+
+``vcon-validate`` checks files, directories, globs and JSONL/NDJSON inputs
+with ``Vcon.is_valid`` across all cores::
+
+    vcon-validate archive/ 'incoming/*.json' queue.jsonl --json
+"""
+
+import argparse
+import glob
+import json
+import sys
+import time
+from typing import Iterator, List, Optional
+
+from .batch import validate_many
+from .json_backend import available_backends
+
+
+def _expand(paths: List[str]) -> Iterator:
+    for path in paths:
+        if path == "-":
+            yield sys.stdin.buffer
+        elif glob.has_magic(path):
+            yield from sorted(glob.glob(path, recursive=True))
+        else:
+            yield path
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="vcon-validate",
+        description="Validate vCon files, directories, globs and JSONL/NDJSON "
+        "inputs in parallel.",
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        help="files, directories, glob patterns, *.jsonl/*.ndjson files, "
+        "or - for JSONL on stdin",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="worker processes (default: all cores, 0: no pool)",
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=1,
+        help="documents sent to a worker at once (raise for small documents)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="validate files incrementally without loading media bodies "
+        "(needs ijson)",
+    )
+    parser.add_argument("--backend", choices=available_backends(), default=None)
+    parser.add_argument(
+        "--ordered",
+        action="store_true",
+        help="report in input order instead of as documents complete",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="print a machine-readable JSON report instead of text",
+    )
+    parser.add_argument(
+        "-q", "--quiet", action="store_true", help="only print the summary"
+    )
+    return parser
+
+
+def validate_main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point of ``vcon-validate``.
+
+    :param argv: the command line arguments, defaults to ``sys.argv[1:]``
+    :type argv: list[str] or None
+    :return: 0 if every document is valid, 1 otherwise
+    :rtype: int
+    """
+    args = _parser().parse_args(argv)
+
+    start = time.perf_counter()
+    total = valid = total_bytes = 0
+    invalid = []
+    results = validate_many(
+        _expand(args.paths),
+        workers=args.workers,
+        ordered=args.ordered,
+        chunksize=args.chunksize,
+        backend=args.backend,
+        stream=args.stream,
+    )
+    for label, errors, size in results:
+        total += 1
+        total_bytes += size
+        if not errors:
+            valid += 1
+            continue
+        invalid.append({"path": label, "errors": errors})
+        if not args.json and not args.quiet:
+            for error in errors:
+                print(f"{label}: {error}")
+    elapsed = time.perf_counter() - start
+
+    summary = {
+        "total": total,
+        "valid": valid,
+        "invalid": len(invalid),
+        "bytes": total_bytes,
+        "seconds": round(elapsed, 3),
+        "docs_per_sec": round(total / elapsed, 1) if elapsed else 0.0,
+        "mb_per_sec": round(total_bytes / 1e6 / elapsed, 2) if elapsed else 0.0,
+    }
+    if args.json:
+        json.dump({"summary": summary, "invalid": invalid}, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        print(
+            f"{total} checked, {valid} valid, {len(invalid)} invalid in "
+            f"{summary['seconds']}s ({summary['docs_per_sec']} docs/s, "
+            f"{summary['mb_per_sec']} MB/s)",
+            file=sys.stderr,
+        )
+    return 1 if invalid else 0
+
+
+if __name__ == "__main__":
+    sys.exit(validate_main())
@@ -0,0 +1,171 @@
+"""
+CBOR and MessagePack codecs for vCons.
+
+Both formats carry the same document as the JSON form, except that
+base64 and base64url bodies travel as native byte strings: a dialog
+``{"body": "aGk...", "encoding": "base64url"}`` is sent as
+``{"body": b"hi...", "encoding": "base64url"}`` and turned back into the
+identical text on decoding. Bodies without ``=`` padding, or not in
+canonical form, are sent as text so the round trip stays lossless.
+
+``cbor2`` and ``msgpack`` are optional dependencies:
+``pip install vcon[cbor]`` or ``pip install vcon[msgpack]``.
+"""
+
+from typing import Any, Union
+
+from . import media
+from .lazy import LazyBody, json_default
+
+try:
+    import cbor2
+except ImportError:  # pragma: no cover - depends on the environment
+    cbor2 = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - depends on the environment
+    msgpack = None
+
+BytesInput = Union[bytes, bytearray, memoryview]
+
+
+def pack_bodies(vcon_dict: dict) -> dict:
+    """
+    Returns a shallow copy of ``vcon_dict`` with base64 and base64url
+    bodies replaced by their raw bytes.
+
+    :param vcon_dict: the vCon document
+    :type vcon_dict: dict
+    :return: the document to encode
+    :rtype: dict
+    """
+    document, extracted = media.extract_bodies(vcon_dict)
+    for name, index, data, padded in extracted:
+        if padded:
+            body = data
+        else:
+            body = str(vcon_dict[name][index]["body"])
+        document[name][index]["body"] = body
+    return document
+
+
+def unpack_bodies(document: Any, lazy: bool = False) -> Any:
+    """
+    Turns byte string bodies back into base64 or base64url text, in place.
+
+    :param document: a decoded vCon document
+    :type document: dict
+    :param lazy: use :class:`~vcon.media.MediaBody` proxies instead of
+        encoding the text now
+    :type lazy: bool
+    :return: ``document``
+    :rtype: dict
+    """
+    for name in media.MEDIA_LISTS:
+        entries = document.get(name)
+        if type(entries) is not list:
+            continue
+        for entry in entries:
+            if type(entry) is not dict:
+                continue
+            body = entry.get("body")
+            encoding = entry.get("encoding")
+            if not isinstance(body, (bytes, bytearray)):
+                continue
+            if encoding not in media.BASE64_ENCODINGS:
+                continue
+            if lazy:
+                entry["body"] = media.MediaBody(body, encoding)
+            else:
+                entry["body"] = media.encode(body, encoding)
+    return document
+
+
+def _cbor_default(encoder, value: Any) -> None:
+    if isinstance(value, LazyBody):
+        encoder.encode(str(value))
+    else:
+        json_default(value)
+
+
+def to_cbor(vcon_dict: dict) -> bytes:
+    """
+    Encodes a vCon document as CBOR.
+
+    :param vcon_dict: the vCon document
+    :type vcon_dict: dict
+    :return: the CBOR data
+    :rtype: bytes
+    :raises ImportError: if cbor2 is not installed
+    """
+    if cbor2 is None:
+        raise ImportError("CBOR support requires the cbor2 package: pip install cbor2")
+    return cbor2.dumps(pack_bodies(vcon_dict), default=_cbor_default)
+
+
+def from_cbor(data: BytesInput, lazy: bool = False) -> Any:
+    """
+    Decodes CBOR data written by :func:`to_cbor`.
+
+    :param data: the CBOR data
+    :type data: bytes-like
+    :param lazy: keep bodies as raw bytes until accessed
+    :type lazy: bool
+    :return: the vCon document
+    :rtype: dict
+    :raises ImportError: if cbor2 is not installed
+    :raises ValueError: if the data is not valid CBOR
+    """
+    if cbor2 is None:
+        raise ImportError("CBOR support requires the cbor2 package: pip install cbor2")
+    try:
+        document = cbor2.loads(data)
+    except cbor2.CBORDecodeError as e:
+        raise ValueError(f"Invalid CBOR data: {e}") from e
+    if not isinstance(document, dict):
+        raise ValueError("CBOR data does not contain a vCon object")
+    return unpack_bodies(document, lazy)
+
+
+def to_msgpack(vcon_dict: dict) -> bytes:
+    """
+    Encodes a vCon document as MessagePack.
+
+    :param vcon_dict: the vCon document
+    :type vcon_dict: dict
+    :return: the MessagePack data
+    :rtype: bytes
+    :raises ImportError: if msgpack is not installed
+    """
+    if msgpack is None:
+        raise ImportError(
+            "MessagePack support requires the msgpack package: pip install msgpack"
+        )
+    return msgpack.packb(pack_bodies(vcon_dict), default=json_default)
+
+
+def from_msgpack(data: BytesInput, lazy: bool = False) -> Any:
+    """
+    Decodes MessagePack data written by :func:`to_msgpack`.
+
+    :param data: the MessagePack data
+    :type data: bytes-like
+    :param lazy: keep bodies as raw bytes until accessed
+    :type lazy: bool
+    :return: the vCon document
+    :rtype: dict
+    :raises ImportError: if msgpack is not installed
+    :raises ValueError: if the data is not valid MessagePack
+    """
+    if msgpack is None:
+        raise ImportError(
+            "MessagePack support requires the msgpack package: pip install msgpack"
+        )
+    try:
+        document = msgpack.unpackb(data, strict_map_key=False)
+    except (msgpack.UnpackException, ValueError) as e:
+        raise ValueError(f"Invalid MessagePack data: {e}") from e
+    if not isinstance(document, dict):
+        raise ValueError("MessagePack data does not contain a vCon object")
+    return unpack_bodies(document, lazy)
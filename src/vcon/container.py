@@ -0,0 +1,145 @@
+"""
+Binary container format for vCons.
+
+A container holds the vCon's JSON metadata plus its base64/base64url media
+bodies as raw bytes, which saves the 33% base64 overhead and the decode on
+every read. Layout, all integers big-endian::
+
+    magic        6 bytes   b"vCon\\x00\\x01" (format version 1)
+    count        uint32    number of sections
+    count times:
+        length   uint64
+        data     length bytes
+
+Section 0 is a JSON object ``{"vcon": ..., "media": [...]}``. ``vcon`` is
+the document with every moved body set to null, and ``media[i]`` describes
+section ``i + 1`` as ``[list, index, encoding, padded]``, e.g.
+``["dialog", 0, "base64url", true]``. Only bodies that re-encode to exactly
+the same text are moved, so :func:`from_bytes` always restores the original
+JSON form.
+"""
+
+import struct
+from typing import Any, Union
+
+from .json_backend import JsonBackend, get_backend
+from .lazy import json_default
+from . import media
+
+MAGIC = b"vCon\x00\x01"
+
+# Shorter bodies stay inline in the metadata
+MIN_SECTION_LENGTH = 256
+
+_COUNT = struct.Struct(">I")
+_LENGTH = struct.Struct(">Q")
+
+
+def is_container(data: Union[bytes, bytearray, memoryview]) -> bool:
+    """
+    Checks whether ``data`` starts with the container magic.
+
+    :param data: the data to check
+    :type data: bytes-like
+    :return: True if ``data`` looks like a container
+    :rtype: bool
+    """
+    return bytes(data[: len(MAGIC)]) == MAGIC
+
+
+def to_bytes(vcon_dict: dict, backend: Union[str, JsonBackend, None] = None) -> bytes:
+    """
+    Packs a vCon document into a container.
+
+    ``vcon_dict`` is not modified.
+
+    :param vcon_dict: the vCon document
+    :type vcon_dict: dict
+    :param backend: the JSON backend for the metadata section
+    :type backend: Union[str, JsonBackend, None]
+    :return: the container
+    :rtype: bytes
+    """
+    document, extracted = media.extract_bodies(vcon_dict, MIN_SECTION_LENGTH)
+    descriptors = []
+    blobs = []
+    for name, index, data, padded in extracted:
+        descriptors.append([name, index, vcon_dict[name][index]["encoding"], padded])
+        blobs.append(data)
+
+    metadata = get_backend(backend).dumps(
+        {"vcon": document, "media": descriptors}, as_bytes=True, default=json_default
+    )
+    parts = [MAGIC, _COUNT.pack(len(blobs) + 1)]
+    for section in (metadata, *blobs):
+        parts.append(_LENGTH.pack(len(section)))
+        parts.append(section)
+    return b"".join(parts)
+
+
+def from_bytes(
+    data: Union[bytes, bytearray, memoryview],
+    backend: Union[str, JsonBackend, None] = None,
+    lazy: bool = False,
+) -> Any:
+    """
+    Unpacks a container into a vCon document in the standard JSON form.
+
+    With ``lazy=True`` the media bodies become
+    :class:`~vcon.media.MediaBody` proxies that reference ``data`` and are
+    only encoded when their text is needed, so loading costs no more than
+    parsing the metadata.
+
+    :param data: the container
+    :type data: bytes-like
+    :param backend: the JSON backend for the metadata section
+    :type backend: Union[str, JsonBackend, None]
+    :param lazy: keep media bodies as raw bytes until accessed
+    :type lazy: bool
+    :return: the vCon document
+    :rtype: dict
+    :raises ValueError: if ``data`` is not a well-formed container
+    """
+    view = memoryview(data)
+    if not is_container(view):
+        raise ValueError("Not a vCon container")
+    position = len(MAGIC)
+    sections = []
+    try:
+        (count,) = _COUNT.unpack_from(view, position)
+        position += _COUNT.size
+        for _ in range(count):
+            (length,) = _LENGTH.unpack_from(view, position)
+            position += _LENGTH.size
+            if position + length > len(view):
+                raise ValueError("Truncated vCon container")
+            sections.append(view[position : position + length])
+            position += length
+    except struct.error:
+        raise ValueError("Truncated vCon container") from None
+    if not sections:
+        raise ValueError("vCon container has no metadata section")
+
+    metadata = get_backend(backend).loads(bytes(sections[0]))
+    if not isinstance(metadata, dict):
+        raise ValueError("vCon container metadata is not a JSON object")
+    document = metadata.get("vcon")
+    descriptors = metadata.get("media")
+    if not isinstance(document, dict) or not isinstance(descriptors, list):
+        raise ValueError("vCon container metadata needs a vcon object and a media list")
+    if len(descriptors) != len(sections) - 1:
+        raise ValueError("vCon container media sections do not match metadata")
+    for descriptor, section in zip(descriptors, sections[1:]):
+        try:
+            name, index, encoding, padded = descriptor
+            entry = document[name][index]
+        except (TypeError, ValueError, KeyError, IndexError):
+            entry = None
+        if not isinstance(entry, dict) or encoding not in media.BASE64_ENCODINGS:
+            raise ValueError(f"Invalid vCon container media descriptor: {descriptor!r}")
+        if lazy:
+            body = media.MediaBody(section, encoding, padded)
+        else:
+            body = media.encode(section, encoding, padded)
+        entry["body"] = body
+    return document
@@ -0,0 +1,189 @@
+"""
+Copy helpers for JSON-shaped data (dicts, lists and scalars).
+
+:func:`deep_copy` is a specialised replacement for a ``json.loads(json.dumps(x))``
+round-trip. :func:`cow_view` returns a copy-on-write view that shares the
+source until a container is actually mutated. Both resolve
+:class:`~vcon.lazy.LazyBody` proxies to ``str``, so their output is always
+JSON-native.
+"""
+
+import copy
+from collections.abc import MutableMapping, MutableSequence
+from typing import Any
+
+from .lazy import LazyBody
+
+_ATOMIC = frozenset((str, int, float, bool, type(None)))
+
+
+def deep_copy(obj: Any) -> Any:
+    """
+    Deep copy a JSON-shaped object.
+
+    Dicts and lists are copied recursively, tuples become lists (as they
+    would through JSON) and scalars are shared since they are immutable.
+    :class:`~vcon.lazy.LazyBody` proxies become ``str``. Anything else falls
+    back to :func:`copy.deepcopy`.
+
+    :param obj: the object to copy
+    :type obj: Any
+    :return: an independent copy of ``obj``
+    :rtype: Any
+    """
+    cls = type(obj)
+    if cls in _ATOMIC:
+        return obj
+    if cls is dict:
+        return {k: v if type(v) in _ATOMIC else deep_copy(v) for k, v in obj.items()}
+    if cls is list or cls is tuple:
+        return [v if type(v) in _ATOMIC else deep_copy(v) for v in obj]
+    if cls is LazyBody:
+        return str(obj)
+    if isinstance(obj, (CopyOnWriteDict, CopyOnWriteList)):
+        return obj.materialize()
+    return copy.deepcopy(obj)
+
+
+def cow_view(obj: Any) -> Any:
+    """
+    Wrap a dict or list in a copy-on-write view.
+
+    Reads go straight to ``obj``. The first write to a container makes a
+    shallow copy of that container only, so the cost of handing out a view
+    is proportional to what actually gets mutated. ``obj`` itself is never
+    modified. :class:`~vcon.lazy.LazyBody` values are read as ``str``. Other
+    values are returned unchanged.
+
+    :param obj: the object to wrap
+    :type obj: Any
+    :return: a view of ``obj``
+    :rtype: Any
+    """
+    cls = type(obj)
+    if cls is dict:
+        return CopyOnWriteDict(obj)
+    if cls is list:
+        return CopyOnWriteList(obj)
+    return obj
+
+
+class _CopyOnWrite:
+    __slots__ = ("_data", "_owned", "_children")
+
+    def __init__(self, source) -> None:
+        self._data = source
+        self._owned = False
+        # Views handed out before the first write; merged into the copy later
+        self._children = {}
+
+    def _get(self, key):
+        value = self._data[key]
+        if type(value) is dict or type(value) is list:
+            if self._owned:
+                value = self._data[key] = cow_view(value)
+                return value
+            child = self._children.get(key)
+            if child is None:
+                child = self._children[key] = cow_view(value)
+            return child
+        if type(value) is LazyBody:
+            return str(value)
+        return value
+
+    def _own(self) -> None:
+        if self._owned:
+            return
+        self._data = type(self._data)(self._data)
+        for key, child in self._children.items():
+            self._data[key] = child
+        self._children = {}
+        self._owned = True
+
+    def _materialize(self, value):
+        if isinstance(value, _CopyOnWrite):
+            return value.materialize()
+        return deep_copy(value)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.materialize()!r})"
+
+
+class CopyOnWriteDict(_CopyOnWrite, MutableMapping):
+    """A copy-on-write view of a dict. See :func:`cow_view`."""
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        return self._get(key)
+
+    def __setitem__(self, key, value) -> None:
+        self._own()
+        self._data[key] = value
+
+    def __delitem__(self, key) -> None:
+        self._own()
+        del self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def materialize(self) -> dict:
+        """
+        Returns an independent plain dict with all changes applied.
+
+        :return: a deep copy of the view
+        :rtype: dict
+        """
+        children = self._children
+        return {k: self._materialize(children.get(k, v)) for k, v in self._data.items()}
+
+
+class CopyOnWriteList(_CopyOnWrite, MutableSequence):
+    """A copy-on-write view of a list. See :func:`cow_view`."""
+
+    __slots__ = ()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(len(self._data)))]
+        if index < 0:
+            index += len(self._data)
+            if index < 0:
+                raise IndexError("list index out of range")
+        return self._get(index)
+
+    def __setitem__(self, index, value) -> None:
+        self._own()
+        self._data[index] = value
+
+    def __delitem__(self, index) -> None:
+        self._own()
+        del self._data[index]
+
+    def insert(self, index, value) -> None:
+        self._own()
+        self._data.insert(index, value)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CopyOnWriteList):
+            other = list(other)
+        if not isinstance(other, list):
+            return NotImplemented
+        return list(self) == other
+
+    def materialize(self) -> list:
+        """
+        Returns an independent plain list with all changes applied.
+
+        :return: a deep copy of the view
+        :rtype: list
+        """
+        children = self._children
+        return [self._materialize(children.get(i, v)) for i, v in enumerate(self._data)]
@@ -1,10 +1,16 @@
+import asyncio
 import requests
 import hashlib
 import base64
 from datetime import datetime
-from typing import Optional, List, Union
+from collections.abc import Sequence
+from concurrent.futures import Executor
+from typing import Any, Optional, List, Union
+from . import fetch, verify
+from .cache import MediaCache
 from .party import PartyHistory
-from dateutil import parser
+from .timestamps import normalize_timestamp
+from dateutil import parser  # noqa: F401  kept importable as vcon.dialog.parser
 
 MIME_TYPES = [
     "text/plain",
@@ -19,6 +25,43 @@ MIME_TYPES = [
 
 
 class Dialog:
+    """
+    A dialog of a vCon.
+
+    ``type``, ``start`` and ``parties`` are stored in slots; the other
+    fields live in the instance ``__dict__``. Fields that are None are left
+    unset.
+    """
+
+    FIELDS = (
+        "type",
+        "start",
+        "parties",
+        "originator",
+        "mimetype",
+        "filename",
+        "body",
+        "encoding",
+        "url",
+        "alg",
+        "signature",
+        "disposition",
+        "party_history",
+        "transferee",
+        "transferor",
+        "transfer_target",
+        "original",
+        "consultation",
+        "target_dialog",
+        "campaign",
+        "interaction",
+        "skill",
+        "duration",
+        "meta",
+    )
+
+    __slots__ = ("type", "start", "parties", "__dict__")
+
     MIME_TYPES = [
         "audio/wav",
         "audio/x-wav",
@@ -117,18 +160,110 @@ class Dialog:
         if isinstance(start, datetime):
             start = start.isoformat()
         elif isinstance(start, str):
-            start = parser.parse(start).isoformat()
+            start = normalize_timestamp(start)
 
         # Set attributes from named parameters that are not None
-        for key, value in locals().items():
-            if value is not None and key not in ("self", "kwargs"):
-                setattr(self, key, value)
+        if type is not None:
+            self.type = type
+        if start is not None:
+            self.start = start
+        if parties is not None:
+            self.parties = parties
+        if originator is not None:
+            self.originator = originator
+        if mimetype is not None:
+            self.mimetype = mimetype
+        if filename is not None:
+            self.filename = filename
+        if body is not None:
+            self.body = body
+        if encoding is not None:
+            self.encoding = encoding
+        if url is not None:
+            self.url = url
+        if alg is not None:
+            self.alg = alg
+        if signature is not None:
+            self.signature = signature
+        if disposition is not None:
+            self.disposition = disposition
+        if party_history is not None:
+            self.party_history = party_history
+        if transferee is not None:
+            self.transferee = transferee
+        if transferor is not None:
+            self.transferor = transferor
+        if transfer_target is not None:
+            self.transfer_target = transfer_target
+        if original is not None:
+            self.original = original
+        if consultation is not None:
+            self.consultation = consultation
+        if target_dialog is not None:
+            self.target_dialog = target_dialog
+        if campaign is not None:
+            self.campaign = campaign
+        if interaction is not None:
+            self.interaction = interaction
+        if skill is not None:
+            self.skill = skill
+        if duration is not None:
+            self.duration = duration
+        if meta is not None:
+            self.meta = meta
 
         # Set any additional kwargs as attributes
         for key, value in kwargs.items():
             if value is not None:
                 setattr(self, key, value)
 
+    @classmethod
+    def from_dict(cls, dialog_dict: dict, trusted: bool = False) -> "Dialog":
+        """
+        Build a detached Dialog from its dictionary form.
+
+        Untrusted input goes through the constructor, like
+        ``Dialog(**dialog_dict)``. With ``trusted=True`` the dictionary is
+        assumed to come from a vCon, where ``start`` is already normalized,
+        and its values are copied over without any conversion.
+
+        :param dialog_dict: the dialog as stored in a vCon
+        :type dialog_dict: dict
+        :param trusted: skip the constructor and its normalization
+        :type trusted: bool
+        :return: the dialog
+        :rtype: Dialog
+        """
+        if not trusted:
+            return cls(**dialog_dict)
+        dialog = cls.__new__(cls)
+        for key, value in dialog_dict.items():
+            if value is not None:
+                setattr(dialog, key, value)
+        return dialog
+
+    @classmethod
+    def bind(cls, dialog_dict: dict, vcon=None) -> "Dialog":
+        """
+        Returns a Dialog that uses ``dialog_dict`` itself as its storage.
+
+        Reading an attribute reads the dictionary and setting or deleting
+        one changes it, so methods such as ``to_inline_data`` update the vCon
+        the dictionary belongs to. Nothing is copied or normalized.
+
+        :param dialog_dict: the dialog as stored in a vCon
+        :type dialog_dict: dict
+        :param vcon: the vCon the dictionary belongs to, whose dialog indexes
+            are dropped whenever the view changes an attribute
+        :type vcon: Vcon or None
+        :return: a view of the dialog
+        :rtype: Dialog
+        """
+        dialog = _BoundDialog.__new__(_BoundDialog)
+        object.__setattr__(dialog, "__dict__", dialog_dict)
+        object.__setattr__(dialog, "_vcon", vcon)
+        return dialog
+
     def to_dict(self):
         """
         Returns a dictionary representation of the Dialog object.
@@ -141,31 +276,113 @@ class Dialog:
         if not hasattr(self, "start"):
             self.start = datetime.now().isoformat()
 
-        # Get all attributes of the object
-        dialog_dict = self.__dict__.copy()
-
-        # Handle party_history specially
-        if hasattr(self, "party_history") and self.party_history:
-            dialog_dict["party_history"] = [
-                party_history.to_dict() for party_history in self.party_history
-            ]
-
-        return {k: v for k, v in dialog_dict.items() if v is not None}
+        dialog_dict = {}
+        for key, value in self._items():
+            if value is None:
+                continue
+            # Handle party_history specially
+            if key == "party_history" and value:
+                value = [
+                    (
+                        party_history.to_dict()
+                        if isinstance(party_history, PartyHistory)
+                        else party_history
+                    )
+                    for party_history in value
+                ]
+            dialog_dict[key] = value
+        return dialog_dict
+
+    def _items(self):
+        # the standard fields in declaration order, then the extensions
+        for key in self.FIELDS:
+            value = getattr(self, key, None)
+            if value is not None:
+                yield key, value
+        for key, value in self.__dict__.items():
+            if key not in _STANDARD_FIELDS:
+                yield key, value
 
-    def add_external_data(self, url: str, filename: str, mimetype: str) -> None:
+    def add_external_data(
+        self,
+        url: str,
+        filename: str,
+        mimetype: str,
+        session: Optional[requests.Session] = None,
+        timeout: Optional[float] = fetch.DEFAULT_TIMEOUT,
+        cache: Optional[MediaCache] = None,
+    ) -> None:
         """
         Add external data to the dialog.
 
         :param url: the URL of the external data
         :type url: str
+        :param session: the session to fetch with, see :func:`vcon.fetch.get`
+        :type session: requests.Session or None
+        :param timeout: the connect and read timeout in seconds
+        :type timeout: float or None
+        :param cache: the media cache to revalidate against and fill
+        :type cache: vcon.cache.MediaCache or None
         :return: None
         :rtype: None
+        :raises vcon.fetch.FetchError: if the data cannot be fetched
         """
-        response = requests.get(url)
-        if response.status_code == 200:
-            self.mimetype = response.headers["Content-Type"]
-        else:
-            raise Exception(f"Failed to fetch external data: {response.status_code}")
+        # Stream the body, hashing the raw bytes for the signature
+        headers, encoder = fetch.get_media(
+            url, session=session, timeout=timeout, encode=False, cache=cache
+        )
+        self._set_external_data(
+            url, filename, mimetype, headers["Content-Type"], encoder.signature()
+        )
+
+    async def aadd_external_data(
+        self,
+        url: str,
+        filename: str,
+        mimetype: str,
+        client=None,
+        timeout: Optional[float] = fetch.DEFAULT_TIMEOUT,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        """
+        Add external data to the dialog, without blocking the event loop.
+
+        The response is streamed and hashed chunk by chunk in ``executor``;
+        the signature is the SHA-256 of the raw bytes.
+
+        :param url: the URL of the external data
+        :type url: str
+        :param filename: the filename, defaults to the last part of the URL
+        :type filename: str
+        :param mimetype: the mimetype, defaults to the response Content-Type
+        :type mimetype: str
+        :param client: the ``httpx.AsyncClient`` to fetch with, see
+            :func:`vcon.fetch.aget_media`
+        :type client: httpx.AsyncClient or None
+        :param timeout: the connect and read timeout in seconds
+        :type timeout: float or None
+        :param executor: the executor to hash in
+        :type executor: concurrent.futures.Executor or None
+        :return: None
+        :rtype: None
+        :raises vcon.fetch.FetchError: if the data cannot be fetched
+        """
+        headers, encoder = await fetch.aget_media(
+            url, client, timeout, encode=False, executor=executor
+        )
+        self._set_external_data(
+            url, filename, mimetype, headers["Content-Type"], encoder.signature()
+        )
+
+    def _set_external_data(
+        self,
+        url: str,
+        filename: str,
+        mimetype: str,
+        content_type: str,
+        signature: str,
+    ) -> None:
+        self.mimetype = content_type
 
         # Override the filename if provided, otherwise use the filename from the URL
         if filename:
@@ -179,12 +396,9 @@ class Dialog:
         if mimetype:
             self.mimetype = mimetype
 
-        # Calculate the SHA-256 hash of the body as the signature
         self.alg = "sha256"
         self.encoding = "base64url"
-        self.signature = base64.urlsafe_b64encode(
-            hashlib.sha256(response.text.encode()).digest()
-        ).decode()
+        self.signature = signature
 
     def add_inline_data(self, body: str, filename: str, mimetype: str) -> None:
         """
@@ -268,50 +482,144 @@ class Dialog:
         """
         return self.mimetype == "message/rfc822"
 
-    def is_external_data_changed(self) -> bool:
+    def is_external_data_changed(
+        self,
+        download: bool = False,
+        session: Optional[requests.Session] = None,
+        timeout: Optional[float] = fetch.DEFAULT_TIMEOUT,
+        cache: Optional[MediaCache] = None,
+    ) -> bool:
         """
         Check to see if it's an external data dialog, that the contents are valid by
-        checking the hash of the body against the signature.
-
-        :return: True if the dialog is an external data dialog and the contents are valid, False otherwise
+        checking the SHA-256 of the decoded body against the signature.
+
+        Nothing is fetched unless ``download`` is True, in which case a dialog
+        without a body is checked against the contents of its URL. With a
+        ``cache``, contents that have not changed since they were cached are
+        then confirmed by a conditional GET and hashed from disk. Use
+        :func:`vcon.verify.verify_dialog` to find out why a check failed.
+
+        :param download: fetch the URL of a dialog without a body
+        :type download: bool
+        :param session: the session to fetch with
+        :type session: requests.Session or None
+        :param timeout: the connect and read timeout in seconds
+        :type timeout: float or None
+        :param cache: the media cache to revalidate against and fill
+        :type cache: vcon.cache.MediaCache or None
+        :return: False if the dialog is not an external data dialog or its
+            contents match the signature, True otherwise
         :rtype: bool
         """
         if not self.is_external_data():
             return False
-        try:
-            body_hash = base64.urlsafe_b64decode(self.signature.encode())
-            return hashlib.sha256(self.body.encode()).digest() != body_hash
-        except Exception as e:
-            print(e)
+        dialog = dict(self._items())
+        if dialog.get("body") is None and not download:
             return True
+        result = verify.verify_dialog(
+            dialog, session=session, timeout=timeout, cache=cache
+        )
+        return result.status != verify.OK
 
     # Convert the dialog from an external data dialog to an inline data dialog
     # by reading the contents from the URL then adding the contents to the body
-    def to_inline_data(self) -> None:
+    def to_inline_data(
+        self,
+        session: Optional[requests.Session] = None,
+        timeout: Optional[float] = fetch.DEFAULT_TIMEOUT,
+        retries: int = 0,
+        backoff: float = fetch.DEFAULT_BACKOFF,
+        budget: Optional[fetch.ByteBudget] = None,
+        cache: Optional[MediaCache] = None,
+    ) -> None:
         """
         Convert the dialog from an external data dialog to an inline data dialog
         by reading the contents from the URL then adding the contents to the body.
 
+        :param session: the session to fetch with, see :func:`vcon.fetch.get`
+        :type session: requests.Session or None
+        :param timeout: the connect and read timeout in seconds
+        :type timeout: float or None
+        :param retries: how many times to retry transient failures
+        :type retries: int
+        :param backoff: the delay before the first retry, in seconds
+        :type backoff: float
+        :param budget: the byte budget to charge the download to
+        :type budget: vcon.fetch.ByteBudget or None
+        :param cache: the media cache to revalidate against and fill; media
+            that has not changed is read from it instead of downloaded
+        :type cache: vcon.cache.MediaCache or None
         :return: None
         :rtype: None
+        :raises vcon.fetch.FetchError: if the data cannot be fetched
         """
-        # Read the contents from the URL
-        response = requests.get(self.url)
-        if response.status_code == 200:
-            # For binary content, use response.content instead of response.text
-            raw_content = response.content
-            # Base64url encode the body
-            self.body = base64.urlsafe_b64encode(raw_content).decode()
-            self.mimetype = response.headers.get("Content-Type")
-        else:
-            raise Exception(f"Failed to fetch external data: {response.status_code}")
-
-        # Calculate the SHA-256 hash of the original binary content
+        # Stream the contents from the URL, hashing the raw bytes and
+        # base64url encoding them chunk by chunk
+        headers, encoder = fetch.get_media(
+            self.url,
+            session=session,
+            timeout=timeout,
+            retries=retries,
+            backoff=backoff,
+            budget=budget,
+            cache=cache,
+        )
+        self._set_inline_data(
+            encoder.body(), headers.get("Content-Type"), encoder.signature()
+        )
+
+    async def ato_inline_data(
+        self,
+        client=None,
+        timeout: Optional[float] = fetch.DEFAULT_TIMEOUT,
+        retries: int = 0,
+        backoff: float = fetch.DEFAULT_BACKOFF,
+        budget: Optional[fetch.ByteBudget] = None,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        """
+        Convert the dialog from an external data dialog to an inline data
+        dialog, without blocking the event loop.
+
+        The response is streamed; each chunk is hashed and base64url-encoded
+        in ``executor`` while the next one arrives.
+
+        :param client: the ``httpx.AsyncClient`` to fetch with, see
+            :func:`vcon.fetch.aget_media`
+        :type client: httpx.AsyncClient or None
+        :param timeout: the connect and read timeout in seconds
+        :type timeout: float or None
+        :param retries: how many times to retry transient failures
+        :type retries: int
+        :param backoff: the delay before the first retry, in seconds
+        :type backoff: float
+        :param budget: the byte budget to charge the download to
+        :type budget: vcon.fetch.ByteBudget or None
+        :param executor: the executor to hash and encode in
+        :type executor: concurrent.futures.Executor or None
+        :return: None
+        :rtype: None
+        :raises vcon.fetch.FetchError: if the data cannot be fetched
+        """
+        headers, encoder = await fetch.aget_media(
+            self.url,
+            client,
+            timeout,
+            retries,
+            backoff,
+            budget,
+            executor=executor,
+        )
+        loop = asyncio.get_running_loop()
+        body = await loop.run_in_executor(executor, encoder.body)
+        self._set_inline_data(body, headers.get("Content-Type"), encoder.signature())
+
+    def _set_inline_data(self, body: str, content_type: str, signature: str) -> None:
+        self.body = body
+        self.mimetype = content_type
         self.alg = "sha256"
         self.encoding = "base64url"
-        self.signature = base64.urlsafe_b64encode(
-            hashlib.sha256(raw_content).digest()
-        ).decode()
+        self.signature = signature
 
         # Set the filename if it doesn't exist
         if not hasattr(self, "filename"):
@@ -319,3 +627,105 @@ class Dialog:
 
         # Remove the url since this is now inline data
         delattr(self, "url")
+
+
+_STANDARD_FIELDS = frozenset(Dialog.FIELDS)
+
+
+def _bound_field(name: str) -> property:
+    def get(self):
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def set(self, value):
+        self.__dict__[name] = value
+
+    def delete(self):
+        try:
+            del self.__dict__[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    return property(get, set, delete)
+
+
+class _BoundDialog(Dialog):
+    """
+    A Dialog whose ``__dict__`` is a vCon's dialog dict, see
+    :meth:`Dialog.bind`. The standard fields are redirected from the slots
+    to that dict so every attribute lives in it.
+    """
+
+    __slots__ = ("_vcon",)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if self._vcon is not None:
+            self._vcon._changed("dialog")
+
+    def __delattr__(self, name: str) -> None:
+        super().__delattr__(name)
+        if self._vcon is not None:
+            self._vcon._changed("dialog")
+
+    def _items(self):
+        return self.__dict__.items()
+
+
+for _name in Dialog.FIELDS:
+    setattr(_BoundDialog, _name, _bound_field(_name))
+
+
+class DialogList(Sequence):
+    """
+    A read-only sequence of :class:`Dialog` views over a vCon's dialog list.
+
+    Views are created with :meth:`Dialog.bind` the first time a position is
+    read and reused afterwards, as long as the list still holds the same
+    dictionary at that position.
+
+    :param vcon: the vCon whose dialogs to expose
+    :type vcon: Vcon
+    """
+
+    __slots__ = ("_vcon", "_views")
+
+    def __init__(self, vcon) -> None:
+        self._vcon = vcon
+        self._views: List[Optional[Dialog]] = []
+
+    def _source(self) -> list:
+        return self._vcon.vcon_dict.get("dialog", [])
+
+    def _view(self, source: list, index: int) -> Dialog:
+        dialog_dict = source[index]
+        views = self._views
+        if index >= len(views):
+            views.extend([None] * (len(source) - len(views)))
+        view = views[index]
+        if view is None or view.__dict__ is not dialog_dict:
+            view = views[index] = Dialog.bind(dialog_dict, self._vcon)
+        return view
+
+    def __len__(self) -> int:
+        return len(self._source())
+
+    def __getitem__(self, index):
+        source = self._source()
+        if isinstance(index, slice):
+            return [self._view(source, i) for i in range(*index.indices(len(source)))]
+        if index < 0:
+            index += len(source)
+        if not 0 <= index < len(source):
+            raise IndexError("dialog index out of range")
+        return self._view(source, index)
+
+    def __iter__(self):
+        source = self._source()
+        for i in range(len(source)):
+            yield self._view(source, i)
+
+    def __repr__(self) -> str:
+        return f"DialogList({len(self)} dialogs)"
@@ -0,0 +1,380 @@
+"""
+HTTP fetching of external dialog media.
+
+:func:`get_media` streams a response from ``requests`` into a
+:class:`~vcon.media.MediaEncoder`, which hashes and base64url-encodes it
+chunk by chunk. It applies a timeout, retries with exponential backoff for
+transient failures (connection errors, timeouts, 429 and 5xx responses) and
+an optional :class:`ByteBudget` that caps the total number of bytes
+downloaded. Pass a :class:`requests.Session`, e.g. from
+:func:`new_session`, to reuse connections across many fetches, and a
+:class:`~vcon.cache.MediaCache` to skip downloading media that has not
+changed since it was last fetched.
+
+:func:`aget_media` is the asyncio counterpart. It streams the response from
+an ``httpx.AsyncClient`` (or any client with the same ``stream()`` method)
+into the same encoder, hashing and encoding each chunk in a thread pool so
+the event loop stays free. ``httpx`` is an optional
+dependency: ``pip install httpx``.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Executor
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .cache import MediaCache
+from .media import MediaEncoder
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - depends on the environment
+    httpx = None
+
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_BACKOFF = 0.5
+CHUNK_SIZE = 64 * 1024
+
+# Responses worth retrying
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+
+class FetchError(Exception):
+    """
+    Raised when external data cannot be fetched.
+
+    :param message: the error message
+    :type message: str
+    :param status_code: the HTTP status of the failed response, if any
+    :type status_code: int or None
+    """
+
+    def __init__(self, message: str, status_code: Optional[int] = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class InlineError(Exception):
+    """
+    Raised when some external dialogs of a vCon could not be inlined.
+
+    :param errors: the error for each failed dialog, by dialog index
+    :type errors: dict[int, Exception]
+    """
+
+    def __init__(self, errors: Dict[int, Exception]) -> None:
+        details = "; ".join(f"dialog {i}: {e}" for i, e in sorted(errors.items()))
+        super().__init__(f"Failed to inline {len(errors)} dialog(s): {details}")
+        self.errors = errors
+
+
+class ByteBudget:
+    """
+    A thread-safe cap on the number of bytes downloaded.
+
+    :param limit: the number of bytes allowed, or None for no limit
+    :type limit: int or None
+    """
+
+    def __init__(self, limit: Optional[int]) -> None:
+        self.limit = limit
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def check(self, size: int) -> None:
+        """
+        Checks that ``size`` more bytes would fit in the budget.
+
+        :param size: the number of bytes
+        :type size: int
+        :raises FetchError: if they would not fit
+        """
+        with self._lock:
+            self._check(size)
+
+    def _check(self, size: int) -> None:
+        if self.limit is not None and self.used + size > self.limit:
+            raise FetchError(f"Byte budget of {self.limit} bytes exceeded")
+
+    def charge(self, size: int) -> None:
+        """
+        Counts ``size`` bytes against the budget.
+
+        :param size: the number of bytes
+        :type size: int
+        :raises FetchError: if the budget would be exceeded; nothing is
+            counted in that case
+        """
+        with self._lock:
+            self._check(size)
+            self.used += size
+
+
+def new_session(pool_size: int = 10) -> requests.Session:
+    """
+    Creates a session that keeps up to ``pool_size`` connections per host.
+
+    :param pool_size: the number of pooled connections per host
+    :type pool_size: int
+    :return: the session
+    :rtype: requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_media(
+    url: str,
+    session: Optional[requests.Session] = None,
+    timeout: Optional[float] = DEFAULT_TIMEOUT,
+    retries: int = 0,
+    backoff: float = DEFAULT_BACKOFF,
+    budget: Optional[ByteBudget] = None,
+    encode: bool = True,
+    chunk_size: int = CHUNK_SIZE,
+    cache: Optional[MediaCache] = None,
+) -> Tuple[Any, MediaEncoder]:
+    """
+    Streams ``url`` into a :class:`~vcon.media.MediaEncoder`.
+
+    The response is read in chunks of ``chunk_size`` bytes, each hashed and
+    encoded as it arrives, so the raw media is never held in memory as a
+    whole. Attempt ``n`` (counting from 0) that fails transiently is
+    retried after ``backoff * 2 ** n`` seconds, up to ``retries`` times.
+
+    With a ``cache``, a URL fetched before is requested conditionally; if
+    the server answers ``304 Not Modified`` the media is read from the
+    cache instead, and is not charged to ``budget``. Responses with an
+    ``ETag`` or ``Last-Modified`` header are added to the cache.
+
+    :param url: the URL to fetch
+    :type url: str
+    :param session: the session to fetch with, or None for ``requests.get``
+    :type session: requests.Session or None
+    :param timeout: the connect and read timeout in seconds
+    :type timeout: float or None
+    :param retries: how many times to retry transient failures
+    :type retries: int
+    :param backoff: the delay before the first retry, in seconds
+    :type backoff: float
+    :param budget: the byte budget to charge the response body to
+    :type budget: ByteBudget or None
+    :param encode: base64url-encode the body as well as hashing it
+    :type encode: bool
+    :param chunk_size: the number of bytes to read at a time
+    :type chunk_size: int
+    :param cache: the cache to revalidate against and store the media in
+    :type cache: MediaCache or None
+    :return: the response headers and the encoder holding the media
+    :rtype: tuple
+    :raises FetchError: if the response is not 200 OK or the budget is
+        exceeded
+    :raises requests.RequestException: if the last attempt fails to connect
+    """
+    send = session.get if session is not None else requests.get
+    entry = cache.lookup(url) if cache is not None else None
+    headers = MediaCache.conditional_headers(entry) if entry is not None else {}
+    for attempt in range(retries + 1):
+        last = attempt == retries
+        try:
+            response = send(url, timeout=timeout, stream=True, headers=headers)
+        except (requests.ConnectionError, requests.Timeout):
+            if last:
+                raise
+        else:
+            try:
+                status = response.status_code
+                if status == 200:
+                    encoder = MediaEncoder(encode, _size_hint(response.headers, budget))
+                    _read(url, response, encoder, budget, chunk_size, cache)
+                    return response.headers, encoder
+                if status == 304 and entry is not None:
+                    encoder = _read_cached(cache, entry, encode, chunk_size)
+                    if encoder is not None:
+                        return MediaCache.headers(entry), encoder
+                    # The cached copy is gone or damaged: fetch it again
+                    cache.discard(url)
+                    return get_media(
+                        url,
+                        session,
+                        timeout,
+                        retries,
+                        backoff,
+                        budget,
+                        encode,
+                        chunk_size,
+                        cache,
+                    )
+                if status not in RETRY_STATUSES or last:
+                    raise FetchError(f"Failed to fetch external data: {status}", status)
+            except requests.RequestException:
+                if last:
+                    raise
+            finally:
+                response.close()
+        time.sleep(backoff * 2**attempt)
+
+
+def _read(
+    url: str,
+    response,
+    encoder: MediaEncoder,
+    budget: Optional[ByteBudget],
+    chunk_size: int,
+    cache: Optional[MediaCache],
+) -> None:
+    f = None
+    if cache is not None and MediaCache.is_cacheable(response.headers):
+        f = cache.new_file()
+    try:
+        for chunk in response.iter_content(chunk_size):
+            if budget is not None:
+                budget.charge(len(chunk))
+            encoder.update(chunk)
+            if f is not None:
+                f.write(chunk)
+    except BaseException:
+        if f is not None:
+            cache.discard_file(f)
+        raise
+    if f is not None:
+        cache.store(url, response.headers, f, encoder.digest().hex(), encoder.size)
+
+
+def _read_cached(
+    cache: MediaCache, entry: Dict[str, Any], encode: bool, chunk_size: int
+) -> Optional[MediaEncoder]:
+    encoder = MediaEncoder(encode, entry["size"])
+    try:
+        with cache.open(entry) as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                encoder.update(chunk)
+    except OSError:
+        return None
+    if encoder.digest().hex() != entry["sha256"]:
+        return None
+    return encoder
+
+
+def _size_hint(headers, budget: Optional[ByteBudget]) -> Optional[int]:
+    length = headers.get("Content-Length")
+    if length is None or not length.isdigit():
+        return None
+    # Refuse oversized bodies before downloading them
+    if budget is not None:
+        budget.check(int(length))
+    if headers.get("Content-Encoding", "identity") != "identity":
+        # the length is that of the compressed body
+        return None
+    return int(length)
+
+
+def new_async_client(pool_size: int = 10):
+    """
+    Creates an ``httpx.AsyncClient`` with up to ``pool_size`` connections.
+
+    :param pool_size: the maximum number of open connections
+    :type pool_size: int
+    :return: the client
+    :rtype: httpx.AsyncClient
+    :raises ImportError: if httpx is not installed
+    """
+    if httpx is None:
+        raise ImportError(
+            "Async fetching requires the httpx package: pip install httpx"
+        )
+    limits = httpx.Limits(
+        max_connections=pool_size, max_keepalive_connections=pool_size
+    )
+    return httpx.AsyncClient(limits=limits)
+
+
+async def aget_media(
+    url: str,
+    client: Any = None,
+    timeout: Optional[float] = DEFAULT_TIMEOUT,
+    retries: int = 0,
+    backoff: float = DEFAULT_BACKOFF,
+    budget: Optional[ByteBudget] = None,
+    encode: bool = True,
+    executor: Optional[Executor] = None,
+) -> Tuple[Any, MediaEncoder]:
+    """
+    Streams ``url`` into a :class:`~vcon.media.MediaEncoder`.
+
+    Each chunk is hashed (and encoded) in ``executor`` while the next one
+    is received. Retries work as in :func:`get_media`.
+
+    :param url: the URL to fetch
+    :type url: str
+    :param client: an ``httpx.AsyncClient``; by default one is created for
+        the call
+    :type client: httpx.AsyncClient or None
+    :param timeout: the connect and read timeout in seconds
+    :type timeout: float or None
+    :param retries: how many times to retry transient failures
+    :type retries: int
+    :param backoff: the delay before the first retry, in seconds
+    :type backoff: float
+    :param budget: the byte budget to charge the response body to
+    :type budget: ByteBudget or None
+    :param encode: base64url-encode the body as well as hashing it
+    :type encode: bool
+    :param executor: the executor for hashing and encoding, defaults to the
+        event loop's default executor
+    :type executor: concurrent.futures.Executor or None
+    :return: the response headers and the encoder holding the media
+    :rtype: tuple
+    :raises FetchError: if the response is not 200 OK or the budget is
+        exceeded
+    :raises ImportError: if no client is given and httpx is not installed
+    """
+    if client is None:
+        async with new_async_client(1) as client:
+            return await aget_media(
+                url, client, timeout, retries, backoff, budget, encode, executor
+            )
+    transient = (httpx.TransportError,) if httpx is not None else ()
+    for attempt in range(retries + 1):
+        last = attempt == retries
+        try:
+            async with client.stream("GET", url, timeout=timeout) as response:
+                status = response.status_code
+                if status == 200:
+                    size_hint = _size_hint(response.headers, budget)
+                    encoder = MediaEncoder(encode, size_hint)
+                    await _astream(response, encoder, budget, executor)
+                    return response.headers, encoder
+                if status not in RETRY_STATUSES or last:
+                    raise FetchError(f"Failed to fetch external data: {status}", status)
+        except transient:
+            if last:
+                raise
+        await asyncio.sleep(backoff * 2**attempt)
+
+
+async def _astream(
+    response, encoder: MediaEncoder, budget: Optional[ByteBudget], executor
+) -> None:
+    loop = asyncio.get_running_loop()
+    pending = None
+    try:
+        async for chunk in response.aiter_bytes():
+            if budget is not None:
+                budget.charge(len(chunk))
+            if pending is not None:
+                await pending
+            pending = loop.run_in_executor(executor, encoder.update, chunk)
+        if pending is not None:
+            await pending
+            pending = None
+    finally:
+        if pending is not None:
+            pending.cancel()
@@ -0,0 +1,129 @@
+"""
+Hash indexes over the list sections of a vCon.
+
+A :class:`FieldIndex` maps the value of one field of the entries of a list
+(``attachments``, ``analysis``, ``parties``, ...) to the positions of the
+matching entries. ``Vcon`` indexes the ``type`` of attachments and
+analysis itself and the fields passed to ``Vcon.build_index``; every other
+lookup scans the list.
+
+An index notices when the list it was built from is replaced, grows or
+shrinks, and appends made through the ``Vcon.add_*`` methods are indexed
+incrementally. Every hit is re-checked against the entry, so an entry that
+stops matching after an in-place edit is not returned. Misses are trusted:
+call ``Vcon.invalidate_indexes()`` after editing indexed fields in place so
+that entries which start matching are found.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from .paths import compile_path
+
+
+class FieldIndex:
+    """
+    Positions of the entries of a list, keyed by the value of one field.
+
+    :param path: the field to index, a field name or a path such as
+        ``meta.role``, see :func:`~vcon.paths.compile_path`
+    :type path: str
+    """
+
+    __slots__ = ("path", "_getter", "_source", "_length", "_positions", "_scan")
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._getter = compile_path(path)
+        self._source: Optional[list] = None
+        self._length = 0
+        self._positions: Dict[Any, List[int]] = {}
+        # positions of entries whose value cannot be hashed
+        self._scan: List[int] = []
+
+    def __getstate__(self):
+        return self.path
+
+    def __setstate__(self, path):
+        self.__init__(path)
+
+    def _is_current(self, source: list) -> bool:
+        return source is self._source and len(source) == self._length
+
+    def rebuild(self, source: list) -> None:
+        """
+        Indexes every entry of ``source``.
+
+        :param source: the list to index
+        :type source: list
+        """
+        self._source = source
+        self._length = 0
+        self._positions = {}
+        self._scan = []
+        for entry in source:
+            self._add(entry)
+
+    def _add(self, entry: Any) -> None:
+        position = self._length
+        self._length += 1
+        value = self._getter(entry)
+        try:
+            self._positions.setdefault(value, []).append(position)
+        except TypeError:
+            self._scan.append(position)
+
+    def appended(self, source: list) -> None:
+        """
+        Indexes the last entry of ``source`` after an append.
+
+        If the index was not up to date before the append it is left alone
+        and rebuilt on the next lookup.
+
+        :param source: the list that was appended to
+        :type source: list
+        """
+        if source is self._source and len(source) == self._length + 1:
+            self._add(source[-1])
+
+    def invalidate(self) -> None:
+        """
+        Drops the index; it is rebuilt on the next lookup.
+        """
+        self._source = None
+
+    def positions(self, source: list, value: Any) -> List[int]:
+        """
+        Returns the positions of the entries of ``source`` whose field equals
+        ``value``, in list order.
+
+        :param source: the list to search
+        :type source: list
+        :param value: the value to look for
+        :type value: Any
+        :return: the positions of the matching entries
+        :rtype: list[int]
+        """
+        if not self._is_current(source):
+            self.rebuild(source)
+        result = self._lookup(source, value)
+        if result is None:
+            # An indexed entry changed in place
+            self.rebuild(source)
+            result = self._lookup(source, value)
+        return result
+
+    def _lookup(self, source: list, value: Any) -> Optional[List[int]]:
+        getter = self._getter
+        try:
+            hits = self._positions.get(value, ())
+        except TypeError:
+            # Unhashable values can only be found by scanning
+            return [i for i, entry in enumerate(source) if getter(entry) == value]
+        for position in hits:
+            if getter(source[position]) != value:
+                return None
+        if self._scan:
+            extra = [i for i in self._scan if getter(source[i]) == value]
+            if extra:
+                return sorted([*hits, *extra])
+        return list(hits)
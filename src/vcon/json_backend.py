@@ -0,0 +1,169 @@
+"""
+Pluggable JSON backends used for vCon serialization.
+
+The stdlib ``json`` module is always available. ``orjson`` and ``ujson`` are
+registered when they are installed, and ``orjson`` becomes the default
+backend if present. A backend can be chosen per call (``backend="json"``) or
+globally with :func:`set_default_backend`.
+
+All backends raise :class:`json.JSONDecodeError` on invalid input so callers
+only need to handle one exception type.
+"""
+
+import json
+from typing import Any, Callable, Dict, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - depends on the environment
+    ujson = None
+
+
+JsonInput = Union[str, bytes, bytearray, memoryview]
+
+
+class JsonBackend:
+    """Base class for JSON backends, implemented with the stdlib ``json``."""
+
+    name = "json"
+
+    def dumps(
+        self,
+        obj: Any,
+        *,
+        as_bytes: bool = False,
+        default: Optional[Callable[[Any], Any]] = None,
+    ) -> Union[str, bytes]:
+        """
+        Serialize ``obj`` to JSON.
+
+        :param obj: the object to serialize
+        :type obj: Any
+        :param as_bytes: return UTF-8 encoded bytes instead of a str
+        :type as_bytes: bool
+        :param default: called for objects that are not JSON serializable
+        :type default: Callable or None
+        :return: the JSON document
+        :rtype: str or bytes
+        """
+        text = json.dumps(obj, default=default)
+        return text.encode("utf-8") if as_bytes else text
+
+    def loads(self, data: JsonInput) -> Any:
+        """
+        Parse a JSON document.
+
+        :param data: the JSON document
+        :type data: str, bytes, bytearray or memoryview
+        :return: the parsed object
+        :rtype: Any
+        """
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+
+class OrjsonBackend(JsonBackend):
+    name = "orjson"
+
+    def dumps(self, obj, *, as_bytes=False, default=None):
+        try:
+            data = orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # orjson is stricter than the stdlib (e.g. integers wider than
+            # 64 bits), so give the stdlib a chance before failing.
+            return super().dumps(obj, as_bytes=as_bytes, default=default)
+        return data if as_bytes else data.decode("utf-8")
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+
+class UjsonBackend(JsonBackend):
+    name = "ujson"
+
+    def dumps(self, obj, *, as_bytes=False, default=None):
+        text = ujson.dumps(obj, ensure_ascii=False, default=default)
+        return text.encode("utf-8") if as_bytes else text
+
+    def loads(self, data):
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        try:
+            return ujson.loads(data)
+        except ValueError as e:
+            if isinstance(data, (bytes, bytearray)):
+                data = bytes(data).decode("utf-8", errors="replace")
+            raise json.JSONDecodeError(str(e), data, 0) from e
+
+
+_BACKENDS: Dict[str, JsonBackend] = {}
+_default_backend: Optional[JsonBackend] = None
+
+
+def register_backend(backend: JsonBackend) -> None:
+    """
+    Register a JSON backend under its ``name``.
+
+    :param backend: the backend to register
+    :type backend: JsonBackend
+    :return: None
+    :rtype: None
+    """
+    _BACKENDS[backend.name] = backend
+
+
+def available_backends() -> List[str]:
+    """
+    Returns the names of the registered backends.
+
+    :return: the backend names
+    :rtype: list[str]
+    """
+    return list(_BACKENDS)
+
+
+def set_default_backend(name: str) -> None:
+    """
+    Select the backend used when no backend is passed explicitly.
+
+    :param name: the name of a registered backend
+    :type name: str
+    :return: None
+    :rtype: None
+    """
+    global _default_backend
+    _default_backend = get_backend(name)
+
+
+def get_backend(backend: Union[str, JsonBackend, None] = None) -> JsonBackend:
+    """
+    Resolve a backend name (or instance) to a backend.
+
+    :param backend: a backend name, a backend instance or None for the default
+    :type backend: str, JsonBackend or None
+    :return: the backend
+    :rtype: JsonBackend
+    """
+    if backend is None:
+        return _default_backend
+    if isinstance(backend, JsonBackend):
+        return backend
+    try:
+        return _BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"Unknown JSON backend: {backend}") from None
+
+
+register_backend(JsonBackend())
+if ujson is not None:
+    register_backend(UjsonBackend())
+if orjson is not None:
+    register_backend(OrjsonBackend())
+
+_default_backend = _BACKENDS["orjson" if orjson is not None else "json"]
@@ -0,0 +1,224 @@
+"""
+Lazy loading of large inline ``body`` values.
+
+:func:`loads_lazy` parses a vCon document but leaves the long ``body``
+strings of dialogs and attachments with a base64 or base64url ``encoding``
+in the source buffer. They are replaced by
+:class:`LazyBody` proxies that only remember an offset range and decode the
+text when it is asked for, so metadata-only work (routing, tagging, party
+lookups) does not pay for the size of the recordings.
+"""
+
+import re
+from typing import Any, Iterator, List, Union
+
+from .json_backend import JsonBackend
+
+# Bodies shorter than this are cheap enough to decode eagerly
+MIN_LAZY_LENGTH = 4096
+
+# Only these bodies become proxies; other matches are turned back into str
+LAZY_SECTIONS = ("dialog", "attachments")
+LAZY_ENCODINGS = ("base64", "base64url")
+
+_PLACEHOLDER_PREFIX = "\x00vcon-lazy:"
+_PLACEHOLDER_JSON = "\\u0000vcon-lazy:"
+
+# A "body" member whose value is a long run of base64/base64url characters.
+# Such a value needs no JSON unescaping, so the raw source text *is* the
+# decoded string. The lookbehind rejects "body" appearing inside another
+# (escaped) string.
+_BODY_PATTERN = r'(?<=[{,\s])"body"\s*:\s*"([A-Za-z0-9+/=_-]{%d,})"' % MIN_LAZY_LENGTH
+_STR_BODY_RE = re.compile(_BODY_PATTERN)
+_BYTES_BODY_RE = re.compile(_BODY_PATTERN.encode("ascii"))
+
+Buffer = Union[str, bytes, bytearray, memoryview]
+
+
+class LazyBody:
+    """
+    A read-only stand-in for a long ``body`` string.
+
+    Converting it with ``str()`` (or ``encode()``/``tobytes()``) reads the
+    text from the source buffer; nothing is cached, so each conversion pays
+    for one copy. The proxy keeps the source buffer alive.
+    """
+
+    __slots__ = ("_buffer", "_start", "_end")
+
+    def __init__(self, buffer: Buffer, start: int, end: int) -> None:
+        self._buffer = buffer
+        self._start = start
+        self._end = end
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __str__(self) -> str:
+        data = self._buffer[self._start : self._end]
+        if isinstance(data, str):
+            return data
+        return bytes(data).decode("ascii")
+
+    def tobytes(self) -> bytes:
+        """
+        Returns the body text as ASCII bytes.
+
+        :return: the body text
+        :rtype: bytes
+        """
+        data = self._buffer[self._start : self._end]
+        if isinstance(data, str):
+            return data.encode("ascii")
+        return bytes(data)
+
+    def encode(self, encoding: str = "utf-8", errors: str = "strict") -> bytes:
+        return self.tobytes()
+
+    def chunks(self, size: int) -> Iterator[str]:
+        """
+        Yields the body text in pieces of at most ``size`` characters.
+
+        :param size: the length of each piece
+        :type size: int
+        :return: the body text, piece by piece
+        :rtype: Iterator[str]
+        """
+        for start in range(self._start, self._end, size):
+            data = self._buffer[start : min(start + size, self._end)]
+            yield data if isinstance(data, str) else bytes(data).decode("ascii")
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, LazyBody):
+            return len(self) == len(other) and self.tobytes() == other.tobytes()
+        if isinstance(other, str):
+            return len(self) == len(other) and str(self) == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def __repr__(self) -> str:
+        return f"LazyBody(<{len(self)} characters>)"
+
+    def __copy__(self) -> "LazyBody":
+        return self
+
+    def __deepcopy__(self, memo) -> "LazyBody":
+        return self
+
+
+def json_default(obj: Any) -> Any:
+    """
+    ``default`` hook for JSON encoders that resolves :class:`LazyBody` values.
+
+    :param obj: an object the encoder cannot serialize
+    :type obj: Any
+    :return: a serializable replacement
+    :rtype: Any
+    """
+    if isinstance(obj, LazyBody):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def resolve_bodies(document: dict) -> dict:
+    """
+    Returns a shallow copy of a vCon document with :class:`LazyBody` values
+    resolved.
+
+    Only the dialog and attachment entries holding a proxy, and the lists
+    they are in, are copied; everything else is shared with ``document``.
+
+    :param document: the vCon document
+    :type document: dict
+    :return: the copy
+    :rtype: dict
+    """
+    document = dict(document)
+    for section in LAZY_SECTIONS:
+        entries = document.get(section)
+        if type(entries) is not list:
+            continue
+        resolved = [
+            (
+                {**entry, "body": str(entry["body"])}
+                if isinstance(entry, dict) and type(entry.get("body")) is LazyBody
+                else entry
+            )
+            for entry in entries
+        ]
+        if any(new is not old for new, old in zip(resolved, entries)):
+            document[section] = resolved
+    return document
+
+
+def loads_lazy(data: Buffer, backend: JsonBackend) -> Any:
+    """
+    Parse a JSON document, keeping long ``body`` strings in ``data``.
+
+    :param data: the JSON document; bytes-like buffers (including mmaps)
+        are referenced, not copied
+    :type data: str, bytes, bytearray, memoryview or mmap
+    :param backend: the JSON backend to parse the remaining text with
+    :type backend: JsonBackend
+    :return: the parsed document with :class:`LazyBody` values
+    :rtype: Any
+    """
+    text_input = isinstance(data, str)
+    if text_input:
+        pattern = _STR_BODY_RE
+    else:
+        data = memoryview(data)
+        pattern = _BYTES_BODY_RE
+
+    pieces = []
+    bodies: List[LazyBody] = []
+    pos = 0
+    for match in pattern.finditer(data):
+        start, end = match.span(1)
+        token = f"{_PLACEHOLDER_JSON}{len(bodies)}"
+        pieces.append(data[pos:start])
+        pieces.append(token if text_input else token.encode("ascii"))
+        bodies.append(LazyBody(data, start, end))
+        pos = end
+
+    if not bodies:
+        return backend.loads(data)
+    pieces.append(data[pos:])
+    document = backend.loads(("" if text_input else b"").join(pieces))
+    _restore(document, bodies)
+    return document
+
+
+def _restore(document: Any, bodies: List[LazyBody]) -> None:
+    if type(document) is dict:
+        for name in LAZY_SECTIONS:
+            entries = document.get(name)
+            if type(entries) is not list:
+                continue
+            for entry in entries:
+                if type(entry) is dict and entry.get("encoding") in LAZY_ENCODINGS:
+                    body = entry.get("body")
+                    if type(body) is str and body.startswith(_PLACEHOLDER_PREFIX):
+                        entry["body"] = _body(body, bodies)
+    # Any other matched "body" gets its text back
+    _resolve(document, bodies)
+
+
+def _body(placeholder: str, bodies: List[LazyBody]) -> LazyBody:
+    return bodies[int(placeholder[len(_PLACEHOLDER_PREFIX) :])]
+
+
+def _resolve(obj: Any, bodies: List[LazyBody]) -> None:
+    if type(obj) is dict:
+        for key, value in obj.items():
+            if type(value) is str:
+                if key == "body" and value.startswith(_PLACEHOLDER_PREFIX):
+                    obj[key] = str(_body(value, bodies))
+            else:
+                _resolve(value, bodies)
+    elif type(obj) is list:
+        for value in obj:
+            if type(value) is not str:
+                _resolve(value, bodies)
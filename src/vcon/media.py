@@ -0,0 +1,338 @@
+"""
+Helpers for base64 and base64url encoded ``body`` values.
+
+The vCon spec allows base64url bodies with or without ``=`` padding.
+:func:`decode_exact` only accepts bodies that :func:`encode` reproduces
+character for character, so code that swaps a body for its raw bytes can
+always restore the original text. :class:`MediaEncoder` hashes and encodes
+media as it arrives, for fetching external data chunk by chunk.
+"""
+
+import base64
+import binascii
+import hashlib
+from typing import Iterator, List, Optional, Tuple, Union
+
+from .lazy import LazyBody
+
+BASE64_ENCODINGS = ("base64", "base64url")
+
+# Sections of a vCon whose entries carry a body
+MEDIA_LISTS = ("dialog", "attachments", "analysis")
+
+_URL_TO_STANDARD = bytes.maketrans(b"-_", b"+/")
+
+Body = Union[str, bytes, LazyBody]
+
+
+class MediaBody(LazyBody):
+    """
+    A ``body`` value kept as raw bytes and encoded only when read.
+
+    It stands in for the base64 or base64url text like a
+    :class:`~vcon.lazy.LazyBody` does, and :meth:`raw` gives the bytes
+    without any decoding.
+
+    :param data: the raw bytes
+    :type data: bytes-like
+    :param encoding: "base64" or "base64url"
+    :type encoding: str
+    :param padded: whether the text has ``=`` padding
+    :type padded: bool
+    """
+
+    __slots__ = ("_data", "_encoding", "_padded")
+
+    def __init__(self, data, encoding: str, padded: bool = True) -> None:
+        if encoding not in BASE64_ENCODINGS:
+            raise ValueError(f"Invalid encoding: {encoding}")
+        self._data = data
+        self._encoding = encoding
+        self._padded = padded
+
+    @property
+    def padded(self) -> bool:
+        return self._padded
+
+    def raw(self):
+        """
+        Returns the raw bytes.
+
+        :return: the bytes the body encodes
+        :rtype: bytes-like
+        """
+        return self._data
+
+    def __len__(self) -> int:
+        full, rest = divmod(len(self._data), 3)
+        if not rest:
+            return 4 * full
+        return 4 * full + (4 if self._padded else rest + 1)
+
+    def __str__(self) -> str:
+        return encode(self._data, self._encoding, self._padded)
+
+    def tobytes(self) -> bytes:
+        return str(self).encode("ascii")
+
+    def chunks(self, size: int) -> Iterator[str]:
+        step = max(size // 4, 1) * 3
+        data = self._data
+        for start in range(0, len(data), step):
+            end = start + step
+            padded = self._padded or end < len(data)
+            yield encode(data[start:end], self._encoding, padded)
+
+    def __repr__(self) -> str:
+        return f"MediaBody(<{len(self._data)} bytes>)"
+
+
+def encode(data: bytes, encoding: str, padded: bool = True) -> str:
+    """
+    Encodes raw bytes as a ``body`` string.
+
+    :param data: the raw bytes
+    :type data: bytes-like
+    :param encoding: "base64" or "base64url"
+    :type encoding: str
+    :param padded: keep the trailing ``=`` padding
+    :type padded: bool
+    :return: the encoded text
+    :rtype: str
+    """
+    if encoding == "base64url":
+        text = base64.urlsafe_b64encode(data)
+    elif encoding == "base64":
+        text = base64.b64encode(data)
+    else:
+        raise ValueError(f"Invalid encoding: {encoding}")
+    if not padded:
+        text = text.rstrip(b"=")
+    return text.decode("ascii")
+
+
+def signature(digest: bytes) -> str:
+    """
+    Formats a SHA-256 digest as a dialog ``signature``.
+
+    :param digest: the raw digest
+    :type digest: bytes
+    :return: the base64url encoded digest
+    :rtype: str
+    """
+    return base64.urlsafe_b64encode(digest).decode()
+
+
+def encoded_length(size: int) -> int:
+    """
+    Returns the length of the padded base64 encoding of ``size`` bytes.
+
+    :param size: the number of raw bytes
+    :type size: int
+    :return: the number of base64 characters
+    :rtype: int
+    """
+    return (size + 2) // 3 * 4
+
+
+class MediaEncoder:
+    """
+    Hashes media with SHA-256 and base64url-encodes it chunk by chunk.
+
+    Chunks may have any size: bytes left over from a chunk whose length is
+    not a multiple of 3 are carried into the next one, so the output is
+    exactly ``base64.urlsafe_b64encode(data)``. The text is written into a
+    single buffer, sized up front when ``size_hint`` is given, so at most
+    the encoded media and one chunk are held while encoding.
+
+    :param encode: build the body text as well as the hash
+    :type encode: bool
+    :param size_hint: the expected number of raw bytes, if known
+    :type size_hint: int or None
+    """
+
+    def __init__(self, encode: bool = True, size_hint: Optional[int] = None) -> None:
+        self._hash = hashlib.sha256()
+        self._encode = encode
+        presize = encoded_length(size_hint) if encode and size_hint else 0
+        self._buffer = bytearray(presize)
+        self._length = 0
+        self._carry = b""
+        self._text: Optional[str] = None
+        self.size = 0
+
+    def update(self, chunk: bytes) -> None:
+        """
+        Adds the next chunk of media.
+
+        :param chunk: the data
+        :type chunk: bytes-like
+        """
+        self._hash.update(chunk)
+        self.size += len(chunk)
+        if not self._encode:
+            return
+        if self._carry:
+            chunk = self._carry + chunk
+        cut = len(chunk) - len(chunk) % 3
+        self._carry = bytes(chunk[cut:])
+        if cut:
+            with memoryview(chunk) as view:
+                self._write(base64.urlsafe_b64encode(view[:cut]))
+
+    def _write(self, encoded: bytes) -> None:
+        end = self._length + len(encoded)
+        # Grows the buffer if the size hint was too small
+        self._buffer[self._length : end] = encoded
+        self._length = end
+
+    def digest(self) -> bytes:
+        """
+        Returns the SHA-256 digest of the media added so far.
+
+        :return: the raw digest
+        :rtype: bytes
+        """
+        return self._hash.digest()
+
+    def signature(self) -> str:
+        """
+        Returns the ``signature`` of the media added so far.
+
+        :return: the base64url encoded SHA-256 digest
+        :rtype: str
+        """
+        return signature(self._hash.digest())
+
+    def body(self) -> str:
+        """
+        Returns the base64url encoded media.
+
+        The encoder is finished by this call: the text is built once, the
+        buffer released, and further :meth:`update` calls are not allowed.
+
+        :return: the body text
+        :rtype: str
+        """
+        if self._text is None:
+            if self._carry:
+                self._write(base64.urlsafe_b64encode(self._carry))
+                self._carry = b""
+            buffer = self._buffer
+            if self._length == len(buffer):
+                self._text = buffer.decode("ascii")
+            else:
+                with memoryview(buffer) as view:
+                    self._text = str(view[: self._length], "ascii")
+            self._buffer = bytearray()
+        return self._text
+
+
+def _as_bytes(body: Body) -> bytes:
+    if isinstance(body, LazyBody):
+        return body.tobytes()
+    if isinstance(body, str):
+        return body.encode("ascii")
+    return body
+
+
+def decode(body: Body, encoding: str) -> bytes:
+    """
+    Decodes a ``body`` string, with or without padding.
+
+    :param body: the encoded text
+    :type body: str, bytes or LazyBody
+    :param encoding: "base64" or "base64url"
+    :type encoding: str
+    :return: the raw bytes
+    :rtype: bytes
+    """
+    if isinstance(body, MediaBody) and body._encoding == encoding:
+        return bytes(body.raw())
+    data = _as_bytes(body)
+    data += b"=" * (-len(data) % 4)
+    if encoding == "base64url":
+        return base64.urlsafe_b64decode(data)
+    if encoding == "base64":
+        return base64.b64decode(data)
+    raise ValueError(f"Invalid encoding: {encoding}")
+
+
+def decode_exact(body: Body, encoding: str) -> Optional[Tuple[bytes, bool]]:
+    """
+    Decodes a ``body`` string if it can be re-encoded exactly.
+
+    :param body: the encoded text
+    :type body: str, bytes or LazyBody
+    :param encoding: "base64" or "base64url"
+    :type encoding: str
+    :return: the raw bytes and whether the text was padded, or None if the
+        text is not valid or not in canonical form
+    :rtype: tuple or None
+    """
+    if encoding not in BASE64_ENCODINGS:
+        return None
+    if isinstance(body, MediaBody) and body._encoding == encoding:
+        return bytes(body.raw()), body.padded
+    try:
+        text = _as_bytes(body)
+    except UnicodeEncodeError:
+        return None
+    padded = len(text) % 4 == 0
+    if not padded:
+        text += b"=" * (-len(text) % 4)
+    if encoding == "base64url":
+        if b"+" in text or b"/" in text:
+            return None
+        text = text.translate(_URL_TO_STANDARD)
+    try:
+        data = binascii.a2b_base64(text)
+    except binascii.Error:
+        return None
+    # Compare in the standard alphabet; the decoder skips stray characters
+    if binascii.b2a_base64(data, newline=False) != text:
+        return None
+    return data, padded
+
+
+def extract_bodies(
+    vcon_dict: dict, min_length: int = 0
+) -> Tuple[dict, List[Tuple[str, int, bytes, bool]]]:
+    """
+    Takes the base64 and base64url bodies out of a vCon document.
+
+    Only bodies that :func:`decode_exact` accepts are taken, so putting
+    ``encode(data, encoding, padded)`` back restores the original text.
+    ``vcon_dict`` is not modified: the returned document is a shallow copy
+    in which the affected lists and entries are copied and the bodies set
+    to None.
+
+    :param vcon_dict: the vCon document
+    :type vcon_dict: dict
+    :param min_length: bodies shorter than this are left in place
+    :type min_length: int
+    :return: the document and a ``(list, index, data, padded)`` tuple for
+        each body taken out
+    :rtype: tuple
+    """
+    document = dict(vcon_dict)
+    extracted = []
+    for name in MEDIA_LISTS:
+        entries = document.get(name)
+        if type(entries) is not list:
+            continue
+        for index, entry in enumerate(entries):
+            if type(entry) is not dict:
+                continue
+            body = entry.get("body")
+            if not isinstance(body, (str, LazyBody)) or len(body) < min_length:
+                continue
+            decoded = decode_exact(body, entry.get("encoding"))
+            if decoded is None:
+                continue
+            if entries is vcon_dict.get(name):
+                entries = document[name] = list(entries)
+            entry = entries[index] = dict(entry)
+            entry["body"] = None
+            extracted.append((name, index, *decoded))
+    return document, extracted
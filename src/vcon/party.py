@@ -1,9 +1,33 @@
+from itertools import chain
 from typing import Optional
 from vcon.civic_address import CivicAddress
 from datetime import datetime
 
 
 class Party:
+    """
+    A party to a vCon.
+
+    ``tel`` and ``name`` are stored in slots; the other fields go to the
+    instance ``__dict__``. Fields that are None are left unset.
+    """
+
+    FIELDS = (
+        "tel",
+        "stir",
+        "mailto",
+        "name",
+        "validation",
+        "gmlpos",
+        "civicaddress",
+        "uuid",
+        "role",
+        "contact_list",
+        "meta",
+    )
+
+    __slots__ = ("tel", "name", "__dict__")
+
     def __init__(
         self,
         tel: Optional[str] = None,
@@ -44,31 +68,77 @@ class Party:
         :type contact_list: str | None
         :param kwargs: Additional attributes to be set on the party
         """
-        # copy the named parameters that are not None
-        for key, value in locals().items():
-            if value is not None and key not in ("self", "kwargs"):
-                setattr(self, key, value)
+        # set the named parameters that are not None
+        if tel is not None:
+            self.tel = tel
+        if stir is not None:
+            self.stir = stir
+        if mailto is not None:
+            self.mailto = mailto
+        if name is not None:
+            self.name = name
+        if validation is not None:
+            self.validation = validation
+        if gmlpos is not None:
+            self.gmlpos = gmlpos
+        if civicaddress is not None:
+            self.civicaddress = civicaddress
+        if uuid is not None:
+            self.uuid = uuid
+        if role is not None:
+            self.role = role
+        if contact_list is not None:
+            self.contact_list = contact_list
+        if meta is not None:
+            self.meta = meta
 
         # copy any additional kwargs
         for key, value in kwargs.items():
             if value is not None:
                 setattr(self, key, value)
 
+    @classmethod
+    def from_dict(cls, party_dict: dict) -> "Party":
+        """
+        Build a Party from its dictionary form, like ``Party(**party_dict)``.
+
+        :param party_dict: the party as stored in a vCon
+        :type party_dict: dict
+        :return: the party
+        :rtype: Party
+        """
+        party = cls.__new__(cls)
+        for key, value in party_dict.items():
+            if value is not None:
+                setattr(party, key, value)
+        return party
+
     def to_dict(self):
-        # copy the attributes that are not None
+        # copy the attributes that are not None, slotted fields first
         # TODO: should we allow changing the values of the object?
         #       for now, we just use the values that are not None
         #       and ignore the other values
         #       (this is also how the old code worked)
-        party_dict = {}
-        for key, value in self.__dict__.items():
-            # Don't include self in the dict
-            if value is not None and key != "self":
-                party_dict[key] = value
-        return party_dict
+        slotted = ((key, getattr(self, key, None)) for key in ("tel", "name"))
+        return {
+            key: value
+            for key, value in chain(slotted, self.__dict__.items())
+            if value is not None
+        }
 
 
 class PartyHistory:
+    """
+    A party event in a dialog's ``party_history``.
+
+    Extension fields, which only come in through :meth:`from_dict`, are
+    kept in the instance ``__dict__``.
+    """
+
+    FIELDS = ("party", "event", "time")
+
+    __slots__ = FIELDS + ("__dict__",)
+
     def __init__(self, party: int, event: str, time: datetime):
         """
         Initialize a new PartyHistory object.
@@ -84,5 +154,26 @@ class PartyHistory:
         self.event = event
         self.time = time
 
+    @classmethod
+    def from_dict(cls, history_dict: dict) -> "PartyHistory":
+        """
+        Build a PartyHistory from its dictionary form.
+
+        :param history_dict: the party event as stored in a vCon
+        :type history_dict: dict
+        :return: the party event
+        :rtype: PartyHistory
+        """
+        history = cls(
+            history_dict["party"], history_dict["event"], history_dict["time"]
+        )
+        if len(history_dict) > len(cls.FIELDS):
+            for key, value in history_dict.items():
+                if key not in cls.FIELDS:
+                    setattr(history, key, value)
+        return history
+
     def to_dict(self):
-        return {"party": self.party, "event": self.event, "time": self.time}
+        history_dict = {"party": self.party, "event": self.event, "time": self.time}
+        history_dict.update(self.__dict__)
+        return history_dict
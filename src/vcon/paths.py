@@ -0,0 +1,153 @@
+"""
+Precompiled accessors for nested fields.
+
+:func:`compile_path` turns a path such as ``"civicaddress.country"`` or
+``"meta.tags[0]"`` into a function that reads that field from an object.
+Paths are parsed once and the accessors cached, so repeated lookups skip
+the string parsing entirely. Path syntax and lookup rules follow
+``pydash.get``:
+
+- ``.`` separates keys; ``\\.`` is a literal dot inside a key
+- ``[n]`` is a list index
+- a key missing from a dict is retried as an integer (``"a.0"`` finds
+  ``{"a": {0: ...}}``), and a key on a list or string is used as an index
+- other objects are read by item, then by attribute
+- a missing field anywhere along the path yields the default
+"""
+
+import re
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from typing import Any, Callable, List, Tuple, Union
+
+_MISSING = object()
+
+_DELIMITER_RE = re.compile(r"(?<!\\)(?:\\\\)*\.|(\[-?\d+\])")
+_INDEX_RE = re.compile(r"\[(-?\d+)\]")
+
+Key = Union[str, int]
+Accessor = Callable[..., Any]
+
+
+def parse_path(path: str) -> Tuple[Key, ...]:
+    """
+    Splits a path into its keys.
+
+    :param path: the path, e.g. ``"meta.tags[0]"``
+    :type path: str
+    :return: the keys; list indexes are ints
+    :rtype: tuple
+    """
+    if "." not in path and "[" not in path:
+        return (path,)
+    parts = _DELIMITER_RE.split(path)
+    keys: List[Key] = []
+    for i, part in enumerate(parts):
+        if part is None:
+            continue
+        if part == "":
+            previous = parts[i - 1] if i else None
+            following = parts[i + 1] if i + 1 < len(parts) else None
+            if previous is not None and following is not None:
+                continue
+            if _is_index(previous) or _is_index(following):
+                continue
+        index = _INDEX_RE.fullmatch(part)
+        if index:
+            keys.append(int(index.group(1)))
+        else:
+            keys.append(part.replace("\\.", "."))
+    return tuple(keys)
+
+
+def _is_index(part) -> bool:
+    return part is not None and _INDEX_RE.fullmatch(part) is not None
+
+
+def _get_item(obj: Any, key: Key) -> Any:
+    try:
+        return obj[key]
+    except Exception:
+        pass
+    if not isinstance(key, int):
+        try:
+            return obj[int(key)]
+        except Exception:
+            pass
+    return _MISSING
+
+
+def _step(obj: Any, key: Key) -> Any:
+    if isinstance(obj, dict):
+        value = obj.get(key, _MISSING)
+        if value is _MISSING and not isinstance(key, int):
+            try:
+                value = obj.get(int(key), _MISSING)
+            except Exception:
+                pass
+        return value
+    if isinstance(obj, (Mapping, Sequence)) and not (
+        isinstance(obj, tuple) and hasattr(obj, "_fields")
+    ):
+        return _get_item(obj, key)
+    value = _get_item(obj, key)
+    if value is _MISSING and isinstance(key, str) and not key.startswith("__"):
+        value = getattr(obj, key, _MISSING)
+    return value
+
+
+@lru_cache(maxsize=1024)
+def compile_path(path: str) -> Accessor:
+    """
+    Returns a cached accessor for ``path``.
+
+    The accessor is called as ``accessor(obj, default=None)`` and returns
+    the field at ``path`` in ``obj``, or ``default`` when any part of the
+    path is missing.
+
+    :param path: the path, e.g. ``"civicaddress.country"``
+    :type path: str
+    :return: the accessor
+    :rtype: Callable
+    """
+    keys = parse_path(path)
+
+    if len(keys) == 1:
+        (key,) = keys
+
+        def accessor(obj: Any, default: Any = None) -> Any:
+            if type(obj) is dict and key in obj:
+                return obj[key]
+            value = _step(obj, key)
+            return default if value is _MISSING else value
+
+    else:
+
+        def accessor(obj: Any, default: Any = None) -> Any:
+            for key in keys:
+                if type(obj) is dict and key in obj:
+                    obj = obj[key]
+                    continue
+                obj = _step(obj, key)
+                if obj is _MISSING:
+                    return default
+            return obj
+
+    accessor.path = path
+    return accessor
+
+
+def get(obj: Any, path: str, default: Any = None) -> Any:
+    """
+    Reads the field at ``path`` in ``obj``, like ``pydash.get``.
+
+    :param obj: the object to read from
+    :type obj: Any
+    :param path: the path, e.g. ``"civicaddress.country"``
+    :type path: str
+    :param default: returned when the path does not exist
+    :type default: Any
+    :return: the value at ``path``, or ``default``
+    :rtype: Any
+    """
+    return compile_path(path)(obj, default)
@@ -0,0 +1,253 @@
+"""
+Event-based loading of vCon documents for validation.
+
+:func:`load_skeleton` walks a JSON document with ``ijson`` and rebuilds it
+without the (potentially huge) ``body`` values of dialogs, attachments and
+analysis entries. The result has the same shape as the full document, so
+``Vcon.is_valid`` produces the same errors for it.
+
+Long ``body`` strings are cut out of the byte stream by :class:`BodyEliding`
+before ``ijson`` sees them, so they are never built as Python strings.
+Memory use is bounded by the metadata plus ``min_elided`` bytes and one read
+chunk, however large the media is.
+
+``ijson`` is an optional dependency: ``pip install ijson``.
+"""
+
+import json
+import re
+from typing import IO, Any, FrozenSet
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - depends on the environment
+    ijson = None
+
+SKIPPED_PATHS = frozenset(
+    ("dialog.item.body", "attachments.item.body", "analysis.item.body")
+)
+
+# Stands in for skipped values; validation only checks that "body" exists
+PLACEHOLDER = ""
+
+# "body" strings at least this long are elided from the byte stream
+MIN_ELIDED_LENGTH = 4096
+CHUNK_SIZE = 64 * 1024
+
+_START_EVENTS = ("start_map", "start_array")
+_END_EVENTS = ("end_map", "end_array")
+
+
+_SPECIAL = re.compile(rb'["\\]')
+_WHITESPACE = b" \t\n\r"
+
+# States of BodyEliding
+_OUTSIDE, _STRING, _VALUE, _ELIDING = range(4)
+
+
+class BodyEliding:
+    """
+    A binary reader that replaces long ``body`` string values with ``""``.
+
+    It scans the JSON text of ``fp`` as it is read, keeping at most
+    ``min_length`` bytes of a ``body`` value until it knows whether the value
+    is long enough to drop. Strings are found with a regular expression, so
+    base64 media passes through at C speed.
+
+    :param fp: a file object opened in binary mode
+    :type fp: IO[bytes]
+    :param min_length: the length from which values are dropped
+    :type min_length: int
+    """
+
+    def __init__(self, fp: IO[bytes], min_length: int = MIN_ELIDED_LENGTH) -> None:
+        self._fp = fp
+        self._min_length = min_length
+        self._state = _OUTSIDE
+        # Bytes of the current string, kept while it may be "body" or a
+        # short body value
+        self._text = bytearray()
+        # Whether the last byte read was an escaping backslash
+        self._escaped = False
+        # Progress through ':' and '"' after a "body" key: 0 none, 1 key
+        # read, 2 colon read
+        self._after_key = 0
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Reads filtered data.
+
+        :param size: the number of bytes to read from the underlying file,
+            or a negative number for one chunk
+        :type size: int
+        :return: the filtered data, empty at the end of the file
+        :rtype: bytes
+        """
+        if size == 0:
+            return b""
+        while True:
+            data = self._fp.read(size if size > 0 else CHUNK_SIZE)
+            if not data:
+                return b""
+            out = self._filter(data)
+            if out:
+                return out
+
+    def _filter(self, data: bytes) -> bytes:
+        out = bytearray()
+        pos = 0
+        n = len(data)
+        if self._escaped:
+            self._escaped = False
+            self._append(out, data[:1])
+            pos = 1
+        while pos < n:
+            if self._state == _OUTSIDE:
+                pos = self._outside(data, pos, out)
+                continue
+            match = _SPECIAL.search(data, pos)
+            end = match.start() if match is not None else n
+            self._append(out, data[pos:end])
+            if match is None:
+                break
+            if data[end] == 0x5C:  # backslash: keep it and the next byte
+                if end + 1 == n:
+                    self._append(out, data[end:])
+                    self._escaped = True
+                    break
+                self._append(out, data[end : end + 2])
+                pos = end + 2
+                continue
+            self._close(out)
+            pos = end + 1
+        return bytes(out)
+
+    def _outside(self, data: bytes, pos: int, out: bytearray) -> int:
+        if self._after_key:
+            byte = data[pos : pos + 1]
+            if byte in _WHITESPACE:
+                out += byte
+                return pos + 1
+            if byte == b":" and self._after_key == 1:
+                self._after_key = 2
+                out += byte
+                return pos + 1
+            value = byte == b'"' and self._after_key == 2
+            self._after_key = 0
+            if value:
+                out += byte
+                self._state = _VALUE
+                return pos + 1
+        quote = data.find(b'"', pos)
+        if quote < 0:
+            out += data[pos:]
+            return len(data)
+        out += data[pos : quote + 1]
+        self._state = _STRING
+        return quote + 1
+
+    def _append(self, out: bytearray, part: bytes) -> None:
+        state = self._state
+        if state == _STRING:
+            out += part
+            if len(self._text) < 5:
+                self._text += part[:5]
+        elif state == _VALUE:
+            self._text += part
+            if len(self._text) >= self._min_length:
+                self._text = bytearray()
+                self._state = _ELIDING
+
+    def _close(self, out: bytearray) -> None:
+        state = self._state
+        if state == _STRING:
+            if self._text == b"body":
+                self._after_key = 1
+        elif state == _VALUE:
+            out += self._text
+        out += b'"'
+        self._text = bytearray()
+        self._state = _OUTSIDE
+
+
+def load_skeleton(
+    fp: IO[bytes],
+    skip: FrozenSet[str] = SKIPPED_PATHS,
+    min_elided: int = MIN_ELIDED_LENGTH,
+) -> Any:
+    """
+    Parse a JSON document from a binary file object, dropping skipped values.
+
+    ``body`` strings of ``min_elided`` bytes or more are dropped from the
+    input wherever they appear and read as :data:`PLACEHOLDER`; validation
+    never looks at their content.
+
+    :param fp: a file object opened in binary mode
+    :type fp: IO[bytes]
+    :param skip: ijson prefixes (e.g. "dialog.item.body") whose values are
+        replaced by :data:`PLACEHOLDER` instead of being built
+    :type skip: frozenset[str]
+    :param min_elided: the length of ``body`` strings dropped before parsing
+    :type min_elided: int
+    :return: the parsed document
+    :rtype: Any
+    :raises ImportError: if ijson is not installed
+    :raises json.JSONDecodeError: if the document is not valid JSON
+    """
+    if ijson is None:
+        raise ImportError(
+            "Streaming validation requires the ijson package: pip install ijson"
+        )
+    try:
+        events = ijson.parse(BodyEliding(fp, min_elided), use_float=True)
+        return _build(iter(events), skip)
+    except ijson.JSONError as e:
+        raise json.JSONDecodeError(str(e), "", 0) from e
+
+
+def _build(events, skip):
+    root = None
+    containers = []
+    keys = []
+
+    for prefix, event, value in events:
+        if event == "map_key":
+            keys[-1] = value
+            continue
+        if event in _END_EVENTS:
+            containers.pop()
+            keys.pop()
+            continue
+
+        if prefix in skip:
+            if event in _START_EVENTS:
+                _skip_container(events)
+            event, value = "skipped", PLACEHOLDER
+        elif event == "start_map":
+            value = {}
+        elif event == "start_array":
+            value = []
+
+        if not containers:
+            root = value
+        elif keys[-1] is None:
+            containers[-1].append(value)
+        else:
+            containers[-1][keys[-1]] = value
+
+        if event in _START_EVENTS:
+            containers.append(value)
+            keys.append(None)
+
+    return root
+
+
+def _skip_container(events) -> None:
+    depth = 1
+    for _, event, _ in events:
+        if event in _START_EVENTS:
+            depth += 1
+        elif event in _END_EVENTS:
+            depth -= 1
+            if depth == 0:
+                return
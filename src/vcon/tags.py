@@ -0,0 +1,223 @@
+"""
+Dictionary view of the tags of a vCon.
+
+Tags are stored as ``"name:value"`` strings in the body of the ``tags``
+attachment. :class:`TagMap` parses that list once and keeps a name to
+position map next to it, so reads are constant time and writes update the
+list in place: the attachment always holds the spec's string list, and
+serializing the vCon needs no extra step.
+"""
+
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Union
+
+
+class TagMap(MutableMapping):
+    """
+    A write-through ``name -> value`` view of a vCon's tags attachment.
+
+    Setting a tag replaces an existing tag of the same name instead of
+    adding a second one. Values are everything after the first colon, so
+    values containing colons survive a round trip.
+
+    The view re-reads the attachment when the attachments list, the tags
+    attachment or its body list is replaced or changes length, and when a
+    tag it reads was edited in place. Call :meth:`refresh` after renaming
+    tags in place or turning another attachment into the tags attachment.
+
+    :param vcon: the vCon whose tags to expose
+    :type vcon: Vcon
+    """
+
+    def __init__(self, vcon) -> None:
+        self._vcon = vcon
+        self._attachments: Optional[list] = None
+        self._attachments_length = -1
+        self._index = -1
+        self._attachment: Optional[dict] = None
+        self._body: Optional[list] = None
+        self._length = -1
+        self._values: Dict[str, str] = {}
+        self._positions: Dict[str, int] = {}
+        # positions of later tags repeating an earlier tag's name
+        self._duplicates: Dict[str, List[int]] = {}
+
+    def _is_current(self) -> bool:
+        attachments = self._vcon.vcon_dict.get("attachments")
+        if (
+            attachments is not self._attachments
+            or len(attachments) != self._attachments_length
+        ):
+            return False
+        attachment = self._attachment
+        if attachment is None:
+            return True
+        body = attachment.get("body")
+        return (
+            attachments[self._index] is attachment
+            and attachment.get("type") == "tags"
+            and body is self._body
+            and len(body) == self._length
+        )
+
+    def _sync(self) -> None:
+        if not self._is_current():
+            self._reparse()
+
+    def _reparse(self) -> None:
+        attachments = self._vcon.vcon_dict.get("attachments") or []
+        self._attachments = attachments
+        self._attachments_length = len(attachments)
+        for i, attachment in enumerate(attachments):
+            if isinstance(attachment, dict) and attachment.get("type") == "tags":
+                self._index = i
+                self._parse(attachment)
+                return
+        self._index = -1
+        self._parse(None)
+
+    def _parse(self, attachment: Optional[dict]) -> None:
+        self._attachment = attachment
+        self._body = body = attachment["body"] if attachment is not None else None
+        self._length = len(body) if body is not None else 0
+        self._values = {}
+        self._positions = {}
+        self._duplicates = {}
+        for i, tag in enumerate(body or ()):
+            if not isinstance(tag, str):
+                continue
+            name, sep, value = tag.partition(":")
+            if not sep:
+                continue
+            if name in self._positions:
+                self._duplicates.setdefault(name, []).append(i)
+            else:
+                self._positions[name] = i
+                self._values[name] = value
+
+    def refresh(self) -> None:
+        """
+        Re-reads the tags attachment on the next access.
+        """
+        self._attachments = None
+
+    def _ensure_body(self) -> list:
+        self._sync()
+        if self._body is None:
+            self._vcon.vcon_dict["attachments"].append(
+                {"type": "tags", "body": [], "encoding": "json"}
+            )
+            self._vcon._appended("attachments")
+            self._sync()
+        return self._body
+
+    def _lookup(self, name: object) -> Optional[str]:
+        self._sync()
+        value = self._values.get(name)
+        if value is not None and self._body[self._positions[name]] != f"{name}:{value}":
+            # the tag string was edited in place
+            self._parse(self._attachment)
+            value = self._values.get(name)
+        return value
+
+    def __getitem__(self, name: str) -> str:
+        value = self._lookup(name)
+        if value is None:
+            raise KeyError(name)
+        return value
+
+    def __contains__(self, name: object) -> bool:
+        return self._lookup(name) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        self._sync()
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        self._sync()
+        return len(self._values)
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        self.set_tag(name, value)
+
+    def __delitem__(self, name: str) -> None:
+        if name not in self:
+            raise KeyError(name)
+        self.remove_tag(name)
+
+    def __repr__(self) -> str:
+        self._sync()
+        return f"TagMap({self._values!r})"
+
+    def set_tag(self, name: str, value: Any) -> None:
+        """
+        Sets a tag, replacing any existing tag with the same name.
+
+        :param name: the name of the tag
+        :type name: str
+        :param value: the value of the tag, stored as a string
+        :type value: Any
+        :return: None
+        :rtype: None
+        """
+        body = self._ensure_body()
+        self._lookup(name)
+        value = f"{value}"
+        tag = f"{name}:{value}"
+        position = self._positions.get(name)
+        if position is None:
+            self._positions[name] = len(body)
+            body.append(tag)
+            self._length += 1
+        else:
+            body[position] = tag
+            if name in self._duplicates:
+                self._delete(self._duplicates[name])
+        self._values[name] = value
+
+    def remove_tag(self, name: str) -> Optional[str]:
+        """
+        Removes a tag and any duplicates of it.
+
+        :param name: the name of the tag
+        :type name: str
+        :return: the removed value, or None if there was no such tag
+        :rtype: str or None
+        """
+        value = self._lookup(name)
+        if value is None:
+            return None
+        self._delete([self._positions[name], *self._duplicates.get(name, ())])
+        return value
+
+    def update_tags(
+        self,
+        tags: Union[Mapping[str, Any], Iterable[tuple]] = (),
+        **kwargs: Any,
+    ) -> None:
+        """
+        Sets several tags at once, like ``dict.update``.
+
+        :param tags: a mapping or an iterable of ``(name, value)`` pairs
+        :type tags: Mapping or Iterable[tuple]
+        :param kwargs: more tags
+        :return: None
+        :rtype: None
+        """
+        for name, value in dict(tags, **kwargs).items():
+            self.set_tag(name, value)
+
+    def to_list(self) -> List[str]:
+        """
+        Returns the tags in the spec's ``"name:value"`` list form.
+
+        :return: a copy of the tags attachment body
+        :rtype: list[str]
+        """
+        self._sync()
+        return list(self._body or ())
+
+    def _delete(self, positions: List[int]) -> None:
+        for position in sorted(positions, reverse=True):
+            del self._body[position]
+        self._parse(self._attachment)
@@ -0,0 +1,108 @@
+"""
+Fast parsing of vCon timestamps.
+
+vCon timestamps are almost always canonical RFC 3339 strings such as
+``2024-10-20T15:02:54.888840+00:00``. :func:`parse_timestamp` parses those
+with a strict regular expression and only falls back to
+``dateutil.parser.parse`` for anything else, so the results (and the errors
+raised for bad input) are the same as with dateutil alone. Results are kept
+in an LRU cache because the same timestamps tend to repeat across a vCon.
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Optional
+
+from dateutil import parser
+
+CACHE_SIZE = 4096
+
+_RFC3339_RE = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})[Tt ](\d{2}):(\d{2}):(\d{2})"
+    r"(?:[.,](\d+))?"
+    r"(?:([Zz])|([+-])(\d{2}):(\d{2}))?",
+    re.ASCII,
+)
+
+_UTC = timezone.utc
+
+
+def _parse_rfc3339(value: str) -> Optional[datetime]:
+    match = _RFC3339_RE.fullmatch(value)
+    if match is None:
+        return None
+    year, month, day, hour, minute, second, fraction, zulu, sign, tzh, tzm = (
+        match.groups()
+    )
+    if zulu:
+        tzinfo = _UTC
+    elif sign:
+        offset_hours, offset_minutes = int(tzh), int(tzm)
+        if offset_hours > 23 or offset_minutes > 59:
+            return None
+        offset = timedelta(hours=offset_hours, minutes=offset_minutes)
+        tzinfo = timezone(-offset if sign == "-" else offset)
+    else:
+        tzinfo = None
+    microsecond = int(fraction[:6].ljust(6, "0")) if fraction else 0
+    try:
+        return datetime(
+            int(year),
+            int(month),
+            int(day),
+            int(hour),
+            int(minute),
+            int(second),
+            microsecond,
+            tzinfo,
+        )
+    except ValueError:
+        # Out of range fields; let dateutil produce its usual error
+        return None
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse_cached(value: str) -> datetime:
+    result = _parse_rfc3339(value)
+    if result is None:
+        result = parser.parse(value)
+    return result
+
+
+def parse_timestamp(value: Any) -> datetime:
+    """
+    Parse a timestamp, like ``dateutil.parser.parse`` but faster for
+    RFC 3339 strings.
+
+    :param value: the timestamp
+    :type value: str
+    :return: the parsed datetime
+    :rtype: datetime
+    :raises dateutil.parser.ParserError: if the timestamp cannot be parsed
+    """
+    if type(value) is not str:
+        return parser.parse(value)
+    return _parse_cached(value)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def normalize_timestamp(value: str) -> str:
+    """
+    Returns a timestamp string in ISO 8601 format.
+
+    :param value: the timestamp
+    :type value: str
+    :return: ``parse_timestamp(value).isoformat()``
+    :rtype: str
+    :raises dateutil.parser.ParserError: if the timestamp cannot be parsed
+    """
+    return parse_timestamp(value).isoformat()
+
+
+def clear_cache() -> None:
+    """
+    Empties the timestamp caches.
+    """
+    _parse_cached.cache_clear()
+    normalize_timestamp.cache_clear()
@@ -1,22 +1,37 @@
 from __future__ import annotations
 
+import asyncio
 import copy
-from dateutil import parser
 import json
-from typing import Optional, Union, Any
+import os
+from mmap import ACCESS_READ, mmap as memory_map
+from typing import Iterator, Optional, Union, Any
 import hashlib
 import time
 import uuid6
 from datetime import datetime
 from datetime import timezone
-from pydash import get as _get
 import base64
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
+import requests
 from authlib.jose import JsonWebSignature
 from authlib.jose.errors import BadSignatureError
 from cryptography.hazmat.primitives.asymmetric import rsa
 from cryptography.hazmat.primitives import serialization
+from . import codecs, container, fetch, verify
+from .cache import MediaCache
 from .party import Party
-from .dialog import Dialog
+from .dialog import Dialog, DialogList
+from .json_backend import JsonBackend, get_backend
+from .copying import CopyOnWriteDict, cow_view, deep_copy
+from .indexes import FieldIndex
+from .paths import compile_path
+from .streaming import load_skeleton
+from .tags import TagMap
+from .lazy import json_default, loads_lazy, resolve_bodies
+from .timestamps import normalize_timestamp
+from .validation import DEFAULT_VALIDATOR
+from .writer import CHUNK_SIZE, iter_json, write_json
 
 _LAST_V8_TIMESTAMP = None
 
@@ -36,22 +51,32 @@ class Attachment:
 
 
 class Vcon:
-    def __init__(self, vcon_dict={}) -> None:
-        # deep copy
+    def __init__(self, vcon_dict: Optional[dict] = None, *, copy: bool = True) -> None:
         """
         Initialize a Vcon object from a dictionary.
 
+        By default the dictionary is deep copied, so later changes to
+        ``vcon_dict`` do not affect the Vcon and vice versa. With
+        ``copy=False`` the Vcon takes ownership of ``vcon_dict`` instead:
+        it is normalized in place (``created_at``, ``attachments``) and
+        used as ``vcon_dict`` directly, so the caller must not keep
+        mutating it. This skips a full serialize/parse pass, which matters
+        for vCons carrying large inline bodies.
+
         :param vcon_dict: a dictionary representing a vCon
         :type vcon_dict: dict
+        :param copy: deep copy ``vcon_dict`` (True) or adopt it as-is (False)
+        :type copy: bool
         """
+        if vcon_dict is None:
+            vcon_dict = {}
+
         # If the vcon_dict contains a created_at in datetime or in string, format it like a ISO 8601
         if vcon_dict.get("created_at"):
             if isinstance(vcon_dict["created_at"], datetime):
                 vcon_dict["created_at"] = vcon_dict["created_at"].isoformat()
             elif isinstance(vcon_dict["created_at"], str):
-                vcon_dict["created_at"] = parser.parse(
-                    vcon_dict["created_at"]
-                ).isoformat()
+                vcon_dict["created_at"] = normalize_timestamp(vcon_dict["created_at"])
         else:
             vcon_dict["created_at"] = datetime.now(timezone.utc).isoformat()
 
@@ -59,19 +84,162 @@ class Vcon:
         if "attachments" not in vcon_dict:
             vcon_dict["attachments"] = []
 
-        self.vcon_dict = json.loads(json.dumps(vcon_dict))
+        if copy:
+            backend = get_backend()
+            self.vcon_dict = backend.loads(
+                backend.dumps(vcon_dict, as_bytes=True, default=json_default)
+            )
+        else:
+            self.vcon_dict = vcon_dict
+
+        self._indexes = {
+            (section, "type"): FieldIndex("type")
+            for section in ("attachments", "analysis")
+        }
+        self._tags_map = None
+        self._parties = None
+        self._dialogs = None
 
     @classmethod
-    def build_from_json(cls, json_string: str) -> Vcon:
+    def build_from_json(
+        cls,
+        json_string: Union[str, bytes],
+        backend: Union[str, JsonBackend, None] = None,
+        lazy: bool = False,
+    ) -> Vcon:
         """
         Initialize a Vcon object from a JSON string.
 
-        :param json_string: a JSON string representing a vCon
-        :type json_string: str
+        The freshly parsed dictionary is not shared with anyone else, so it
+        is adopted directly instead of being copied again.
+
+        With ``lazy=True``, long base64/base64url ``body`` values are not
+        decoded. They become :class:`~vcon.lazy.LazyBody` proxies pointing
+        into ``json_string``, which is kept alive as long as they are. Use
+        ``str(body)`` to get the text; serialization resolves them
+        automatically.
+
+        :param json_string: a JSON string (or UTF-8 bytes) representing a vCon
+        :type json_string: Union[str, bytes]
+        :param backend: the JSON backend to parse with, defaults to the global one
+        :type backend: Union[str, JsonBackend, None]
+        :param lazy: leave large bodies in the source buffer until accessed
+        :type lazy: bool
+        :return: a Vcon object
+        :rtype: Vcon
+        """
+        backend = get_backend(backend)
+        if lazy:
+            return cls(loads_lazy(json_string, backend), copy=False)
+        return cls(backend.loads(json_string), copy=False)
+
+    @classmethod
+    def load(
+        cls,
+        path: str,
+        lazy: bool = False,
+        backend: Union[str, JsonBackend, None] = None,
+        mmap: bool = False,
+    ) -> Vcon:
+        """
+        Load a vCon from a JSON file.
+
+        With ``mmap=True`` the file is memory-mapped and parsed from the
+        mapping instead of being read into a separate buffer. Combined with
+        ``lazy=True`` the body proxies point straight into the mapping, so
+        recordings are only paged in when they are accessed; the mapping
+        stays open as long as any proxy is alive.
+
+        :param path: path to the vCon JSON file
+        :type path: str
+        :param lazy: leave large bodies unparsed until accessed, see
+            :meth:`build_from_json`
+        :type lazy: bool
+        :param backend: the JSON backend to parse with, defaults to the global one
+        :type backend: Union[str, JsonBackend, None]
+        :param mmap: memory-map the file instead of reading it
+        :type mmap: bool
+        :return: a Vcon object
+        :rtype: Vcon
+        """
+        with open(path, "rb") as f:
+            if not mmap or os.fstat(f.fileno()).st_size == 0:
+                return cls.build_from_json(f.read(), backend, lazy)
+            mapped = memory_map(f.fileno(), 0, access=ACCESS_READ)
+
+        if lazy:
+            return cls.build_from_json(mapped, backend, lazy=True)
+        try:
+            with memoryview(mapped) as view:
+                return cls.build_from_json(view, backend)
+        finally:
+            mapped.close()
+
+    @classmethod
+    def from_bytes(
+        cls,
+        data: Union[bytes, bytearray, memoryview],
+        backend: Union[str, JsonBackend, None] = None,
+        lazy: bool = False,
+    ) -> Vcon:
+        """
+        Initialize a Vcon object from the binary container written by
+        :meth:`to_bytes`.
+
+        With ``lazy=True``, media bodies are left as raw bytes in ``data``
+        until their text is needed, see :class:`~vcon.media.MediaBody`;
+        ``body.raw()`` returns the bytes without any base64 work.
+
+        :param data: the container
+        :type data: bytes-like
+        :param backend: the JSON backend to parse the metadata with
+        :type backend: Union[str, JsonBackend, None]
+        :param lazy: keep media bodies as raw bytes until accessed
+        :type lazy: bool
         :return: a Vcon object
         :rtype: Vcon
+        :raises ValueError: if ``data`` is truncated or not a well-formed
+            container
         """
-        return cls(json.loads(json_string))
+        return cls(container.from_bytes(data, backend, lazy), copy=False)
+
+    @classmethod
+    def from_cbor(
+        cls, data: Union[bytes, bytearray, memoryview], lazy: bool = False
+    ) -> Vcon:
+        """
+        Initialize a Vcon object from CBOR data written by :meth:`to_cbor`.
+
+        The document gets the same normalization as :meth:`__init__`; CBOR
+        datetimes in ``created_at`` are converted to ISO 8601 strings.
+
+        :param data: the CBOR data
+        :type data: bytes-like
+        :param lazy: keep media bodies as raw bytes until accessed, see
+            :meth:`from_bytes`
+        :type lazy: bool
+        :return: a Vcon object
+        :rtype: Vcon
+        """
+        return cls(codecs.from_cbor(data, lazy), copy=False)
+
+    @classmethod
+    def from_msgpack(
+        cls, data: Union[bytes, bytearray, memoryview], lazy: bool = False
+    ) -> Vcon:
+        """
+        Initialize a Vcon object from MessagePack data written by
+        :meth:`to_msgpack`.
+
+        :param data: the MessagePack data
+        :type data: bytes-like
+        :param lazy: keep media bodies as raw bytes until accessed, see
+            :meth:`from_bytes`
+        :type lazy: bool
+        :return: a Vcon object
+        :rtype: Vcon
+        """
+        return cls(codecs.from_msgpack(data, lazy), copy=False)
 
     @classmethod
     def build_new(cls) -> Vcon:
@@ -108,7 +276,22 @@ class Vcon:
         """
         return self.find_attachment_by_type("tags")
 
-    def get_tag(self, tag_name) -> Optional[dict]:
+    @property
+    def tags_map(self) -> TagMap:
+        """
+        Returns the tags as a dictionary-like :class:`~vcon.tags.TagMap`.
+
+        Reads are constant time and writes go straight to the tags
+        attachment, which keeps the spec's ``"name:value"`` list form.
+
+        :return: the tags view
+        :rtype: TagMap
+        """
+        if self._tags_map is None:
+            self._tags_map = TagMap(self)
+        return self._tags_map
+
+    def get_tag(self, tag_name) -> Optional[str]:
         """
         Returns the value of a tag by name.
 
@@ -117,20 +300,11 @@ class Vcon:
         :return: the value of the tag or None if not found
         :rtype: str or None
         """
-        tags_attachment = self.find_attachment_by_type("tags")
-        if not tags_attachment:
-            return None
-        tag = next(
-            (t for t in tags_attachment["body"] if t.startswith(f"{tag_name}:")), None
-        )
-        if not tag:
-            return None
-        tag_value = tag.split(":")[1]
-        return tag_value
+        return self.tags_map.get(tag_name)
 
     def add_tag(self, tag_name, tag_value) -> None:
         """
-        Adds a tag to the vCon.
+        Adds a tag to the vCon, replacing any tag with the same name.
 
         :param tag_name: the name of the tag
         :type tag_name: str
@@ -139,15 +313,7 @@ class Vcon:
         :return: None
         :rtype: None
         """
-        tags_attachment = self.find_attachment_by_type("tags")
-        if not tags_attachment:
-            tags_attachment = {
-                "type": "tags",
-                "body": [],
-                "encoding": "json",
-            }
-            self.vcon_dict["attachments"].append(tags_attachment)
-        tags_attachment["body"].append(f"{tag_name}:{tag_value}")
+        self.tags_map.set_tag(tag_name, tag_value)
 
     def find_attachment_by_type(self, type: str) -> Optional[dict]:
         """
@@ -158,9 +324,19 @@ class Vcon:
         :return: the attachment or None if not found
         :rtype: dict or None
         """
-        return next(
-            (a for a in self.vcon_dict["attachments"] if a["type"] == type), None
-        )
+        attachments = self._find("attachments", "type", type, first=True)
+        return attachments[0] if attachments else None
+
+    def find_all_attachments_by_type(self, type: str) -> list[dict]:
+        """
+        Finds every attachment of a type.
+
+        :param type: the type of the attachments
+        :type type: str
+        :return: the attachments, in order
+        :rtype: list[dict]
+        """
+        return self._find("attachments", "type", type)
 
     def add_attachment(self, type, body, encoding="none"):
         VALID_ENCODINGS = ["base64", "base64url", "none"]
@@ -171,6 +347,7 @@ class Vcon:
         attachment = Attachment(type, body, encoding)
 
         self.vcon_dict["attachments"].append(attachment.to_dict())
+        self._appended("attachments")
         return attachment
 
     def find_analysis_by_type(self, type) -> Any | None:
@@ -182,7 +359,19 @@ class Vcon:
         :return: the analysis or None if not found
         :rtype: dict or None
         """
-        return next((a for a in self.vcon_dict["analysis"] if a["type"] == type), None)
+        analyses = self._find("analysis", "type", type, first=True)
+        return analyses[0] if analyses else None
+
+    def find_all_analysis_by_type(self, type: str) -> list[dict]:
+        """
+        Finds every analysis of a type.
+
+        :param type: the type of the analysis
+        :type type: str
+        :return: the analyses, in order
+        :rtype: list[dict]
+        """
+        return self._find("analysis", "type", type)
 
     def add_analysis(
         self,
@@ -236,6 +425,83 @@ class Vcon:
             **extra,
         }
         self.vcon_dict["analysis"].append(analysis)
+        self._appended("analysis")
+
+    def build_index(self, by: str, section: str = "parties") -> None:
+        """
+        Builds a lookup index of a field.
+
+        Lookups by the field (``find_party_index``, ``find_dialog``,
+        ``find_*_by_type``) then use a hash map instead of scanning the
+        list. The ``type`` of attachments and analysis is always indexed.
+        The ``add_*`` methods keep the index up to date and entries that stop
+        matching are not returned, but call ``invalidate_indexes()`` after
+        editing an indexed field in ``vcon_dict`` directly so that entries
+        which start matching are found.
+
+        :param by: the field to index, e.g. ``tel`` or ``meta.role``
+        :type by: str
+        :param section: the list to index: parties, dialog, attachments or
+            analysis
+        :type section: str
+        :return: None
+        :rtype: None
+        """
+        index = self._indexes.get((section, by))
+        if index is None:
+            index = self._indexes[(section, by)] = FieldIndex(by)
+        index.rebuild(self.vcon_dict[section])
+
+    def _positions(
+        self, section: str, path: str, value: Any, first: bool = False
+    ) -> list[int]:
+        entries = self.vcon_dict[section]
+        index = self._indexes.get((section, path))
+        if index is not None:
+            return index.positions(entries, value)
+        getter = compile_path(path)
+        positions = []
+        for i, entry in enumerate(entries):
+            if getter(entry) == value:
+                positions.append(i)
+                if first:
+                    break
+        return positions
+
+    def _find(self, section: str, path: str, value: Any, first: bool = False) -> list:
+        entries = self.vcon_dict[section]
+        return [entries[i] for i in self._positions(section, path, value, first)]
+
+    def _appended(self, section: str) -> None:
+        entries = self.vcon_dict[section]
+        for (indexed_section, _), index in self._indexes.items():
+            if indexed_section == section:
+                index.appended(entries)
+
+    def _changed(self, section: str) -> None:
+        for (indexed_section, _), index in self._indexes.items():
+            if indexed_section == section:
+                index.invalidate()
+
+    def invalidate_indexes(self) -> None:
+        """
+        Drops the lookup indexes and the cached tags and parties so they
+        are rebuilt on the next access.
+
+        Indexes notice entries being added or removed, lists being replaced
+        and entries that stop matching, but not entries that start matching;
+        call this after changing indexed fields in ``vcon_dict`` directly.
+        Changes made through :attr:`dialogs` drop the dialog indexes
+        automatically.
+
+        :return: None
+        :rtype: None
+        """
+        for index in self._indexes.values():
+            index.invalidate()
+        if self._tags_map is not None:
+            self._tags_map.refresh()
+        self._parties = None
 
     def add_party(self, party: Party) -> None:
         """
@@ -247,6 +513,8 @@ class Vcon:
         :rtype: None
         """
         self.vcon_dict["parties"].append(party.to_dict())
+        self._appended("parties")
+        self._parties = None
 
     def find_party_index(self, by: str, val: str) -> Optional[int]:
         """
@@ -259,14 +527,8 @@ class Vcon:
         :return: The index of the party if found, None otherwise
         :rtype: Optional[int]
         """
-        return next(
-            (
-                ind
-                for ind, party in enumerate(self.vcon_dict["parties"])
-                if _get(party, by) == val
-            ),
-            None,
-        )
+        positions = self._positions("parties", by, val, first=True)
+        return positions[0] if positions else None
 
     def find_dialog(self, by: str, val: str) -> Optional[Dialog]:
         """
@@ -279,12 +541,10 @@ class Vcon:
         :return: The dialog if found, None otherwise
         :rtype: Optional[dict]
         """
-        dialog = next(
-            (dialog for dialog in self.vcon_dict["dialog"] if _get(dialog, by) == val),
-            None,
-        )
+        dialogs = self._find("dialog", by, val, first=True)
+        dialog = dialogs[0] if dialogs else None
         if dialog:
-            return Dialog(**dialog)
+            return Dialog.from_dict(dialog, trusted=True)
         return None
 
     def add_dialog(self, dialog: Dialog) -> None:
@@ -297,25 +557,344 @@ class Vcon:
         :rtype: None
         """
         self.vcon_dict["dialog"].append(dialog.to_dict())
+        self._appended("dialog")
+
+    def inline_all_external(
+        self,
+        max_concurrency: int = 8,
+        session: Optional[requests.Session] = None,
+        timeout: Optional[float] = fetch.DEFAULT_TIMEOUT,
+        retries: int = 2,
+        backoff: float = fetch.DEFAULT_BACKOFF,
+        max_bytes: Optional[int] = None,
+        cache: Optional[MediaCache] = None,
+    ) -> int:
+        """
+        Convert every external dialog to inline data, fetching concurrently.
+
+        Up to ``max_concurrency`` dialogs are fetched, hashed and encoded at
+        once over a pooled session, see :meth:`Dialog.to_inline_data`.
+        Dialogs that fail are left external; the others are inlined even if
+        some fail.
+
+        :param max_concurrency: the number of dialogs fetched at once
+        :type max_concurrency: int
+        :param session: the session to fetch with; by default a pooled
+            session is created for the call and closed afterwards
+        :type session: requests.Session or None
+        :param timeout: the connect and read timeout in seconds
+        :type timeout: float or None
+        :param retries: how many times to retry transient failures per dialog
+        :type retries: int
+        :param backoff: the delay before the first retry, in seconds
+        :type backoff: float
+        :param max_bytes: the total number of bytes that may be downloaded
+        :type max_bytes: int or None
+        :param cache: the media cache to revalidate against and fill
+        :type cache: vcon.cache.MediaCache or None
+        :return: the number of dialogs inlined
+        :rtype: int
+        :raises vcon.fetch.InlineError: if any dialog could not be inlined;
+            its ``errors`` attribute maps dialog indexes to errors
+        """
+        dialogs = self.dialogs
+        pending = self._external_dialogs()
+        if not pending:
+            return 0
+        budget = fetch.ByteBudget(max_bytes)
+        own_session = session is None
+        if own_session:
+            session = fetch.new_session(max_concurrency)
+
+        def inline(index: int) -> None:
+            dialogs[index].to_inline_data(
+                session=session,
+                timeout=timeout,
+                retries=retries,
+                backoff=backoff,
+                budget=budget,
+                cache=cache,
+            )
+
+        errors = {}
+        try:
+            workers = min(max_concurrency, len(pending))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(inline, i): i for i in pending}
+                for future in as_completed(futures):
+                    error = future.exception()
+                    if error is not None:
+                        errors[futures[future]] = error
+        finally:
+            if own_session:
+                session.close()
+            self.invalidate_indexes()
+        if errors:
+            raise fetch.InlineError(errors)
+        return len(pending)
+
+    async def ainline_all_external(
+        self,
+        max_concurrency: int = 32,
+        client=None,
+        timeout: Optional[float] = fetch.DEFAULT_TIMEOUT,
+        retries: int = 2,
+        backoff: float = fetch.DEFAULT_BACKOFF,
+        max_bytes: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> int:
+        """
+        Async counterpart of :meth:`inline_all_external`.
+
+        Up to ``max_concurrency`` dialogs are streamed at once with
+        :meth:`Dialog.ato_inline_data`; hashing and encoding run in
+        ``executor``, so the event loop stays responsive.
+
+        :param max_concurrency: the number of dialogs fetched at once
+        :type max_concurrency: int
+        :param client: the ``httpx.AsyncClient`` to fetch with; by default
+            one is created for the call and closed afterwards
+        :type client: httpx.AsyncClient or None
+        :param timeout: the connect and read timeout in seconds
+        :type timeout: float or None
+        :param retries: how many times to retry transient failures per dialog
+        :type retries: int
+        :param backoff: the delay before the first retry, in seconds
+        :type backoff: float
+        :param max_bytes: the total number of bytes that may be downloaded
+        :type max_bytes: int or None
+        :param executor: the executor to hash and encode in
+        :type executor: concurrent.futures.Executor or None
+        :return: the number of dialogs inlined
+        :rtype: int
+        :raises vcon.fetch.InlineError: if any dialog could not be inlined
+        """
+        dialogs = self.dialogs
+        pending = self._external_dialogs()
+        if not pending:
+            return 0
+        budget = fetch.ByteBudget(max_bytes)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        own_client = client is None
+        if own_client:
+            client = fetch.new_async_client(max_concurrency)
+
+        async def inline(index: int) -> None:
+            async with semaphore:
+                await dialogs[index].ato_inline_data(
+                    client, timeout, retries, backoff, budget, executor
+                )
+
+        try:
+            results = await asyncio.gather(
+                *(inline(i) for i in pending), return_exceptions=True
+            )
+        finally:
+            if own_client:
+                await client.aclose()
+            self.invalidate_indexes()
+        errors = {
+            i: result
+            for i, result in zip(pending, results)
+            if isinstance(result, BaseException)
+        }
+        if errors:
+            raise fetch.InlineError(errors)
+        return len(pending)
+
+    def verify_media(
+        self,
+        workers: Optional[int] = None,
+        session: Optional[requests.Session] = None,
+        timeout: Optional[float] = fetch.DEFAULT_TIMEOUT,
+        retries: int = 0,
+        backoff: float = fetch.DEFAULT_BACKOFF,
+        cache: Optional[MediaCache] = None,
+    ) -> verify.MediaReport:
+        """
+        Check the media of every dialog against its signature, in parallel.
+
+        Inline bodies are decoded and hashed; external media is fetched and
+        hashed as it streams in. See :func:`vcon.verify.verify_dialog`.
+
+        :param workers: number of threads; None uses every CPU and 0 checks
+            the dialogs one by one in the calling thread
+        :type workers: int or None
+        :param session: the session to fetch external media with; by
+            default a pooled session is created for the call
+        :type session: requests.Session or None
+        :param timeout: the connect and read timeout in seconds
+        :type timeout: float or None
+        :param retries: how many times to retry transient fetch failures
+        :type retries: int
+        :param backoff: the delay before the first retry, in seconds
+        :type backoff: float
+        :param cache: the media cache to revalidate against and fill
+        :type cache: vcon.cache.MediaCache or None
+        :return: the report, with one result per dialog with media
+        :rtype: vcon.verify.MediaReport
+        """
+        return verify.verify_media(
+            self.vcon_dict,
+            workers=workers,
+            session=session,
+            timeout=timeout,
+            retries=retries,
+            backoff=backoff,
+            cache=cache,
+        )
+
+    def _external_dialogs(self) -> list[int]:
+        return [
+            i
+            for i, dialog in enumerate(self.vcon_dict["dialog"])
+            if isinstance(dialog, dict) and dialog.get("url")
+        ]
 
-    def to_json(self) -> str:
+    def to_json(
+        self,
+        backend: Union[str, JsonBackend, None] = None,
+        as_bytes: bool = False,
+    ) -> Union[str, bytes]:
         """
         Serialize the vCon to a JSON string.
 
+        :param backend: the JSON backend to use, defaults to the global one
+        :type backend: Union[str, JsonBackend, None]
+        :param as_bytes: return UTF-8 encoded bytes instead of a str
+        :type as_bytes: bool
         :return: a JSON string representation of the vCon
-        :rtype: str
+        :rtype: Union[str, bytes]
         """
         tmp_vcon_dict = copy.copy(self.vcon_dict)
-        return json.dumps(tmp_vcon_dict)
+        return get_backend(backend).dumps(
+            tmp_vcon_dict, as_bytes=as_bytes, default=json_default
+        )
+
+    def to_bytes(self, backend: Union[str, JsonBackend, None] = None) -> bytes:
+        """
+        Serialize the vCon to the binary container format.
+
+        Base64 and base64url media bodies are stored as raw bytes in their
+        own sections instead of as text, see :mod:`vcon.container`. The
+        conversion is lossless: :meth:`from_bytes` restores the same JSON
+        form.
+
+        :param backend: the JSON backend to encode the metadata with
+        :type backend: Union[str, JsonBackend, None]
+        :return: the container
+        :rtype: bytes
+        """
+        return container.to_bytes(self.vcon_dict, backend)
+
+    def to_cbor(self) -> bytes:
+        """
+        Serialize the vCon to CBOR, with media bodies as byte strings.
+
+        Requires the ``cbor2`` package, see :mod:`vcon.codecs`.
+
+        :return: the CBOR data
+        :rtype: bytes
+        """
+        return codecs.to_cbor(self.vcon_dict)
+
+    def to_msgpack(self) -> bytes:
+        """
+        Serialize the vCon to MessagePack, with media bodies as byte strings.
+
+        Requires the ``msgpack`` package, see :mod:`vcon.codecs`.
+
+        :return: the MessagePack data
+        :rtype: bytes
+        """
+        return codecs.to_msgpack(self.vcon_dict)
+
+    def iter_json(self, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+        """
+        Serialize the vCon to JSON in chunks.
+
+        Joined, the chunks equal ``to_json(backend="json")``. Long strings
+        such as inline media bodies are escaped and emitted in slices, so the
+        whole document is never held in memory at once.
+
+        :param chunk_size: the approximate size of each chunk, in characters
+        :type chunk_size: int
+        :return: the JSON text, piece by piece
+        :rtype: Iterator[str]
+        """
+        return iter_json(self.vcon_dict, chunk_size)
+
+    def write_to(self, fp, chunk_size: int = CHUNK_SIZE) -> int:
+        """
+        Write the vCon as JSON to a file-like object, chunk by chunk.
+
+        Works with text streams and with binary streams such as files opened
+        in ``"wb"`` mode or sockets wrapped with ``makefile("wb")``; the
+        output is ASCII either way. A stream that raises ``TypeError`` when
+        given ``str`` is treated as binary.
+
+        :param fp: the stream to write to
+        :type fp: file-like object
+        :param chunk_size: the approximate size of each write, in characters
+        :type chunk_size: int
+        :return: the number of characters written
+        :rtype: int
+        """
+        return write_json(self.vcon_dict, fp, chunk_size)
 
-    def to_dict(self) -> dict:
+    def to_dict(self, mode: str = "deep") -> Union[dict, CopyOnWriteDict]:
         """
         Serialize the vCon to a dictionary.
 
-        :return: a dictionary representation of the vCon
-        :rtype: dict
+        ``mode`` controls how much of the vCon is copied:
+
+        - ``"deep"``: an independent deep copy (the default)
+        - ``"shallow"``: a new top-level dict sharing the nested values
+          with the vCon, so nested changes show up on both sides; dialogs
+          and attachments with lazily loaded bodies are copied
+        - ``"cow"``: a copy-on-write view; containers are copied only when
+          they are modified and the vCon is never changed through the view.
+          The view is a ``MutableMapping``, not a ``dict``: call
+          ``materialize()`` on it to get a plain dict, e.g. for ``json.dumps``.
+
+        :param mode: one of "deep", "shallow" or "cow"
+        :type mode: str
+        :return: a dictionary representation of the vCon, or a
+            :class:`~vcon.copying.CopyOnWriteDict` for "cow"
+        :rtype: Union[dict, CopyOnWriteDict]
         """
-        return json.loads(self.to_json())
+        if mode == "deep":
+            return deep_copy(self.vcon_dict)
+        if mode == "shallow":
+            return resolve_bodies(self.vcon_dict)
+        if mode == "cow":
+            return cow_view(self.vcon_dict)
+        raise ValueError(f"Invalid copy mode: {mode}")
+
+    def save(self, path: str) -> None:
+        """
+        Write the vCon to a JSON file.
+
+        The document is encoded incrementally and written chunk by chunk, so
+        no string holding the whole document is ever built. The file is
+        written next to ``path`` and then moved into place, which also makes
+        it safe to save over a file this vCon was lazily loaded from.
+
+        :param path: path of the file to write
+        :type path: str
+        :return: None
+        :rtype: None
+        """
+        tmp_path = f"{path}.{uuid6.uuid7().hex}.tmp"
+        try:
+            with open(tmp_path, "x", encoding="utf-8") as f:
+                self.write_to(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
 
     def dumps(self) -> str:
         """
@@ -331,15 +910,41 @@ class Vcon:
         """
         Returns the list of parties.
 
+        The Party objects are built once and the same list is returned until
+        parties are added, removed or replaced, so treat it as read-only and
+        use ``add_party`` or ``vcon_dict`` to make changes. Call
+        ``invalidate_indexes()`` after editing a party dict in place.
+
         :return: a list of parties
         :rtype: list[Party]
         """
-        return [Party(**party) for party in self.vcon_dict.get("parties", [])]
+        source = self.vcon_dict.get("parties", [])
+        cached = self._parties
+        if cached is None or cached[0] is not source or cached[1] != len(source):
+            parties = [Party.from_dict(party) for party in source]
+            self._parties = cached = (source, len(source), parties)
+        return cached[2]
 
     @property
     def dialog(self) -> list:
         return self.vcon_dict.get("dialog", [])
 
+    @property
+    def dialogs(self) -> DialogList:
+        """
+        Returns the dialogs as :class:`~vcon.dialog.Dialog` objects.
+
+        The objects are views of the dictionaries in ``vcon_dict``: they are
+        built on first access and cached, and setting or deleting an
+        attribute on one changes the vCon and drops its dialog indexes.
+
+        :return: the dialog views
+        :rtype: DialogList
+        """
+        if self._dialogs is None:
+            self._dialogs = DialogList(self)
+        return self._dialogs
+
     @property
     def attachments(self) -> list:
         return self.vcon_dict.get("attachments", [])
@@ -491,212 +1096,97 @@ class Vcon:
         public_key = private_key.public_key()
         return private_key, public_key
 
-    def is_valid(self) -> tuple[bool, list[str]]:
+    def is_valid(self, fail_fast: bool = False) -> tuple[bool, list[str]]:
         """
         Validate the vCon syntax according to the standard.
 
+        :param fail_fast: stop at the first error instead of collecting all
+        :type fail_fast: bool
         :return: A tuple containing (is_valid, list_of_errors)
         :rtype: tuple[bool, list[str]]
         """
-        errors = []
-
-        # Required fields
-        required_fields = ["uuid", "vcon", "created_at"]
-        for field in required_fields:
-            if field not in self.vcon_dict:
-                errors.append(f"Missing required field: {field}")
-
-        # Validate created_at format
-        if "created_at" in self.vcon_dict:
-            try:
-                parser.parse(self.vcon_dict["created_at"])
-            except Exception:
-                errors.append(
-                    "Invalid created_at format. Must be ISO 8601 datetime string"
-                )
-
-        # Validate parties
-        if "parties" in self.vcon_dict:
-            if not isinstance(self.vcon_dict["parties"], list):
-                errors.append("parties must be a list")
-            else:
-                for i, party in enumerate(self.vcon_dict["parties"]):
-                    if not isinstance(party, dict):
-                        errors.append(f"Party at index {i} must be a dictionary")
-
-        # Validate dialogs
-        if "dialog" in self.vcon_dict:
-            if not isinstance(self.vcon_dict["dialog"], list):
-                errors.append("dialog must be a list")
-            else:
-                for i, dialog in enumerate(self.vcon_dict["dialog"]):
-                    if not isinstance(dialog, dict):
-                        errors.append(f"Dialog at index {i} must be a dictionary")
-                    else:
-                        # Required dialog fields
-                        dialog_required = ["type", "start", "parties"]
-                        for field in dialog_required:
-                            if field not in dialog:
-                                errors.append(
-                                    f"Dialog at index {i} missing required field: {field}"
-                                )
-
-                        # Validate dialog parties reference valid party indices
-                        if "parties" in dialog and isinstance(dialog["parties"], list):
-                            party_count = len(self.vcon_dict.get("parties", []))
-                            for party_idx in dialog["parties"]:
-                                if (
-                                    not isinstance(party_idx, int)
-                                    or party_idx < 0
-                                    or party_idx >= party_count
-                                ):
-                                    errors.append(
-                                        f"Dialog at index {i} references invalid party index: {party_idx}"
-                                    )
-
-                        # Validate start time format
-                        if "start" in dialog:
-                            try:
-                                parser.parse(dialog["start"])
-                            except Exception:
-                                errors.append(
-                                    f"Dialog at index {i} has invalid start format. Must be ISO 8601 datetime string"
-                                )
-
-                        # Validate mimetype if present
-                        if (
-                            "mimetype" not in dialog
-                            or not isinstance(dialog["mimetype"], str)
-                            or dialog["mimetype"] not in Dialog.MIME_TYPES
-                        ):
-                            errors.append(
-                                f"Dialog {i} has invalid mimetype: {dialog.get('mimetype', 'missing')}"
-                            )
-                            valid = False
-
-        # Validate attachments
-        if "attachments" in self.vcon_dict:
-            if not isinstance(self.vcon_dict["attachments"], list):
-                errors.append("attachments must be a list")
-            else:
-                for i, attachment in enumerate(self.vcon_dict["attachments"]):
-                    if not isinstance(attachment, dict):
-                        errors.append(f"Attachment at index {i} must be a dictionary")
-                    else:
-                        # Required attachment fields
-                        attachment_required = ["type", "body", "encoding"]
-                        for field in attachment_required:
-                            if field not in attachment:
-                                errors.append(
-                                    f"Attachment at index {i} missing required field: {field}"
-                                )
-
-                        # Validate encoding
-                        if "encoding" in attachment and attachment["encoding"] not in [
-                            "json",
-                            "none",
-                            "base64url",
-                        ]:
-                            errors.append(
-                                f"Attachment at index {i} has invalid encoding: {attachment['encoding']}"
-                            )
-
-        # Validate analysis
-        if "analysis" in self.vcon_dict:
-            if not isinstance(self.vcon_dict["analysis"], list):
-                errors.append("analysis must be a list")
-            else:
-                for i, analysis in enumerate(self.vcon_dict["analysis"]):
-                    if not isinstance(analysis, dict):
-                        errors.append(f"Analysis at index {i} must be a dictionary")
-                    else:
-                        # Required analysis fields
-                        analysis_required = [
-                            "type",
-                            "dialog",
-                            "vendor",
-                            "body",
-                            "encoding",
-                        ]
-                        for field in analysis_required:
-                            if field not in analysis:
-                                errors.append(
-                                    f"Analysis at index {i} missing required field: {field}"
-                                )
-
-                        # Validate encoding
-                        if "encoding" in analysis and analysis["encoding"] not in [
-                            "json",
-                            "none",
-                            "base64url",
-                        ]:
-                            errors.append(
-                                f"Analysis at index {i} has invalid encoding: {analysis['encoding']}"
-                            )
-
-                        # Validate dialog references
-                        if "dialog" in analysis:
-                            dialog_count = len(self.vcon_dict.get("dialog", []))
-                            if isinstance(analysis["dialog"], list):
-                                for dialog_idx in analysis["dialog"]:
-                                    if (
-                                        not isinstance(dialog_idx, int)
-                                        or dialog_idx < 0
-                                        or dialog_idx >= dialog_count
-                                    ):
-                                        errors.append(
-                                            f"Analysis at index {i} references invalid dialog index: {dialog_idx}"
-                                        )
-                            elif isinstance(analysis["dialog"], int):
-                                if (
-                                    analysis["dialog"] < 0
-                                    or analysis["dialog"] >= dialog_count
-                                ):
-                                    errors.append(
-                                        f"Analysis at index {i} references invalid dialog index: {analysis['dialog']}"
-                                    )
-                            else:
-                                errors.append(
-                                    f"Analysis at index {i} has invalid dialog reference type"
-                                )
-
+        errors = DEFAULT_VALIDATOR.validate(self.vcon_dict, fail_fast=fail_fast)
         return len(errors) == 0, errors
 
     @staticmethod
-    def validate_file(file_path: str) -> tuple[bool, list[str]]:
+    def validate_file(
+        file_path: str,
+        backend: Union[str, JsonBackend, None] = None,
+        stream: bool = False,
+    ) -> tuple[bool, list[str]]:
         """
         Validate a vCon file at the given path.
 
+        With ``stream=True`` the file is parsed incrementally with ijson and
+        the ``body`` values of dialogs, attachments and analysis entries are
+        dropped as they are read; long ones are cut out of the byte stream
+        before parsing, so no body is ever built as a string. Memory is
+        bounded by the metadata plus a few kilobytes per read, even for a
+        single recording of hundreds of megabytes. The errors reported are
+        the same as in the default mode.
+
         :param file_path: Path to the vCon JSON file
         :type file_path: str
+        :param backend: the JSON backend to parse with, defaults to the global one
+        :type backend: Union[str, JsonBackend, None]
+        :param stream: validate incrementally without loading bodies (needs ijson)
+        :type stream: bool
         :return: A tuple containing (is_valid, list_of_errors)
         :rtype: tuple[bool, list[str]]
         """
         try:
-            with open(file_path, "r") as f:
-                json_str = f.read()
-            return Vcon.validate_json(json_str)
+            if stream:
+                with open(file_path, "rb") as f:
+                    vcon_dict = load_skeleton(f)
+            else:
+                with open(file_path, "rb") as f:
+                    json_bytes = f.read()
+                return Vcon.validate_json(json_bytes, backend)
         except FileNotFoundError:
             return False, ["File not found"]
         except json.JSONDecodeError:
             return False, ["Invalid JSON format"]
+        except ImportError:
+            raise
         except Exception as e:
             return False, [f"Error reading file: {str(e)}"]
 
+        try:
+            return Vcon(vcon_dict, copy=False).is_valid()
+        except Exception as e:
+            return False, [f"Error parsing vCon: {str(e)}"]
+
     @staticmethod
-    def validate_json(json_str: str) -> tuple[bool, list[str]]:
+    def validate_json(
+        json_str: Union[str, bytes], backend: Union[str, JsonBackend, None] = None
+    ) -> tuple[bool, list[str]]:
         """
         Validate a vCon from a JSON string.
 
-        :param json_str: JSON string representing a vCon
-        :type json_str: str
+        :param json_str: JSON string (or UTF-8 bytes) representing a vCon
+        :type json_str: Union[str, bytes]
+        :param backend: the JSON backend to parse with, defaults to the global one
+        :type backend: Union[str, JsonBackend, None]
         :return: A tuple containing (is_valid, list_of_errors)
         :rtype: tuple[bool, list[str]]
         """
+        vcon, errors = Vcon._build_validated(json_str, backend)
+        return len(errors) == 0, errors
+
+    @staticmethod
+    def _build_validated(
+        json_str: Union[str, bytes], backend: Union[str, JsonBackend, None] = None
+    ) -> tuple[Optional[Vcon], list[str]]:
+        """
+        Build a vCon from a JSON string and validate it.
+
+        :return: the vCon (None if it could not be built) and the list of errors
+        :rtype: tuple[Optional[Vcon], list[str]]
+        """
         try:
-            vcon = Vcon.build_from_json(json_str)
-            return vcon.is_valid()
+            vcon = Vcon.build_from_json(json_str, backend)
+            return vcon, vcon.is_valid()[1]
         except json.JSONDecodeError:
-            return False, ["Invalid JSON format"]
+            return None, ["Invalid JSON format"]
         except Exception as e:
-            return False, [f"Error parsing vCon: {str(e)}"]
+            return None, [f"Error parsing vCon: {str(e)}"]
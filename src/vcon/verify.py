@@ -0,0 +1,250 @@
+"""
+Integrity verification of dialog media.
+
+:func:`verify_media` checks every dialog of a vCon that carries media
+against its ``signature``: inline bodies are decoded and hashed, external
+ones are fetched (optionally through a :class:`~vcon.cache.MediaCache`) and
+hashed as they stream in. Dialogs are checked in a thread pool; ``hashlib``
+releases the GIL while hashing large buffers, and fetches wait on the
+network, so the threads run in parallel. The outcome is a
+:class:`MediaReport` with one :class:`MediaResult` per dialog.
+
+:func:`vcon.batch.verify_many` does the same for a whole corpus.
+"""
+
+import base64
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional
+
+import requests
+
+from . import fetch, media
+from .cache import MediaCache
+from .lazy import LazyBody
+
+OK = "ok"
+MISMATCH = "mismatch"
+UNSIGNED = "unsigned"
+ERROR = "error"
+
+INLINE = "inline"
+EXTERNAL = "external"
+
+# Values of "alg" the signature can be checked for
+SHA256_ALGS = (None, "sha256", "SHA-256")
+
+
+class MediaResult(NamedTuple):
+    """The verification result of one dialog."""
+
+    #: index of the dialog in the vCon
+    index: int
+    #: OK, MISMATCH, UNSIGNED or ERROR
+    status: str
+    #: INLINE or EXTERNAL
+    source: str
+    #: number of media bytes hashed
+    size: int = 0
+    #: what went wrong, for ERROR results
+    error: Optional[str] = None
+
+
+class MediaReport(NamedTuple):
+    """The verification results of the media of one vCon."""
+
+    #: the vCon's uuid, or the file it was read from
+    label: Optional[str]
+    #: one result per dialog with media, in dialog order
+    results: List[MediaResult]
+    #: why the vCon could not be checked at all, if it could not be read
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """True if no dialog failed and the vCon could be read."""
+        return self.error is None and not self.failures
+
+    @property
+    def failures(self) -> List[MediaResult]:
+        """The MISMATCH and ERROR results."""
+        return [r for r in self.results if r.status in (MISMATCH, ERROR)]
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Counts the results by status.
+
+        :return: the number of results with each status
+        :rtype: dict[str, int]
+        """
+        counts = dict.fromkeys((OK, MISMATCH, UNSIGNED, ERROR), 0)
+        for result in self.results:
+            counts[result.status] += 1
+        return counts
+
+
+def has_media(dialog: Any) -> bool:
+    """
+    Checks whether a dialog dict carries inline or external media.
+
+    :param dialog: the dialog
+    :type dialog: Any
+    :return: True if it has a body or a url
+    :rtype: bool
+    """
+    return isinstance(dialog, Mapping) and (
+        dialog.get("body") is not None or bool(dialog.get("url"))
+    )
+
+
+def _text_bytes(body: Any) -> bytes:
+    if isinstance(body, LazyBody):
+        return body.tobytes()
+    if isinstance(body, str):
+        return body.encode("utf-8")
+    raise ValueError(f"Body is not a string: {type(body).__name__}")
+
+
+def _body_bytes(body: Any, encoding: Optional[str]) -> bytes:
+    if encoding in media.BASE64_ENCODINGS:
+        if not isinstance(body, (str, LazyBody)):
+            raise ValueError(f"Body is not a string: {type(body).__name__}")
+        return media.decode(body, encoding)
+    return _text_bytes(body)
+
+
+def verify_dialog(
+    dialog: Mapping,
+    index: int = 0,
+    session: Optional[requests.Session] = None,
+    timeout: Optional[float] = fetch.DEFAULT_TIMEOUT,
+    retries: int = 0,
+    backoff: float = fetch.DEFAULT_BACKOFF,
+    cache: Optional[MediaCache] = None,
+) -> MediaResult:
+    """
+    Checks the media of one dialog against its signature.
+
+    The signature is the base64url SHA-256 of the raw media: base64 and
+    base64url bodies are decoded first, other bodies are hashed as UTF-8
+    text and external media is fetched. Signatures over the encoded text,
+    as made by :meth:`Dialog.add_inline_data`, are accepted too.
+
+    :param dialog: the dialog, with a body or a url
+    :type dialog: Mapping
+    :param index: the index of the dialog, for the result
+    :type index: int
+    :param session: the session to fetch external media with
+    :type session: requests.Session or None
+    :param timeout: the connect and read timeout in seconds
+    :type timeout: float or None
+    :param retries: how many times to retry transient fetch failures
+    :type retries: int
+    :param backoff: the delay before the first retry, in seconds
+    :type backoff: float
+    :param cache: the media cache to revalidate against and fill
+    :type cache: vcon.cache.MediaCache or None
+    :return: the result
+    :rtype: MediaResult
+    """
+    body = dialog.get("body")
+    source = INLINE if body is not None else EXTERNAL
+    signature = dialog.get("signature")
+    if not signature:
+        return MediaResult(index, UNSIGNED, source)
+    alg = dialog.get("alg")
+    if alg not in SHA256_ALGS:
+        return MediaResult(index, ERROR, source, error=f"Unsupported alg: {alg}")
+    try:
+        expected = base64.urlsafe_b64decode(signature + "=" * (-len(signature) % 4))
+        if body is not None:
+            encoding = dialog.get("encoding")
+            data = _body_bytes(body, encoding)
+            size = len(data)
+            matches = hashlib.sha256(data).digest() == expected
+            if not matches and encoding in media.BASE64_ENCODINGS:
+                matches = hashlib.sha256(_text_bytes(body)).digest() == expected
+        else:
+            _, encoder = fetch.get_media(
+                dialog["url"],
+                session=session,
+                timeout=timeout,
+                retries=retries,
+                backoff=backoff,
+                encode=False,
+                cache=cache,
+            )
+            size = encoder.size
+            matches = encoder.digest() == expected
+    except (ValueError, OSError, fetch.FetchError) as e:
+        return MediaResult(index, ERROR, source, error=str(e))
+    return MediaResult(index, OK if matches else MISMATCH, source, size)
+
+
+def verify_media(
+    vcon_dict: dict,
+    workers: Optional[int] = None,
+    label: Optional[str] = None,
+    session: Optional[requests.Session] = None,
+    timeout: Optional[float] = fetch.DEFAULT_TIMEOUT,
+    retries: int = 0,
+    backoff: float = fetch.DEFAULT_BACKOFF,
+    cache: Optional[MediaCache] = None,
+) -> MediaReport:
+    """
+    Checks the media of every dialog of a vCon, see :func:`verify_dialog`.
+
+    :param vcon_dict: the vCon document
+    :type vcon_dict: dict
+    :param workers: number of threads; None uses every CPU and 0 checks the
+        dialogs one by one in the calling thread
+    :type workers: int or None
+    :param label: the report label, defaults to the vCon's uuid
+    :type label: str or None
+    :param session: the session to fetch external media with; by default a
+        pooled session is created for the call and closed afterwards
+    :type session: requests.Session or None
+    :param timeout: the connect and read timeout in seconds
+    :type timeout: float or None
+    :param retries: how many times to retry transient fetch failures
+    :type retries: int
+    :param backoff: the delay before the first retry, in seconds
+    :type backoff: float
+    :param cache: the media cache to revalidate against and fill
+    :type cache: vcon.cache.MediaCache or None
+    :return: the report
+    :rtype: MediaReport
+    """
+    if label is None:
+        label = vcon_dict.get("uuid")
+    dialogs = vcon_dict.get("dialog")
+    if type(dialogs) is not list:
+        dialogs = []
+    indexes = [i for i, dialog in enumerate(dialogs) if has_media(dialog)]
+    if workers != 0:
+        workers = min(workers or os.cpu_count() or 1, len(indexes))
+    own_session = session is None and any(
+        dialogs[i].get("body") is None for i in indexes
+    )
+    if own_session:
+        session = fetch.new_session(max(workers, 1))
+    check = partial(
+        verify_dialog,
+        session=session,
+        timeout=timeout,
+        retries=retries,
+        backoff=backoff,
+        cache=cache,
+    )
+    try:
+        if workers <= 1:
+            results = [check(dialogs[i], i) for i in indexes]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(lambda i: check(dialogs[i], i), indexes))
+    finally:
+        if own_session:
+            session.close()
+    return MediaReport(label, results)
@@ -0,0 +1,154 @@
+"""
+Incremental JSON encoding of vCons.
+
+:func:`iter_json` produces the same text as ``json.dumps(obj,
+default=json_default)``, but in chunks of roughly ``chunk_size``
+characters. Large strings, such as base64 media bodies, are escaped and
+emitted slice by slice, and :class:`~vcon.lazy.LazyBody` values are copied
+straight from their source buffer. Apart from the output buffer, memory use
+does not grow with the size of the bodies, so a vCon carrying hundreds of
+megabytes of inline audio can be written to a file or socket without
+building the document in memory.
+"""
+
+import json
+from json.encoder import encode_basestring_ascii
+from typing import Any, Callable, Iterator, List, Optional
+
+from .lazy import LazyBody, json_default
+
+CHUNK_SIZE = 64 * 1024
+
+_ITEM_SEPARATOR = ", "
+_KEY_SEPARATOR = ": "
+
+
+class _ChunkedEncoder:
+    def __init__(self, chunk_size: int, default: Optional[Callable]) -> None:
+        self.chunk_size = chunk_size
+        self.encode = json.JSONEncoder(default=default).encode
+        self.pending: List[str] = []
+        self.pending_size = 0
+
+    def add(self, text: str) -> Iterator[str]:
+        self.pending.append(text)
+        self.pending_size += len(text)
+        if self.pending_size >= self.chunk_size:
+            yield from self.flush()
+
+    def flush(self) -> Iterator[str]:
+        if self.pending:
+            yield "".join(self.pending)
+            self.pending = []
+            self.pending_size = 0
+
+    def is_large(self, obj: Any) -> bool:
+        # True if obj holds a value worth streaming
+        if isinstance(obj, (str, LazyBody)):
+            return len(obj) >= self.chunk_size
+        if isinstance(obj, dict):
+            return any(self.is_large(value) for value in obj.values())
+        if isinstance(obj, (list, tuple)):
+            return any(self.is_large(value) for value in obj)
+        return False
+
+    def key(self, key: Any) -> str:
+        if isinstance(key, str):
+            return encode_basestring_ascii(key)
+        # Let the stdlib convert non-string keys: '{"1": null}' -> '"1"'
+        return self.encode({key: None})[1:-7]
+
+    def value(self, obj: Any) -> Iterator[str]:
+        if not self.is_large(obj):
+            yield from self.add(self.encode(obj))
+        elif isinstance(obj, str):
+            yield from self.flush()
+            yield '"'
+            for start in range(0, len(obj), self.chunk_size):
+                piece = obj[start : start + self.chunk_size]
+                yield encode_basestring_ascii(piece)[1:-1]
+            yield from self.add('"')
+        elif isinstance(obj, LazyBody):
+            # base64 text needs no escaping
+            yield from self.flush()
+            yield '"'
+            yield from obj.chunks(self.chunk_size)
+            yield from self.add('"')
+        elif isinstance(obj, dict):
+            yield from self.add("{")
+            first = True
+            for key, value in obj.items():
+                if not first:
+                    yield from self.add(_ITEM_SEPARATOR)
+                first = False
+                yield from self.add(self.key(key) + _KEY_SEPARATOR)
+                yield from self.value(value)
+            yield from self.add("}")
+        else:
+            yield from self.add("[")
+            first = True
+            for value in obj:
+                if not first:
+                    yield from self.add(_ITEM_SEPARATOR)
+                first = False
+                yield from self.value(value)
+            yield from self.add("]")
+
+
+def iter_json(
+    obj: Any,
+    chunk_size: int = CHUNK_SIZE,
+    default: Optional[Callable[[Any], Any]] = json_default,
+) -> Iterator[str]:
+    """
+    Encode ``obj`` as JSON, in chunks.
+
+    :param obj: the object to encode
+    :type obj: Any
+    :param chunk_size: the approximate size of the chunks, in characters;
+        strings at least this long are streamed in slices
+    :type chunk_size: int
+    :param default: called for objects that are not JSON serializable
+    :type default: Callable or None
+    :return: the JSON text, piece by piece
+    :rtype: Iterator[str]
+    """
+    encoder = _ChunkedEncoder(chunk_size, default)
+    yield from encoder.value(obj)
+    yield from encoder.flush()
+
+
+def write_json(obj: Any, fp, chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Write ``obj`` as JSON to a text or binary file-like object.
+
+    The output is ASCII, so binary streams (files opened with ``"wb"``,
+    sockets wrapped with ``makefile("wb")``) receive the same bytes as text
+    streams would. The first chunk is written as ``str``; if ``fp`` rejects
+    it with a ``TypeError``, it and the rest are written as bytes.
+
+    :param obj: the object to encode
+    :type obj: Any
+    :param fp: the stream to write to
+    :type fp: file-like object
+    :param chunk_size: the approximate size of each write
+    :type chunk_size: int
+    :return: the number of characters written
+    :rtype: int
+    """
+    binary = None
+    written = 0
+    for chunk in iter_json(obj, chunk_size):
+        if binary:
+            fp.write(chunk.encode("ascii"))
+        elif binary is None:
+            try:
+                fp.write(chunk)
+                binary = False
+            except TypeError:
+                binary = True
+                fp.write(chunk.encode("ascii"))
+        else:
+            fp.write(chunk)
+        written += len(chunk)
+    return written
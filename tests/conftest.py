@@ -0,0 +1,32 @@
+import pytest
+
+from vcon import Vcon
+from vcon.dialog import Dialog
+
+RECORDING = {
+    "type": "recording",
+    "start": "2024-10-20T15:02:54.888840",
+    "parties": [0],
+}
+
+
+@pytest.fixture
+def make_vcon():
+    """
+    A factory for test vCons.
+
+    Each positional argument is a dialog, given as the fields that differ
+    from a recording by party 0. ``attachments`` are appended to the
+    attachments list as they are and ``tags`` are added with ``add_tag``.
+    """
+
+    def make(*dialogs: dict, attachments=(), tags=None) -> Vcon:
+        vcon = Vcon.build_new()
+        for name, value in (tags or {}).items():
+            vcon.add_tag(name, value)
+        for fields in dialogs:
+            vcon.add_dialog(Dialog(**{**RECORDING, **fields}))
+        vcon.vcon_dict["attachments"].extend(attachments)
+        return vcon
+
+    return make
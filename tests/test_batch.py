@@ -0,0 +1,119 @@
+import base64
+import hashlib
+import io
+import json
+
+import pytest
+
+from vcon import Vcon
+from vcon.batch import iter_tasks, load_many, verify_many
+from vcon.dialog import Dialog
+from vcon.verify import MISMATCH
+
+
+def make_vcon_json(subject: str) -> str:
+    vcon = Vcon.build_new()
+    vcon.vcon_dict["subject"] = subject
+    return vcon.to_json()
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    (tmp_path / "a.json").write_text(make_vcon_json("a"))
+    (tmp_path / "b.json").write_text('{"some": "json"}')
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "c.json").write_text("invalid json")
+    (tmp_path / "nested" / "notes.txt").write_text("ignored")
+    (tmp_path / "d.jsonl").write_text(
+        make_vcon_json("d1") + "\n\n" + make_vcon_json("d2") + "\n"
+    )
+    return tmp_path
+
+
+def summarize(results) -> list:
+    return [
+        r.subject if isinstance(r, Vcon) else (r[0].rsplit("/", 1)[-1], r[1])
+        for r in results
+    ]
+
+
+def test_iter_tasks_expands_directories(corpus) -> None:
+    labels = [label for label, _, _ in iter_tasks(corpus)]
+    assert labels == [
+        str(corpus / "a.json"),
+        str(corpus / "b.json"),
+        f"{corpus / 'd.jsonl'}:1",
+        f"{corpus / 'd.jsonl'}:3",
+        str(corpus / "nested" / "c.json"),
+    ]
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_load_many_ordered(corpus, workers) -> None:
+    results = list(load_many(corpus, workers=workers, max_in_flight=2))
+
+    assert summarize(results) == [
+        "a",
+        ("b.json", Vcon.validate_file(str(corpus / "b.json"))[1]),
+        "d1",
+        "d2",
+        ("c.json", ["Invalid JSON format"]),
+    ]
+
+
+def test_load_many_as_completed(corpus) -> None:
+    results = list(load_many(corpus, workers=2, ordered=False, chunksize=2))
+    assert sorted(map(str, summarize(results))) == sorted(
+        map(str, summarize(load_many(corpus, workers=0)))
+    )
+
+
+def test_load_many_stream_and_paths(corpus) -> None:
+    stream = io.StringIO(make_vcon_json("s1") + "\n" + "[]\n")
+    results = list(load_many([stream, corpus / "missing.json"], workers=0))
+
+    assert results[0].subject == "s1"
+    label, errors = results[1]
+    assert label == "<stream>:2"
+    assert errors == Vcon.validate_json("[]")[1]
+    assert summarize(results[2:]) == [("missing.json", ["File not found"])]
+
+
+def test_load_many_matches_single_document_path(corpus) -> None:
+    vcon = next(load_many(corpus / "a.json", workers=0))
+    assert (
+        vcon.to_dict()
+        == Vcon.build_from_json((corpus / "a.json").read_text()).to_dict()
+    )
+    assert json.loads(vcon.to_json())["subject"] == "a"
+
+
+def test_verify_many(tmp_path) -> None:
+    data = b"recording"
+    signed = Vcon.build_new()
+    signed.add_dialog(
+        Dialog(
+            type="recording",
+            start="2024-10-20T15:02:54",
+            parties=[0],
+            body=base64.urlsafe_b64encode(data).decode(),
+            encoding="base64url",
+            signature=base64.urlsafe_b64encode(hashlib.sha256(data).digest()).decode(),
+        )
+    )
+    tampered = Vcon.build_from_json(signed.to_json())
+    tampered.vcon_dict["dialog"][0]["body"] = "dGFtcGVyZWQ="
+    (tmp_path / "a.json").write_text(signed.to_json())
+    (tmp_path / "b.jsonl").write_text(signed.to_json() + "\n" + tampered.to_json())
+    (tmp_path / "c.json").write_text("invalid json")
+
+    reports = list(verify_many(tmp_path, workers=2, max_in_flight=1))
+
+    assert [(r.label.rsplit("/", 1)[-1], r.ok) for r in reports] == [
+        ("a.json", True),
+        ("b.jsonl:1", True),
+        ("b.jsonl:2", False),
+        ("c.json", False),
+    ]
+    assert reports[2].failures[0].status == MISMATCH
+    assert reports[3].error == "Invalid JSON format"
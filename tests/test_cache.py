@@ -0,0 +1,76 @@
+import hashlib
+import os
+
+from vcon.cache import MediaCache
+
+
+def store(cache: MediaCache, url: str, data: bytes, **headers) -> dict:
+    f = cache.new_file()
+    f.write(data)
+    headers.setdefault("ETag", '"v1"')
+    digest = hashlib.sha256(data).hexdigest()
+    return cache.store(url, headers, f, digest, len(data))
+
+
+def test_store_and_lookup(tmp_path) -> None:
+    cache = MediaCache(tmp_path)
+    entry = store(cache, "http://x/a", b"abc", **{"Content-Type": "audio/x-wav"})
+    assert cache.lookup("http://x/a") == entry
+    assert entry["content_type"] == "audio/x-wav"
+    assert entry["sha256"] == hashlib.sha256(b"abc").hexdigest()
+    with cache.open(entry) as f:
+        assert f.read() == b"abc"
+    assert cache.lookup("http://x/b") is None
+    assert os.listdir(tmp_path / "tmp") == []
+
+
+def test_content_addressed(tmp_path) -> None:
+    cache = MediaCache(tmp_path)
+    store(cache, "http://x/a", b"abc")
+    store(cache, "http://x/b", b"abc")
+    assert cache.size == 3
+    assert cache.lookup("http://x/a")["sha256"] == cache.lookup("http://x/b")["sha256"]
+
+    cache.discard("http://x/a")
+    assert cache.lookup("http://x/a") is None
+    assert cache.lookup("http://x/b") is not None
+
+
+def test_conditional_headers(tmp_path) -> None:
+    cache = MediaCache(tmp_path)
+    entry = store(
+        cache,
+        "http://x/a",
+        b"abc",
+        **{"Last-Modified": "Mon, 21 Oct 2024 07:28:00 GMT"}
+    )
+    assert MediaCache.conditional_headers(entry) == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 21 Oct 2024 07:28:00 GMT",
+    }
+    assert MediaCache.headers(entry)["Content-Length"] == "3"
+    assert MediaCache.is_cacheable({"ETag": '"v1"'})
+    assert not MediaCache.is_cacheable({"Content-Type": "audio/x-wav"})
+
+
+def test_evicts_least_recently_used(tmp_path) -> None:
+    cache = MediaCache(tmp_path, max_bytes=250)
+    for i, url in enumerate(("http://x/a", "http://x/b")):
+        entry = store(cache, url, bytes([i]) * 100)
+        path = tmp_path / "objects" / entry["sha256"][:2] / entry["sha256"]
+        os.utime(path, (1000 + i, 1000 + i))
+    # reading "a" makes "b" the least recently used
+    cache.open(cache.lookup("http://x/a")).close()
+    store(cache, "http://x/c", b"c" * 100)
+
+    assert cache.lookup("http://x/b") is None
+    assert cache.lookup("http://x/a") is not None
+    assert cache.lookup("http://x/c") is not None
+    assert cache.size == 200
+
+
+def test_size_survives_reopening(tmp_path) -> None:
+    store(MediaCache(tmp_path), "http://x/a", b"abc")
+    cache = MediaCache(tmp_path)
+    assert cache.size == 3
+    assert cache.lookup("http://x/a") is not None
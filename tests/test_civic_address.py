@@ -311,4 +311,15 @@ def test_initialize_with_mixed_data():
     address = CivicAddress(**mixed_data)
 
     # Then
-    assert address.to_dict() == mixed_data
\ No newline at end of file
+    assert address.to_dict() == mixed_data
+
+
+# Build from a dict, keeping unknown extension keys
+def test_from_dict_with_extension_keys():
+    address = CivicAddress.from_dict({"country": "US", "pc": "02840", "zz": "ext"})
+
+    assert address.country == "US"
+    assert address.a1 is None
+    assert address.zz == "ext"
+    assert list(address.to_dict()) == ["country", "pc", "zz"]
+    assert "country" not in address.__dict__
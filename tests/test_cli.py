@@ -0,0 +1,52 @@
+import json
+
+from vcon import Vcon
+from vcon.cli import validate_main
+
+
+def write_corpus(tmp_path) -> None:
+    (tmp_path / "a.json").write_text(Vcon.build_new().to_json())
+    (tmp_path / "b.json").write_text('{"some": "json"}')
+    (tmp_path / "c.jsonl").write_text(Vcon.build_new().to_json() + "\ninvalid json\n")
+
+
+def test_validate_text_report(tmp_path, capsys) -> None:
+    write_corpus(tmp_path)
+
+    assert validate_main([str(tmp_path), "--workers", "0", "--ordered"]) == 1
+
+    out, err = capsys.readouterr()
+    assert out.splitlines() == [
+        f"{tmp_path / 'b.json'}: Missing required field: uuid",
+        f"{tmp_path / 'b.json'}: Missing required field: vcon",
+        f"{tmp_path / 'c.jsonl'}:2: Invalid JSON format",
+    ]
+    assert err.startswith("4 checked, 2 valid, 2 invalid in ")
+    assert "docs/s" in err and "MB/s" in err
+
+
+def test_validate_json_report(tmp_path, capsys) -> None:
+    write_corpus(tmp_path)
+
+    assert validate_main([str(tmp_path / "*.json"), "-j", "2", "--json"]) == 1
+
+    report = json.loads(capsys.readouterr().out)
+    assert report["summary"]["total"] == 2
+    assert report["summary"]["valid"] == 1
+    assert report["summary"]["invalid"] == 1
+    assert report["summary"]["bytes"] == sum(
+        p.stat().st_size for p in tmp_path.glob("*.json")
+    )
+    assert report["invalid"] == [
+        {
+            "path": str(tmp_path / "b.json"),
+            "errors": Vcon.validate_file(str(tmp_path / "b.json"))[1],
+        }
+    ]
+
+
+def test_validate_all_valid(tmp_path, capsys) -> None:
+    (tmp_path / "a.json").write_text(Vcon.build_new().to_json())
+
+    assert validate_main([str(tmp_path / "a.json"), "-j", "0", "-q"]) == 0
+    assert capsys.readouterr().out == ""
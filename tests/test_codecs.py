@@ -0,0 +1,103 @@
+import base64
+import datetime
+import os
+
+import pytest
+
+from vcon import Vcon
+from vcon import codecs
+from vcon.media import MediaBody
+
+AUDIO = os.urandom(3000)
+
+FORMATS = [
+    pytest.param(
+        "cbor", marks=pytest.mark.skipif(codecs.cbor2 is None, reason="cbor2")
+    ),
+    pytest.param(
+        "msgpack", marks=pytest.mark.skipif(codecs.msgpack is None, reason="msgpack")
+    ),
+]
+
+
+@pytest.fixture
+def vcon(make_vcon) -> Vcon:
+    return make_vcon(
+        {
+            "mimetype": "audio/x-wav",
+            "body": base64.urlsafe_b64encode(AUDIO).decode(),
+            "encoding": "base64url",
+        },
+        {
+            "start": "2024-10-20T15:02:55",
+            "body": base64.urlsafe_b64encode(AUDIO[:1000]).decode().rstrip("="),
+            "encoding": "base64url",
+        },
+        attachments=[{"type": "document", "body": "aGk=\n", "encoding": "base64"}],
+        tags={"queue": "billing"},
+    )
+
+
+def encode(vcon: Vcon, fmt: str) -> bytes:
+    return vcon.to_cbor() if fmt == "cbor" else vcon.to_msgpack()
+
+
+def decode(data: bytes, fmt: str, **kwargs) -> Vcon:
+    if fmt == "cbor":
+        return Vcon.from_cbor(data, **kwargs)
+    return Vcon.from_msgpack(data, **kwargs)
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_round_trip(vcon, fmt) -> None:
+    before = vcon.to_json()
+    data = encode(vcon, fmt)
+    assert vcon.to_json() == before
+    assert AUDIO in data
+    assert len(data) < len(before)
+    assert decode(data, fmt).to_json() == before
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_round_trip_lazy(vcon, fmt) -> None:
+    restored = decode(encode(vcon, fmt), fmt, lazy=True)
+    body = restored.dialog[0]["body"]
+    assert isinstance(body, MediaBody)
+    assert body.raw() == AUDIO
+    # unpadded bodies travel as text
+    assert isinstance(restored.dialog[1]["body"], str)
+    assert restored.to_json() == vcon.to_json()
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_normalization(fmt) -> None:
+    document = {"uuid": "x", "vcon": "0.0.1", "created_at": "2024-10-20 15:02:54"}
+    data = codecs.to_cbor(document) if fmt == "cbor" else codecs.to_msgpack(document)
+    vcon = decode(data, fmt)
+    assert vcon.created_at == "2024-10-20T15:02:54"
+    assert vcon.attachments == []
+
+
+def test_cbor_datetime_created_at() -> None:
+    cbor2 = pytest.importorskip("cbor2")
+    created_at = datetime.datetime(
+        2024, 10, 20, 15, 2, 54, tzinfo=datetime.timezone.utc
+    )
+    data = cbor2.dumps({"uuid": "x", "vcon": "0.0.1", "created_at": created_at})
+    assert Vcon.from_cbor(data).created_at == "2024-10-20T15:02:54+00:00"
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+@pytest.mark.parametrize("data", [b"", b"\x92\x01", b"\x01"])
+def test_invalid(fmt, data) -> None:
+    with pytest.raises(ValueError):
+        decode(data, fmt)
+
+
+def test_missing_dependency(vcon, monkeypatch) -> None:
+    monkeypatch.setattr(codecs, "cbor2", None)
+    monkeypatch.setattr(codecs, "msgpack", None)
+    with pytest.raises(ImportError):
+        vcon.to_cbor()
+    with pytest.raises(ImportError):
+        vcon.to_msgpack()
@@ -0,0 +1,127 @@
+import base64
+import json
+import os
+import struct
+
+import pytest
+
+from vcon import Vcon
+from vcon import container
+from vcon.lazy import LazyBody
+from vcon.media import MediaBody
+
+AUDIO = os.urandom(30_000)
+
+
+@pytest.fixture
+def vcon(make_vcon) -> Vcon:
+    return make_vcon(
+        {
+            "mimetype": "audio/x-wav",
+            "body": base64.urlsafe_b64encode(AUDIO).decode().rstrip("="),
+            "encoding": "base64url",
+        },
+        {"type": "text", "start": "2024-10-20T15:02:55", "body": "hi"},
+        attachments=[
+            {
+                "type": "document",
+                "body": base64.b64encode(AUDIO[:999]).decode(),
+                "encoding": "base64",
+            },
+            # not in canonical form, so it stays inline
+            {"type": "x", "body": "aGk=\n" * 100, "encoding": "base64"},
+        ],
+    )
+
+
+def test_round_trip(vcon) -> None:
+    before = vcon.to_json()
+    data = vcon.to_bytes()
+    assert vcon.to_json() == before
+
+    assert container.is_container(data)
+    assert len(data) < len(before) - len(AUDIO) // 3
+    assert AUDIO in data
+
+    restored = Vcon.from_bytes(data)
+    assert restored.vcon_dict == vcon.vcon_dict
+    assert restored.to_json() == before
+
+
+def test_round_trip_lazy_body(vcon, tmp_path) -> None:
+    path = tmp_path / "lazy.vcon.json"
+    vcon.save(str(path))
+    vcon = Vcon.load(str(path), lazy=True)
+    assert isinstance(vcon.dialog[0]["body"], LazyBody)
+    restored = Vcon.from_bytes(vcon.to_bytes())
+    assert restored.to_json() == vcon.to_json()
+
+
+def test_from_bytes_lazy(vcon) -> None:
+    restored = Vcon.from_bytes(vcon.to_bytes(), lazy=True)
+    body = restored.dialog[0]["body"]
+    assert isinstance(body, MediaBody)
+    assert bytes(body.raw()) == AUDIO
+    assert restored.to_json() == vcon.to_json()
+    assert "".join(restored.iter_json(chunk_size=1000)) == vcon.to_json(backend="json")
+    # repacking reuses the raw bytes
+    assert Vcon.from_bytes(restored.to_bytes()).vcon_dict == vcon.vcon_dict
+
+
+def test_without_media() -> None:
+    vcon = Vcon.build_new()
+    assert Vcon.from_bytes(vcon.to_bytes()).vcon_dict == vcon.vcon_dict
+
+
+@pytest.mark.parametrize(
+    "data",
+    [b"{}", container.MAGIC, container.MAGIC + b"\x00\x00\x00\x00"],
+)
+def test_invalid(data) -> None:
+    with pytest.raises(ValueError):
+        container.from_bytes(data)
+
+
+def test_truncated(vcon) -> None:
+    data = vcon.to_bytes()
+    with pytest.raises(ValueError):
+        container.from_bytes(data[:-1])
+
+
+def test_every_truncation_raises_value_error(vcon) -> None:
+    data = vcon.to_bytes()
+    for length in range(len(data)):
+        with pytest.raises(ValueError):
+            Vcon.from_bytes(data[:length])
+
+
+def _with_metadata(metadata, *sections: bytes) -> bytes:
+    parts = [container.MAGIC, struct.pack(">I", len(sections) + 1)]
+    for section in (json.dumps(metadata).encode(), *sections):
+        parts += [struct.pack(">Q", len(section)), section]
+    return b"".join(parts)
+
+
+@pytest.mark.parametrize(
+    "metadata, message",
+    [
+        ([], "not a JSON object"),
+        ({"media": []}, "needs a vcon object"),
+        ({"vcon": {}}, "needs a vcon object"),
+        ({"vcon": {}, "media": [["dialog", 0, "base64", True]]}, "descriptor"),
+        (
+            {"vcon": {"dialog": []}, "media": [["dialog", 0, "base64", True]]},
+            "descriptor",
+        ),
+        (
+            {"vcon": {"dialog": [{}]}, "media": [["dialog", 0, "hex", True]]},
+            "descriptor",
+        ),
+        ({"vcon": {"dialog": [{}]}, "media": [["dialog", 0]]}, "descriptor"),
+    ],
+)
+def test_malformed_metadata(metadata, message) -> None:
+    media = metadata.get("media", []) if isinstance(metadata, dict) else []
+    data = _with_metadata(metadata, *[b"hi"] * len(media))
+    with pytest.raises(ValueError, match=message):
+        Vcon.from_bytes(data)
@@ -0,0 +1,111 @@
+import json
+
+import pytest
+
+from vcon import Vcon
+from vcon.copying import CopyOnWriteDict, CopyOnWriteList, cow_view, deep_copy
+
+
+def make_doc() -> dict:
+    return {
+        "uuid": "abc",
+        "parties": [{"tel": "+15551234567", "meta": {"role": "agent"}}],
+        "dialog": [{"type": "text", "parties": [0], "body": "hi"}],
+        "duration": 1.5,
+        "flag": True,
+        "missing": None,
+    }
+
+
+def test_deep_copy_matches_json_round_trip() -> None:
+    doc = make_doc()
+    copied = deep_copy(doc)
+    assert copied == json.loads(json.dumps(doc))
+    assert copied is not doc
+    assert copied["parties"] is not doc["parties"]
+    assert copied["parties"][0]["meta"] is not doc["parties"][0]["meta"]
+
+
+def test_deep_copy_converts_tuples_to_lists() -> None:
+    assert deep_copy({"parties": (0, 1)}) == {"parties": [0, 1]}
+
+
+def test_cow_view_reads_through() -> None:
+    doc = make_doc()
+    view = cow_view(doc)
+    assert isinstance(view, CopyOnWriteDict)
+    assert isinstance(view["parties"], CopyOnWriteList)
+    assert view["parties"][0]["tel"] == "+15551234567"
+    assert view == doc
+    assert len(view["dialog"]) == 1
+
+
+def test_cow_view_never_mutates_source() -> None:
+    doc = make_doc()
+    snapshot = deep_copy(doc)
+    view = cow_view(doc)
+
+    view["parties"][0]["meta"]["role"] = "customer"
+    view["parties"].append({"name": "Bob"})
+    view["dialog"][0]["body"] = "bye"
+    del view["missing"]
+    view["subject"] = "new"
+
+    assert doc == snapshot
+    assert view["parties"][0]["meta"]["role"] == "customer"
+    assert view["parties"][1] == {"name": "Bob"}
+    assert view["dialog"][0]["body"] == "bye"
+    assert "missing" not in view
+    assert view["subject"] == "new"
+
+
+def test_cow_view_copies_only_mutated_containers() -> None:
+    doc = make_doc()
+    view = cow_view(doc)
+    view["parties"][0]["meta"]["role"] = "customer"
+
+    # untouched containers are still shared with the source
+    assert view["dialog"]._data is doc["dialog"]
+    assert view._data is doc
+    assert view["parties"]._data is doc["parties"]
+    assert view["parties"][0]["meta"]._data is not doc["parties"][0]["meta"]
+
+
+def test_cow_view_materialize() -> None:
+    doc = make_doc()
+    view = cow_view(doc)
+    view["parties"][0]["meta"]["role"] = "customer"
+    plain = view.materialize()
+
+    assert type(plain) is dict
+    assert type(plain["parties"]) is list
+    assert plain["parties"][0]["meta"] == {"role": "customer"}
+    assert plain["dialog"] is not doc["dialog"]
+    assert json.loads(json.dumps(plain)) == plain
+
+
+def test_cow_list_negative_index() -> None:
+    view = cow_view([1, 2, 3])
+    assert view[-1] == 3
+    with pytest.raises(IndexError):
+        view[-4]
+
+
+def test_vcon_to_dict_modes() -> None:
+    vcon = Vcon.build_new()
+    vcon.add_tag("a", "b")
+
+    deep = vcon.to_dict()
+    assert deep == json.loads(vcon.to_json())
+    assert deep["attachments"] is not vcon.vcon_dict["attachments"]
+
+    shallow = vcon.to_dict(mode="shallow")
+    assert shallow is not vcon.vcon_dict
+    assert shallow["attachments"] is vcon.vcon_dict["attachments"]
+
+    view = vcon.to_dict(mode="cow")
+    view["attachments"][0]["body"].append("c:d")
+    assert vcon.vcon_dict["attachments"][0]["body"] == ["a:b"]
+
+    with pytest.raises(ValueError):
+        vcon.to_dict(mode="nope")
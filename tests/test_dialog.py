@@ -1,5 +1,6 @@
 import pytest
 from src.vcon.dialog import Dialog
+from src.vcon.party import PartyHistory
 import hashlib
 import base64
 import requests
@@ -200,6 +201,8 @@ class TestDialog:
         response_mock.status_code = 200
         response_mock.headers = {"Content-Type": "text/plain"}
         response_mock.text = "sample data"
+        # the media is streamed
+        response_mock.iter_content.return_value = [response_mock.text.encode()]
         mocker.patch("requests.get", return_value=response_mock)
 
         # Act
@@ -244,6 +247,8 @@ class TestDialog:
         response_mock.status_code = 200
         response_mock.headers = {"Content-Type": mimetype}
         response_mock.text = "dummy data"
+        # the media is streamed
+        response_mock.iter_content.return_value = [response_mock.text.encode()]
         mocker.patch("requests.get", return_value=response_mock)
 
         # Invoke
@@ -264,6 +269,8 @@ class TestDialog:
         response_mock.status_code = 200
         response_mock.headers = {"Content-Type": mimetype}
         response_mock.text = "dummy data"
+        # the media is streamed
+        response_mock.iter_content.return_value = [response_mock.text.encode()]
         mocker.patch("requests.get", return_value=response_mock)
 
         # Invoke
@@ -393,6 +400,8 @@ class TestDialog:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.content = fake_binary_data
+        # the media is streamed
+        mock_response.iter_content.return_value = [mock_response.content]
         mock_response.headers = {"Content-Type": "audio/x-wav"}
 
         # Create a dialog with external data
@@ -442,3 +451,87 @@ class TestDialog:
             with pytest.raises(Exception) as exc_info:
                 dialog.to_inline_data()
             assert "Failed to fetch external data: 404" in str(exc_info.value)
+
+    def test_start_rfc3339_is_parsed_without_dateutil(self):
+        from src.vcon.timestamps import clear_cache
+
+        clear_cache()
+        with patch("src.vcon.timestamps.parser") as mock_parser:
+            dialog = Dialog(type="text", start="2022-03-04T05:06:07.5Z", parties=[0])
+            offset = Dialog(type="text", start="2022-03-04 05:06:07-05:30", parties=[0])
+        mock_parser.parse.assert_not_called()
+        assert dialog.start == "2022-03-04T05:06:07.500000+00:00"
+        assert offset.start == "2022-03-04T05:06:07-05:30"
+
+    def test_start_in_other_formats_falls_back_to_dateutil(self):
+        dialog = Dialog(type="text", start="March 4 2022 05:06", parties=[0])
+        assert dialog.start == "2022-03-04T05:06:00"
+
+    def test_from_dict_trusted_skips_normalization(self):
+        data = {"type": "text", "start": "not normalized", "parties": [0], "url": None}
+
+        with patch("src.vcon.dialog.normalize_timestamp") as normalize:
+            dialog = Dialog.from_dict(data, trusted=True)
+            normalize.assert_not_called()
+
+        assert dialog.start == "not normalized"
+        assert not hasattr(dialog, "url")
+        dialog.body = "changed"
+        assert "body" not in data
+
+    def test_from_dict_untrusted_uses_constructor(self):
+        dialog = Dialog.from_dict(
+            {"type": "text", "start": "2024-01-01T00:00:00Z", "parties": [0]}
+        )
+        assert dialog.start == "2024-01-01T00:00:00+00:00"
+
+    def test_bind_writes_through(self):
+        data = {"type": "text", "start": "2024-01-01T00:00:00Z", "parties": [0]}
+        dialog = Dialog.bind(data)
+
+        dialog.add_inline_data("aGVsbG8", "hello.txt", "text/plain")
+        assert data["body"] == "aGVsbG8"
+        assert data["filename"] == "hello.txt"
+        assert dialog.is_text()
+
+        del dialog.filename
+        assert "filename" not in data
+        assert dialog.to_dict() == data
+
+    def test_to_dict_accepts_party_history_dicts(self):
+        now = datetime.now()
+        dialog = Dialog.bind(
+            {
+                "type": "audio",
+                "start": "2024-01-01T00:00:00Z",
+                "parties": [0, 1],
+                "party_history": [
+                    {"party": 0, "event": "join", "time": "2024-01-01T00:00:00Z"}
+                ],
+            }
+        )
+        dialog.party_history.append(PartyHistory(1, "join", now))
+        assert dialog.to_dict()["party_history"] == [
+            {"party": 0, "event": "join", "time": "2024-01-01T00:00:00Z"},
+            {"party": 1, "event": "join", "time": now},
+        ]
+
+    def test_rare_and_extension_fields_use_overflow_dict(self):
+        dialog = Dialog(
+            type="text",
+            start="2024-01-01T00:00:00Z",
+            parties=[0],
+            campaign="spring",
+            custom="x",
+        )
+        assert dialog.__dict__ == {"campaign": "spring", "custom": "x"}
+        assert list(dialog.to_dict()) == [
+            "type",
+            "start",
+            "parties",
+            "campaign",
+            "custom",
+        ]
+
+        dialog.body = None
+        assert "body" not in dialog.to_dict()
@@ -0,0 +1,362 @@
+import asyncio
+import base64
+import hashlib
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from vcon import Vcon
+from vcon import fetch
+from vcon.cache import MediaCache
+from vcon.dialog import Dialog
+
+AUDIO = os.urandom(50_000)
+
+
+def signature(data: bytes) -> str:
+    return base64.urlsafe_b64encode(hashlib.sha256(data).digest()).decode()
+
+
+class MediaServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), MediaHandler)
+        self.files = {}
+        # path -> number of 503 responses to send before succeeding
+        self.failures = {}
+        self.delay = 0.0
+        self.requests = []
+        # whether each request was conditional
+        self.conditional = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self.server_port}{path}"
+
+
+class MediaHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        path = self.path.split("?")[0]
+        with server.lock:
+            server.requests.append(path)
+            server.conditional.append("If-None-Match" in self.headers)
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        try:
+            time.sleep(server.delay)
+            with server.lock:
+                failures = server.failures.get(path, 0)
+                if failures:
+                    server.failures[path] = failures - 1
+            if failures:
+                self.send_error(503)
+                return
+            if path not in server.files:
+                self.send_error(404)
+                return
+            body = server.files[path]
+            etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "audio/x-wav")
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+
+@pytest.fixture
+def server():
+    server = MediaServer()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def external_dialogs(server, count: int) -> list:
+    dialogs = []
+    for i in range(count):
+        path = f"/recording-{i}.wav"
+        server.files[path] = AUDIO[i:]
+        dialogs.append({"url": server.url(path)})
+    dialogs.append({"type": "text", "start": "2024-10-20T15:02:55"})
+    return dialogs
+
+
+def test_inline_all_external(make_vcon, server) -> None:
+    server.delay = 0.05
+    vcon = make_vcon(*external_dialogs(server, 8))
+    assert vcon.inline_all_external(max_concurrency=4) == 8
+
+    assert server.max_active > 1
+    for i, dialog in enumerate(vcon.dialog[:8]):
+        assert "url" not in dialog
+        assert dialog["filename"] == f"recording-{i}.wav"
+        assert dialog["mimetype"] == "audio/x-wav"
+        assert base64.urlsafe_b64decode(dialog["body"]) == AUDIO[i:]
+        assert dialog["signature"] == signature(AUDIO[i:])
+    assert "body" not in vcon.dialog[8]
+    assert vcon.find_dialog("filename", "recording-3.wav") is not None
+
+
+def test_inline_all_external_without_external_dialogs() -> None:
+    assert Vcon.build_new().inline_all_external() == 0
+
+
+def test_inline_all_external_retries(make_vcon, server) -> None:
+    vcon = make_vcon(*external_dialogs(server, 2))
+    server.failures["/recording-0.wav"] = 2
+    assert vcon.inline_all_external(retries=2, backoff=0) == 2
+    assert server.requests.count("/recording-0.wav") == 3
+
+
+def test_inline_all_external_reports_failures(make_vcon, server) -> None:
+    vcon = make_vcon(*external_dialogs(server, 3))
+    del server.files["/recording-1.wav"]
+    server.failures["/recording-2.wav"] = 5
+
+    with pytest.raises(fetch.InlineError) as excinfo:
+        vcon.inline_all_external(retries=1, backoff=0)
+
+    errors = excinfo.value.errors
+    assert sorted(errors) == [1, 2]
+    assert errors[1].status_code == 404
+    assert errors[2].status_code == 503
+    assert "body" in vcon.dialog[0]
+    assert vcon.dialog[1]["url"] == server.url("/recording-1.wav")
+
+
+def test_inline_all_external_byte_budget(make_vcon, server) -> None:
+    vcon = make_vcon(*external_dialogs(server, 3))
+    with pytest.raises(fetch.InlineError) as excinfo:
+        vcon.inline_all_external(max_concurrency=1, max_bytes=2 * len(AUDIO))
+    assert len(excinfo.value.errors) == 1
+    assert sum("body" in dialog for dialog in vcon.dialog) == 2
+
+
+def test_inline_all_external_uses_session(make_vcon, server) -> None:
+    vcon = make_vcon(*external_dialogs(server, 2))
+    with requests.Session() as session:
+        vcon.inline_all_external(session=session)
+        # the caller's session is not closed
+        assert session.get(server.url("/recording-0.wav")).status_code == 200
+
+
+def test_get_timeout(server) -> None:
+    server.delay = 0.5
+    server.files["/slow"] = b"x"
+    with pytest.raises(requests.Timeout):
+        fetch.get_media(server.url("/slow"), timeout=0.05)
+
+
+def test_byte_budget() -> None:
+    budget = fetch.ByteBudget(10)
+    budget.charge(6)
+    with pytest.raises(fetch.FetchError):
+        budget.charge(5)
+    budget.check(4)
+    budget.charge(4)
+    assert budget.used == 10
+    fetch.ByteBudget(None).charge(10**12)
+
+
+def test_ainline_all_external(make_vcon, server) -> None:
+    pytest.importorskip("httpx")
+    server.delay = 0.05
+    vcon = make_vcon(*external_dialogs(server, 8))
+    assert asyncio.run(vcon.ainline_all_external(max_concurrency=4)) == 8
+
+    assert server.max_active > 1
+    for i, dialog in enumerate(vcon.dialog[:8]):
+        assert "url" not in dialog
+        assert dialog["filename"] == f"recording-{i}.wav"
+        assert base64.urlsafe_b64decode(dialog["body"]) == AUDIO[i:]
+        assert dialog["signature"] == signature(AUDIO[i:])
+
+
+def test_ainline_all_external_reports_failures(make_vcon, server) -> None:
+    pytest.importorskip("httpx")
+    vcon = make_vcon(*external_dialogs(server, 3))
+    del server.files["/recording-1.wav"]
+    server.failures["/recording-2.wav"] = 1
+
+    with pytest.raises(fetch.InlineError) as excinfo:
+        asyncio.run(vcon.ainline_all_external(retries=1, backoff=0))
+
+    assert list(excinfo.value.errors) == [1]
+    assert excinfo.value.errors[1].status_code == 404
+    assert server.requests.count("/recording-2.wav") == 2
+    assert "body" in vcon.dialog[2]
+
+
+def test_ato_inline_data_with_client(server) -> None:
+    httpx = pytest.importorskip("httpx")
+    server.files["/a.wav"] = AUDIO
+
+    async def run(dialog):
+        async with httpx.AsyncClient() as client:
+            await dialog.ato_inline_data(client)
+
+    dialog = Dialog(
+        type="recording", start="2024-10-20", parties=[0], url=server.url("/a.wav")
+    )
+    asyncio.run(run(dialog))
+    assert not dialog.is_external_data()
+    assert dialog.body == base64.urlsafe_b64encode(AUDIO).decode()
+    assert dialog.signature == signature(AUDIO)
+    assert dialog.mimetype == "audio/x-wav"
+
+
+def test_aadd_external_data(server) -> None:
+    pytest.importorskip("httpx")
+    server.files["/a.wav"] = AUDIO
+    dialog = Dialog(type="recording", start="2024-10-20", parties=[0])
+    asyncio.run(dialog.aadd_external_data(server.url("/a.wav?x=1"), None, None))
+    assert dialog.filename == "a.wav"
+    assert dialog.mimetype == "audio/x-wav"
+    assert dialog.signature == signature(AUDIO)
+    assert not hasattr(dialog, "body")
+
+
+def test_aget_media_byte_budget(server) -> None:
+    pytest.importorskip("httpx")
+    server.files["/a.wav"] = AUDIO
+    budget = fetch.ByteBudget(len(AUDIO) - 1)
+    with pytest.raises(fetch.FetchError):
+        asyncio.run(fetch.aget_media(server.url("/a.wav"), budget=budget))
+
+
+def test_add_external_data_signs_raw_bytes(server) -> None:
+    server.files["/a.wav"] = AUDIO
+    dialog = Dialog(type="recording", start="2024-10-20", parties=[0])
+    dialog.add_external_data(server.url("/a.wav"), None, None)
+    assert dialog.signature == signature(AUDIO)
+
+
+def test_get_media_streams_in_chunks(server) -> None:
+    server.files["/a.wav"] = AUDIO
+    headers, encoder = fetch.get_media(server.url("/a.wav"), chunk_size=1000)
+    assert headers["Content-Length"] == str(len(AUDIO))
+    assert encoder.size == len(AUDIO)
+    assert encoder.body() == base64.urlsafe_b64encode(AUDIO).decode()
+    assert encoder.signature() == signature(AUDIO)
+
+
+def test_get_media_revalidates_cached_media(server, tmp_path) -> None:
+    server.files["/a.wav"] = AUDIO
+    cache = MediaCache(tmp_path)
+    url = server.url("/a.wav")
+    fetch.get_media(url, cache=cache)
+    budget = fetch.ByteBudget(0)
+    headers, encoder = fetch.get_media(url, cache=cache, budget=budget)
+
+    assert server.conditional == [False, True]
+    assert headers["Content-Type"] == "audio/x-wav"
+    assert encoder.body() == base64.urlsafe_b64encode(AUDIO).decode()
+    assert encoder.signature() == signature(AUDIO)
+    # served from the cache, so nothing was downloaded
+    assert budget.used == 0
+
+
+def test_get_media_refetches_changed_media(server, tmp_path) -> None:
+    server.files["/a.wav"] = AUDIO
+    cache = MediaCache(tmp_path)
+    url = server.url("/a.wav")
+    fetch.get_media(url, cache=cache)
+    server.files["/a.wav"] = AUDIO[::-1]
+    _, encoder = fetch.get_media(url, cache=cache)
+    assert encoder.signature() == signature(AUDIO[::-1])
+    assert cache.lookup(url)["sha256"] == hashlib.sha256(AUDIO[::-1]).hexdigest()
+
+
+def test_get_media_refetches_damaged_cache(server, tmp_path) -> None:
+    server.files["/a.wav"] = AUDIO
+    cache = MediaCache(tmp_path)
+    url = server.url("/a.wav")
+    fetch.get_media(url, cache=cache)
+    digest = hashlib.sha256(AUDIO).hexdigest()
+    with open(tmp_path / "objects" / digest[:2] / digest, "r+b") as f:
+        f.write(b"XX")
+
+    _, encoder = fetch.get_media(url, cache=cache)
+    assert encoder.signature() == signature(AUDIO)
+    assert server.conditional == [False, True, False]
+
+
+def test_inline_all_external_with_cache(make_vcon, server, tmp_path) -> None:
+    cache = MediaCache(tmp_path)
+    make_vcon(*external_dialogs(server, 3)).inline_all_external(cache=cache)
+    vcon = make_vcon(*external_dialogs(server, 3))
+    assert vcon.inline_all_external(cache=cache) == 3
+    assert server.conditional.count(True) == 3
+    for i, dialog in enumerate(vcon.dialog[:3]):
+        assert base64.urlsafe_b64decode(dialog["body"]) == AUDIO[i:]
+
+
+def test_is_external_data_changed(server, tmp_path) -> None:
+    server.files["/a.wav"] = AUDIO
+    cache = MediaCache(tmp_path)
+    dialog = Dialog(
+        type="recording", start="2024-10-20", parties=[0], url=server.url("/a.wav")
+    )
+    dialog.add_external_data(dialog.url, None, None, cache=cache)
+    assert not dialog.is_external_data_changed(download=True, cache=cache)
+    assert server.conditional == [False, True]
+
+    server.files["/a.wav"] = AUDIO[1:]
+    assert dialog.is_external_data_changed(download=True, cache=cache)
+
+
+def test_is_external_data_changed_does_not_fetch_by_default(server) -> None:
+    server.files["/a.wav"] = AUDIO
+    dialog = Dialog(
+        type="recording", start="2024-10-20", parties=[0], url=server.url("/a.wav")
+    )
+    dialog.add_external_data(dialog.url, None, None)
+    requests_before = len(server.conditional)
+    assert dialog.is_external_data_changed()
+    assert len(server.conditional) == requests_before
+
+
+def test_verify_media_external(make_vcon, server, tmp_path) -> None:
+    vcon = make_vcon(*external_dialogs(server, 3))
+    cache = MediaCache(tmp_path)
+    for i, dialog in enumerate(vcon.dialog[:3]):
+        dialog["signature"] = signature(AUDIO[i:])
+    server.files["/recording-1.wav"] = b"changed"
+    del server.files["/recording-2.wav"]
+
+    report = vcon.verify_media(workers=4, cache=cache)
+    assert [(r.status, r.source) for r in report.results] == [
+        ("ok", "external"),
+        ("mismatch", "external"),
+        ("error", "external"),
+    ]
+    assert report.results[0].size == len(AUDIO)
+    assert report.results[2].error == "Failed to fetch external data: 404"
+
+    # unchanged media is confirmed from the cache
+    vcon.verify_media(cache=cache)
+    assert server.conditional[-3:].count(True) == 2
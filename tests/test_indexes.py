@@ -0,0 +1,190 @@
+import pickle
+
+from vcon import Vcon
+from vcon.indexes import FieldIndex
+
+
+def _vcon_with_analysis(count: int) -> Vcon:
+    vcon = Vcon.build_new()
+    for i in range(count):
+        vcon.add_analysis(
+            type="summary" if i % 2 else "transcript",
+            dialog=0,
+            vendor="v",
+            body=str(i),
+        )
+    return vcon
+
+
+def test_find_all_analysis_by_type():
+    vcon = _vcon_with_analysis(6)
+    summaries = vcon.find_all_analysis_by_type("summary")
+    assert [a["body"] for a in summaries] == ["1", "3", "5"]
+    assert vcon.find_analysis_by_type("transcript")["body"] == "0"
+    assert vcon.find_all_analysis_by_type("sentiment") == []
+    assert vcon.find_analysis_by_type("sentiment") is None
+
+
+def test_add_methods_update_the_index_incrementally():
+    vcon = _vcon_with_analysis(2)
+    index_before = vcon.find_all_analysis_by_type("summary")
+    vcon.add_analysis(type="summary", dialog=0, vendor="v", body="new")
+    assert len(vcon.find_all_analysis_by_type("summary")) == len(index_before) + 1
+
+    vcon.add_attachment(type="transcript", body="a")
+    vcon.add_attachment(type="transcript", body="b")
+    assert [a["body"] for a in vcon.find_all_attachments_by_type("transcript")] == [
+        "a",
+        "b",
+    ]
+    vcon.add_tag("color", "red")
+    assert vcon.find_attachment_by_type("tags")["body"] == ["color:red"]
+
+
+def test_direct_mutation_is_noticed():
+    vcon = _vcon_with_analysis(4)
+    assert len(vcon.find_all_analysis_by_type("summary")) == 2
+
+    # appended directly to the dict
+    vcon.vcon_dict["analysis"].append({"type": "summary", "body": "direct"})
+    assert vcon.find_all_analysis_by_type("summary")[-1]["body"] == "direct"
+
+    # removed directly
+    del vcon.vcon_dict["analysis"][0]
+    assert vcon.find_analysis_by_type("transcript")["body"] == "2"
+
+    # replaced list
+    vcon.vcon_dict["analysis"] = [{"type": "other"}]
+    assert vcon.find_analysis_by_type("summary") is None
+    assert vcon.find_analysis_by_type("other") == {"type": "other"}
+
+    # an indexed entry changed type in place
+    vcon.vcon_dict["analysis"][0]["type"] = "renamed"
+    assert vcon.find_analysis_by_type("other") is None
+
+
+def test_types_are_indexed_without_build_index():
+    vcon = _vcon_with_analysis(4)
+    assert list(vcon._indexes) == [("attachments", "type"), ("analysis", "type")]
+    assert vcon.find_analysis_by_type("summary")["body"] == "1"
+
+    def fail(entry):
+        raise AssertionError("scanned")
+
+    vcon._indexes[("analysis", "type")]._getter = fail
+    assert vcon.find_analysis_by_type("sentiment") is None
+
+
+def test_type_changed_in_place_is_found_after_invalidating():
+    vcon = _vcon_with_analysis(2)
+    vcon.add_attachment(type="foo", body="a")
+    assert vcon.find_attachment_by_type("foo")["body"] == "a"
+    vcon.vcon_dict["attachments"][0]["type"] = "bar"
+    assert vcon.find_attachment_by_type("foo") is None
+    vcon.invalidate_indexes()
+    assert vcon.find_attachment_by_type("bar")["body"] == "a"
+
+
+def test_invalidate_indexes():
+    vcon = _vcon_with_analysis(2)
+    assert vcon.find_analysis_by_type("summary")["body"] == "1"
+    # an entry starting to match is only seen after invalidating
+    vcon.vcon_dict["analysis"][0]["type"] = "summary"
+    assert vcon.find_analysis_by_type("summary")["body"] == "1"
+    vcon.invalidate_indexes()
+    assert vcon.find_analysis_by_type("summary")["body"] == "0"
+
+
+def test_unhashable_values():
+    entries = [{"type": ["a"]}, {"type": "b"}, {"type": ["a"]}, {}]
+    index = FieldIndex("type")
+    assert index.positions(entries, ["a"]) == [0, 2]
+    assert index.positions(entries, "b") == [1]
+
+
+def test_nested_paths():
+    entries = [{"meta": {"role": "agent"}}, {"meta": {"role": "customer"}}, {}]
+    assert FieldIndex("meta.role").positions(entries, "customer") == [1]
+
+
+def test_vcon_with_indexes_pickles():
+    vcon = _vcon_with_analysis(2)
+    vcon.find_analysis_by_type("summary")
+    clone = pickle.loads(pickle.dumps(vcon))
+    clone.vcon_dict["analysis"][1]["type"] = "changed"
+    assert clone.find_analysis_by_type("summary") is None
+    assert vcon.find_analysis_by_type("summary")["body"] == "1"
+
+
+def _conference(count: int) -> Vcon:
+    from vcon.party import Party
+
+    vcon = Vcon.build_new()
+    for i in range(count):
+        vcon.add_party(Party(tel=f"+1555000{i:04d}", mailto=f"user{i}@example.com"))
+    return vcon
+
+
+def test_find_party_index_uses_index():
+    vcon = _conference(300)
+    assert vcon.find_party_index("tel", "+15550000299") == 299
+    assert ("parties", "tel") not in vcon._indexes
+
+    vcon.build_index("tel")
+    assert vcon.find_party_index("tel", "+15550000299") == 299
+    assert vcon.find_party_index("mailto", "user7@example.com") == 7
+    assert vcon.find_party_index("tel", "+19999999999") is None
+    assert [key for key in vcon._indexes if key[0] == "parties"] == [("parties", "tel")]
+
+
+def test_party_starting_to_match_is_found():
+    from vcon.party import Party
+
+    for build in (False, True):
+        vcon = Vcon.build_new()
+        vcon.add_party(Party(tel="+1"))
+        vcon.add_party(Party(tel="+2"))
+        if build:
+            vcon.build_index("tel")
+        assert vcon.find_party_index("tel", "+2") == 1
+        vcon.vcon_dict["parties"][0]["tel"] = "+3"
+        if build:
+            vcon.invalidate_indexes()
+        assert vcon.find_party_index("tel", "+3") == 0
+        assert vcon.find_party_index("tel", "+1") is None
+
+
+def test_party_index_follows_add_party_and_direct_edits():
+    from vcon.party import Party
+
+    vcon = _conference(3)
+    vcon.build_index("tel")
+    vcon.add_party(Party(tel="+15559999999"))
+    assert vcon.find_party_index("tel", "+15559999999") == 3
+
+    vcon.vcon_dict["parties"].insert(0, {"tel": "+15558888888"})
+    assert vcon.find_party_index("tel", "+15559999999") == 4
+
+    vcon.vcon_dict["parties"][0]["tel"] = "+15557777777"
+    assert vcon.find_party_index("tel", "+15558888888") is None
+    assert vcon.find_party_index("tel", "+15557777777") == 0
+
+
+def test_find_dialog_uses_index():
+    from vcon.dialog import Dialog
+
+    vcon = _conference(2)
+    for i in range(5):
+        vcon.add_dialog(
+            Dialog(
+                type="text",
+                start="2024-01-01T00:00:00Z",
+                parties=[0, 1],
+                body=f"message {i}",
+                meta={"seq": i},
+            )
+        )
+    vcon.build_index("meta.seq", section="dialog")
+    assert vcon.find_dialog("meta.seq", 3).body == "message 3"
+    assert vcon.find_dialog("body", "message 4").meta == {"seq": 4}
+    assert vcon.find_dialog("body", "missing") is None
@@ -0,0 +1,84 @@
+import json
+
+import pytest
+
+from vcon import Vcon
+from vcon import json_backend
+from vcon.json_backend import (
+    JsonBackend,
+    available_backends,
+    get_backend,
+    set_default_backend,
+)
+
+
+@pytest.fixture
+def restore_default_backend():
+    default = get_backend()
+    yield
+    set_default_backend(default.name)
+
+
+@pytest.mark.parametrize("name", available_backends())
+def test_backend_round_trip(name) -> None:
+    backend = get_backend(name)
+    doc = {"uuid": "abc", "parties": [{"name": "Zoë"}], "duration": 1.5, "n": None}
+
+    text = backend.dumps(doc)
+    data = backend.dumps(doc, as_bytes=True)
+
+    assert isinstance(text, str)
+    assert isinstance(data, bytes)
+    assert backend.loads(text) == doc
+    assert backend.loads(data) == doc
+    assert backend.loads(memoryview(data)) == doc
+
+
+@pytest.mark.parametrize("name", available_backends())
+def test_backend_raises_json_decode_error(name) -> None:
+    with pytest.raises(json.JSONDecodeError):
+        get_backend(name).loads("invalid_json")
+
+
+def test_stdlib_backend_is_always_available() -> None:
+    assert "json" in available_backends()
+    assert isinstance(get_backend("json"), JsonBackend)
+
+
+def test_orjson_is_default_when_installed() -> None:
+    if json_backend.orjson is None:
+        assert get_backend().name == "json"
+    else:
+        assert get_backend().name == "orjson"
+
+
+def test_unknown_backend() -> None:
+    with pytest.raises(ValueError):
+        get_backend("nope")
+
+
+def test_orjson_falls_back_for_big_integers() -> None:
+    if "orjson" not in available_backends():
+        pytest.skip("orjson is not installed")
+    assert get_backend("orjson").dumps({"n": 2**70}) == '{"n": 1180591620717411303424}'
+
+
+def test_set_default_backend(restore_default_backend) -> None:
+    set_default_backend("json")
+    assert get_backend().name == "json"
+    assert Vcon.build_new().to_json().startswith('{"uuid": ')
+
+
+def test_vcon_to_json_per_call_backend() -> None:
+    vcon = Vcon.build_new()
+    for name in available_backends():
+        data = vcon.to_json(backend=name, as_bytes=True)
+        assert isinstance(data, bytes)
+        assert json.loads(data) == vcon.to_dict()
+
+
+def test_vcon_build_from_json_bytes() -> None:
+    vcon = Vcon.build_new()
+    data = vcon.to_json(as_bytes=True)
+    assert Vcon.build_from_json(data, backend="json").to_dict() == vcon.to_dict()
+    assert Vcon.validate_json(data) == vcon.is_valid()
@@ -0,0 +1,163 @@
+import base64
+import copy
+import json
+import os
+
+import pytest
+
+from vcon import Vcon
+from vcon.json_backend import available_backends, get_backend
+from vcon.lazy import MIN_LAZY_LENGTH, LazyBody, loads_lazy
+
+BODY = base64.urlsafe_b64encode(os.urandom(MIN_LAZY_LENGTH)).decode()
+
+
+@pytest.fixture
+def vcon_json(make_vcon) -> str:
+    vcon = make_vcon(
+        {
+            "mimetype": "audio/x-wav",
+            "body": BODY,
+            "encoding": "base64url",
+            "meta": {"body": BODY},
+        },
+        {"type": "text", "start": "2024-10-20T15:02:55", "body": "hi"},
+        attachments=[{"type": "document", "body": BODY, "encoding": "base64url"}],
+        tags={"queue": "billing"},
+    )
+    return vcon.to_json(backend="json")
+
+
+@pytest.mark.parametrize("backend", available_backends())
+@pytest.mark.parametrize("encode", [False, True])
+def test_loads_lazy(vcon_json, backend, encode) -> None:
+    text = vcon_json
+    document = loads_lazy(text.encode() if encode else text, get_backend(backend))
+
+    body = document["dialog"][0]["body"]
+    assert isinstance(body, LazyBody)
+    assert len(body) == len(BODY)
+    assert str(body) == BODY
+    assert body == BODY
+    assert body.encode() == BODY.encode()
+    assert isinstance(document["attachments"][1]["body"], LazyBody)
+    # short bodies and non-body members are parsed normally
+    assert document["dialog"][1]["body"] == "hi"
+    assert document["dialog"][0]["meta"]["body"] == BODY
+    assert type(document["dialog"][0]["meta"]["body"]) is str
+
+
+def test_loads_lazy_only_proxies_base64_dialog_and_attachment_bodies() -> None:
+    text = json.dumps(
+        {
+            "meta": {"body": BODY},
+            "dialog": [{"body": BODY}, {"body": BODY, "encoding": "base64"}],
+            "attachments": [{"type": "note", "body": "A" * 5000, "encoding": "none"}],
+            "analysis": [{"body": BODY, "encoding": "base64url"}],
+        }
+    )
+    document = loads_lazy(text, get_backend("json"))
+
+    assert document == json.loads(text)
+    assert isinstance(document["dialog"][1]["body"], LazyBody)
+    for body in (
+        document["meta"]["body"],
+        document["dialog"][0]["body"],
+        document["attachments"][0]["body"],
+        document["analysis"][0]["body"],
+    ):
+        assert type(body) is str
+    assert document["attachments"][0]["body"].upper() == "A" * 5000
+
+
+def test_loads_lazy_ignores_escaped_body_text() -> None:
+    text = json.dumps({"meta": {"note": '{"body": "%s"}' % BODY}})
+    assert loads_lazy(text, get_backend("json")) == json.loads(text)
+
+
+def test_build_from_json_lazy_round_trip(vcon_json) -> None:
+    text = vcon_json
+    eager = Vcon.build_from_json(text)
+    lazy = Vcon.build_from_json(text, lazy=True)
+
+    assert isinstance(lazy.dialog[0]["body"], LazyBody)
+    assert lazy.get_tag("queue") == "billing"
+    assert lazy.is_valid() == eager.is_valid()
+    for backend in available_backends():
+        assert json.loads(lazy.to_json(backend=backend)) == eager.to_dict()
+
+
+def test_lazy_body_survives_copies(vcon_json) -> None:
+    lazy = Vcon.build_from_json(vcon_json, lazy=True)
+    body = lazy.dialog[0]["body"]
+
+    assert copy.deepcopy(body) is body
+    assert Vcon(lazy.vcon_dict).dialog[0]["body"] == BODY
+
+
+@pytest.mark.parametrize("mode", ["deep", "shallow", "cow"])
+def test_to_dict_of_lazy_vcon_is_json_native(vcon_json, mode) -> None:
+    text = vcon_json
+    lazy = Vcon.build_from_json(text, lazy=True)
+
+    data = lazy.to_dict(mode)
+    if mode == "cow":
+        assert type(data["dialog"][0]["body"]) is str
+        data = data.materialize()
+    assert json.loads(json.dumps(data)) == json.loads(text)
+    assert isinstance(lazy.dialog[0]["body"], LazyBody)
+
+
+def test_load(vcon_json, tmp_path) -> None:
+    file_path = tmp_path / "vcon.json"
+    file_path.write_text(vcon_json)
+
+    eager = Vcon.load(str(file_path))
+    lazy = Vcon.load(str(file_path), lazy=True)
+
+    assert type(eager.dialog[0]["body"]) is str
+    assert isinstance(lazy.dialog[0]["body"], LazyBody)
+    assert lazy.dialog[0]["body"] == eager.dialog[0]["body"]
+    assert lazy.find_dialog("type", "recording").body == BODY
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_load_mmap(vcon_json, tmp_path, lazy) -> None:
+    file_path = tmp_path / "vcon.json"
+    file_path.write_text(vcon_json)
+
+    vcon = Vcon.load(str(file_path), lazy=lazy, mmap=True)
+
+    assert vcon.to_dict() == Vcon.load(str(file_path)).to_dict()
+    assert isinstance(vcon.dialog[0]["body"], LazyBody) is lazy
+
+
+def test_load_mmap_empty_file(tmp_path) -> None:
+    file_path = tmp_path / "empty.json"
+    file_path.write_text("")
+    with pytest.raises(json.JSONDecodeError):
+        Vcon.load(str(file_path), mmap=True)
+
+
+def test_save(vcon_json, tmp_path) -> None:
+    file_path = tmp_path / "vcon.json"
+    vcon = Vcon.build_from_json(vcon_json)
+
+    vcon.save(str(file_path))
+
+    assert json.loads(file_path.read_text()) == vcon.to_dict()
+    assert [p.name for p in tmp_path.iterdir()] == ["vcon.json"]
+
+
+def test_save_over_mmapped_source(vcon_json, tmp_path) -> None:
+    file_path = tmp_path / "vcon.json"
+    file_path.write_text(vcon_json)
+    vcon = Vcon.load(str(file_path), lazy=True, mmap=True)
+    vcon.add_tag("saved", "yes")
+
+    vcon.save(str(file_path))
+
+    reloaded = Vcon.load(str(file_path))
+    assert reloaded.get_tag("saved") == "yes"
+    assert reloaded.dialog[0]["body"] == BODY
+    assert vcon.dialog[0]["body"] == BODY
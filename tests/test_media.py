@@ -0,0 +1,83 @@
+import base64
+import hashlib
+import os
+
+import pytest
+
+from vcon import media
+from vcon.lazy import LazyBody
+
+DATA = os.urandom(1001)
+
+
+@pytest.mark.parametrize("encoding", ["base64", "base64url"])
+@pytest.mark.parametrize("padded", [True, False])
+def test_encode_decode(encoding, padded) -> None:
+    text = media.encode(DATA, encoding, padded)
+    assert text.endswith("=") == padded
+    assert media.decode(text, encoding) == DATA
+    assert media.decode_exact(text, encoding) == (DATA, padded)
+
+
+def test_decode_exact_lazy_body() -> None:
+    text = base64.urlsafe_b64encode(DATA).decode()
+    assert media.decode_exact(LazyBody(text, 0, len(text)), "base64url") == (
+        DATA,
+        True,
+    )
+
+
+@pytest.mark.parametrize(
+    "body, encoding",
+    [
+        ("aGk=\n", "base64"),  # trailing newline is dropped when decoding
+        ("aGl=", "base64"),  # non-zero padding bits
+        ("a+b/", "base64url"),  # wrong alphabet
+        ("abcde", "base64url"),  # impossible length
+        ("café", "base64"),
+        ("aGk=", "none"),
+    ],
+)
+def test_decode_exact_rejects_non_canonical(body, encoding) -> None:
+    assert media.decode_exact(body, encoding) is None
+
+
+def test_encode_invalid_encoding() -> None:
+    with pytest.raises(ValueError):
+        media.encode(DATA, "hex")
+
+
+@pytest.mark.parametrize("size", [0, 1, 2, 3, 1000, 1001])
+@pytest.mark.parametrize("encoding", ["base64", "base64url"])
+@pytest.mark.parametrize("padded", [True, False])
+def test_media_body(size, encoding, padded) -> None:
+    data = DATA[:size]
+    text = media.encode(data, encoding, padded)
+    body = media.MediaBody(data, encoding, padded)
+    assert len(body) == len(text)
+    assert str(body) == text
+    assert body.tobytes() == text.encode()
+    assert body == text
+    assert body.raw() is data
+    assert "".join(body.chunks(10)) == text
+    assert media.decode(body, encoding) == data
+    assert media.decode_exact(body, encoding) == (data, padded)
+
+
+@pytest.mark.parametrize("chunk", [1, 2, 3, 4, 64, 1000])
+@pytest.mark.parametrize("size_hint", [None, 0, 10, 1001, 5000])
+def test_media_encoder(chunk, size_hint) -> None:
+    encoder = media.MediaEncoder(size_hint=size_hint)
+    for start in range(0, len(DATA), chunk):
+        encoder.update(memoryview(DATA)[start : start + chunk])
+    assert encoder.size == len(DATA)
+    assert encoder.body() == base64.urlsafe_b64encode(DATA).decode()
+    assert encoder.body() == base64.urlsafe_b64encode(DATA).decode()
+    assert encoder.signature() == media.signature(hashlib.sha256(DATA).digest())
+
+
+def test_media_encoder_hash_only() -> None:
+    encoder = media.MediaEncoder(encode=False)
+    encoder.update(DATA)
+    assert encoder.body() == ""
+    assert encoder.signature() == media.signature(hashlib.sha256(DATA).digest())
@@ -64,3 +64,44 @@ def test_party_history():
 
     expected_dict = {"party": 1, "event": "join", "time": now}
     assert history.to_dict() == expected_dict
+
+
+def test_party_uses_slots_for_common_fields():
+    party = Party(tel="123-456-7890", role="agent", custom_field="value")
+
+    assert "tel" not in party.__dict__
+    assert party.__dict__ == {"role": "agent", "custom_field": "value"}
+    assert not hasattr(party, "mailto")
+    assert list(party.to_dict()) == ["tel", "role", "custom_field"]
+
+
+def test_party_to_dict_order_and_none_values():
+    party = Party(meta={"a": 1}, name="Test User", tel="123", extra="x")
+    party.name = None
+
+    assert list(party.to_dict()) == ["tel", "meta", "extra"]
+
+
+def test_party_from_dict():
+    data = {"tel": "123", "name": None, "custom_field": "value"}
+    party = Party.from_dict(data)
+
+    assert party.to_dict() == Party(**data).to_dict()
+    assert not hasattr(party, "name")
+
+
+def test_party_pickles():
+    import pickle
+
+    party = Party(tel="123", custom_field="value")
+    assert pickle.loads(pickle.dumps(party)).to_dict() == party.to_dict()
+
+
+def test_party_history_from_dict_keeps_extensions():
+    data = {"party": 1, "event": "join", "time": "2024-01-01T00:00:00Z", "x": 1}
+    history = PartyHistory.from_dict(data)
+
+    assert history.party == 1
+    assert history.x == 1
+    assert history.to_dict() == data
+    assert "party" not in history.__dict__
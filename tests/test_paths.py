@@ -0,0 +1,64 @@
+from collections import namedtuple
+
+import pytest
+
+from vcon.paths import compile_path, get, parse_path
+
+Point = namedtuple("Point", "x y")
+
+DOC = {
+    "tel": "+15551234567",
+    "civicaddress": {"country": "US", "a.b": "dotted"},
+    "meta": {"tags": ["a", "b", {"deep": True}], 0: "int key", "1": "str key"},
+    "point": Point(1, 2),
+    "empty": None,
+}
+
+PATHS = [
+    "tel",
+    "civicaddress.country",
+    "civicaddress.missing",
+    "civicaddress.a\\.b",
+    "meta.tags[0]",
+    "meta.tags.1",
+    "meta.tags[2].deep",
+    "meta.tags[-1].deep",
+    "meta.tags[9]",
+    "meta.0",
+    "meta.1",
+    "point.x",
+    "point.1",
+    "empty.anything",
+    "tel.0",
+    "missing",
+    "missing.deeper",
+]
+
+
+def test_parse_path():
+    assert parse_path("tel") == ("tel",)
+    assert parse_path("a.b[2].c") == ("a", "b", 2, "c")
+    assert parse_path("a\\.b.c") == ("a.b", "c")
+    assert parse_path("[0][1]") == (0, 1)
+
+
+@pytest.mark.parametrize("path", PATHS)
+def test_matches_pydash(path):
+    pydash = pytest.importorskip("pydash")
+    assert get(DOC, path) == pydash.get(DOC, path)
+    assert get(DOC, path, "default") == pydash.get(DOC, path, "default")
+
+
+def test_accessors_are_cached():
+    assert compile_path("civicaddress.country") is compile_path("civicaddress.country")
+    accessor = compile_path("civicaddress.country")
+    assert accessor(DOC) == "US"
+    assert accessor({}, "none") == "none"
+
+
+def test_attribute_access_on_objects():
+    class Holder:
+        name = "holder"
+
+    assert get({"h": Holder()}, "h.name") == "holder"
+    assert get({"h": Holder()}, "h.__class__") is None
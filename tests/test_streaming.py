@@ -0,0 +1,152 @@
+import base64
+import io
+import json
+import os
+import tracemalloc
+
+import pytest
+
+from vcon import Vcon
+
+ijson = pytest.importorskip("ijson")
+
+from vcon.streaming import PLACEHOLDER, BodyEliding, load_skeleton  # noqa: E402
+
+
+def make_vcon_dict(body: str = "") -> dict:
+    return {
+        "uuid": "0192aa73-e702-8cef-9dd8-dd37220d739c",
+        "vcon": "0.0.1",
+        "created_at": "2024-10-20T15:02:55.490850+00:00",
+        "parties": [{"tel": "+14513886516"}, {"tel": "+16171557264"}],
+        "dialog": [
+            {
+                "type": "recording",
+                "start": "2024-10-20T15:02:54.888840",
+                "duration": 52.68,
+                "parties": [0, 1],
+                "mimetype": "audio/x-wav",
+                "body": body,
+                "encoding": "base64url",
+            }
+        ],
+        "attachments": [
+            {"type": "transcript", "body": {"turns": [1, 2, 3]}, "encoding": "json"}
+        ],
+        "analysis": [
+            {
+                "type": "summary",
+                "dialog": 0,
+                "vendor": "openai",
+                "body": "a summary",
+                "encoding": "none",
+            }
+        ],
+    }
+
+
+def write(tmp_path, doc) -> str:
+    file_path = tmp_path / "vcon.json"
+    file_path.write_text(doc if isinstance(doc, str) else json.dumps(doc))
+    return str(file_path)
+
+
+def test_load_skeleton_drops_bodies() -> None:
+    body = base64.urlsafe_b64encode(os.urandom(300_000)).decode()
+    doc = make_vcon_dict(body)
+
+    skeleton = load_skeleton(io.BytesIO(json.dumps(doc).encode()))
+
+    assert skeleton["dialog"][0]["body"] == PLACEHOLDER
+    assert skeleton["attachments"][0]["body"] == PLACEHOLDER
+    assert skeleton["analysis"][0]["body"] == PLACEHOLDER
+    for section in ("dialog", "attachments", "analysis"):
+        for entry in doc[section]:
+            entry["body"] = PLACEHOLDER
+    assert skeleton == doc
+    assert isinstance(skeleton["dialog"][0]["duration"], float)
+
+
+def test_load_skeleton_keeps_other_bodies() -> None:
+    doc = {"meta": {"body": "kept"}, "dialog": [{"meta": {"body": "kept"}}]}
+    assert load_skeleton(io.BytesIO(json.dumps(doc).encode())) == doc
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 64 * 1024])
+def test_body_eliding(size) -> None:
+    text = json.dumps(
+        {
+            "a": 'x\\"body": "y',
+            "body": "B" * 50,
+            "meta": {"body": "short", "other": "C" * 50},
+            "dialog": [{"body": "D" * 49, "x": 'e\\"'}],
+        }
+    ).encode()
+    reader = BodyEliding(io.BytesIO(text), 50)
+    data = b"".join(iter(lambda: reader.read(size), b""))
+
+    doc = json.loads(data)
+    assert doc["a"] == 'x\\"body": "y'
+    assert doc["body"] == ""
+    assert doc["meta"] == {"body": "short", "other": "C" * 50}
+    assert doc["dialog"][0] == {"body": "D" * 49, "x": 'e\\"'}
+
+
+def test_load_skeleton_never_builds_bodies() -> None:
+    body = "A" * 20_000_000
+    data = json.dumps(make_vcon_dict(body)).encode()
+    tracemalloc.start()
+    skeleton = load_skeleton(io.BytesIO(data))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert skeleton["dialog"][0]["body"] == PLACEHOLDER
+    assert peak < 1_000_000
+
+
+def test_load_skeleton_invalid_json() -> None:
+    with pytest.raises(json.JSONDecodeError):
+        load_skeleton(io.BytesIO(b'{"uuid": '))
+
+
+def test_validate_file_stream_valid(tmp_path) -> None:
+    file_path = write(tmp_path, make_vcon_dict("AAAA"))
+    assert Vcon.validate_file(file_path, stream=True) == (True, [])
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda d: d.pop("uuid"),
+        lambda d: d["dialog"][0]["parties"].append(7),
+        lambda d: d["dialog"][0].pop("start"),
+        lambda d: d["dialog"][0].update(mimetype="invalid/type"),
+        lambda d: d["dialog"][0].update(start="not a date"),
+        lambda d: d["attachments"][0].update(encoding="gzip"),
+        lambda d: d["attachments"][0].pop("body"),
+        lambda d: d["analysis"][0].update(dialog=[0, 3]),
+        lambda d: d.update(parties="nope"),
+        lambda d: d["dialog"].insert(0, "nope"),
+    ],
+)
+def test_validate_file_stream_matches_default(tmp_path, mutate) -> None:
+    doc = make_vcon_dict("AAAA")
+    mutate(doc)
+    file_path = write(tmp_path, doc)
+
+    result = Vcon.validate_file(file_path, stream=True)
+    assert result[0] is False
+    assert result == Vcon.validate_file(file_path)
+
+
+def test_validate_file_stream_errors(tmp_path) -> None:
+    assert Vcon.validate_file(str(tmp_path / "missing.json"), stream=True) == (
+        False,
+        ["File not found"],
+    )
+    assert Vcon.validate_file(write(tmp_path, "invalid json"), stream=True) == (
+        False,
+        ["Invalid JSON format"],
+    )
+    assert Vcon.validate_file(write(tmp_path, '{"some": "json"}'), stream=True) == (
+        Vcon.validate_file(write(tmp_path, '{"some": "json"}'))
+    )
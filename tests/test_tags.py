@@ -0,0 +1,119 @@
+import pytest
+
+from vcon import Vcon
+
+
+def test_values_keep_colons():
+    vcon = Vcon.build_new()
+    vcon.add_tag("callback", "https://example.com:8443/hook")
+    assert vcon.get_tag("callback") == "https://example.com:8443/hook"
+    assert vcon.tags_map["callback"] == "https://example.com:8443/hook"
+
+
+def test_add_tag_upserts():
+    vcon = Vcon.build_new()
+    vcon.add_tag("queue", "billing")
+    vcon.add_tag("queue", "support")
+    assert vcon.tags["body"] == ["queue:support"]
+    assert vcon.get_tag("queue") == "support"
+
+
+def test_set_remove_and_update():
+    vcon = Vcon.build_new()
+    tags = vcon.tags_map
+    assert len(tags) == 0
+    assert vcon.tags is None
+
+    tags.set_tag("a", 1)
+    tags["b"] = "2"
+    tags.update_tags({"c": "3"}, a="one")
+    assert dict(tags) == {"a": "one", "b": "2", "c": "3"}
+    assert vcon.tags["body"] == ["a:one", "b:2", "c:3"]
+
+    assert tags.remove_tag("b") == "2"
+    assert tags.remove_tag("b") is None
+    del tags["a"]
+    with pytest.raises(KeyError):
+        del tags["a"]
+    assert tags.to_list() == ["c:3"]
+    assert "c" in tags and "a" not in tags
+
+
+def test_parses_existing_attachment_and_duplicates():
+    vcon = Vcon.build_new()
+    vcon.vcon_dict["attachments"].append(
+        {
+            "type": "tags",
+            "body": ["a:1", "b:2", "a:3", "no-colon", 42],
+            "encoding": "json",
+        }
+    )
+    assert vcon.get_tag("a") == "1"
+    assert set(vcon.tags_map) == {"a", "b"}
+
+    vcon.tags_map.set_tag("a", "4")
+    assert vcon.tags["body"] == ["a:4", "b:2", "no-colon", 42]
+
+
+def test_serializes_as_string_list():
+    vcon = Vcon.build_new()
+    vcon.tags_map.update_tags(x="1", y="2:3")
+    reloaded = Vcon.build_from_json(vcon.to_json())
+    assert reloaded.tags["body"] == ["x:1", "y:2:3"]
+    assert reloaded.get_tag("y") == "2:3"
+
+
+def test_direct_changes_are_noticed():
+    vcon = Vcon.build_new()
+    vcon.add_tag("a", "1")
+    assert vcon.get_tag("b") is None
+
+    vcon.tags["body"].append("b:2")
+    assert vcon.get_tag("b") == "2"
+
+    vcon.tags["body"] = ["c:3"]
+    assert vcon.get_tag("a") is None
+    assert vcon.get_tag("c") == "3"
+
+    vcon.vcon_dict["attachments"] = []
+    assert vcon.get_tag("c") is None
+
+    vcon.add_tag("d", "4")
+    vcon.tags["body"][0] = "d:5"
+    assert vcon.get_tag("d") == "5"
+
+
+def test_tags_edited_in_place_are_noticed():
+    vcon = Vcon.build_new()
+    vcon.tags_map.update_tags(a="1", b="2")
+    assert vcon.get_tag("a") == "1"
+
+    vcon.tags["body"][0] = "a:9"
+    assert vcon.get_tag("a") == "9"
+    assert vcon.tags_map["a"] == "9"
+
+    vcon.tags["body"][1] = "c:3"
+    vcon.tags_map.refresh()
+    assert vcon.get_tag("b") is None
+    assert vcon.get_tag("c") == "3"
+    assert dict(vcon.tags_map) == {"a": "9", "c": "3"}
+
+    vcon.tags["body"][0] = "c:4"
+    vcon.tags_map.set_tag("a", "5")
+    assert vcon.tags["body"] == ["c:4", "c:3", "a:5"]
+    assert vcon.get_tag("c") == "4"
+
+
+def test_miss_does_not_reparse(monkeypatch):
+    vcon = Vcon.build_new()
+    vcon.tags_map.update_tags({f"t{i}": i for i in range(100)})
+    assert vcon.get_tag("t5") == "5"
+
+    def fail(*args):
+        raise AssertionError("re-parsed")
+
+    monkeypatch.setattr(vcon.tags_map, "_parse", fail)
+    monkeypatch.setattr(vcon, "find_attachment_by_type", fail)
+    assert vcon.get_tag("missing") is None
+    assert vcon.get_tag("t99") == "99"
+    assert len(vcon.tags_map) == 100
@@ -0,0 +1,67 @@
+import pytest
+from dateutil import parser
+from dateutil.parser import ParserError
+
+from vcon.timestamps import (
+    _parse_rfc3339,
+    clear_cache,
+    normalize_timestamp,
+    parse_timestamp,
+)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2024-10-20T15:02:54.888840",
+        "2024-10-20T15:02:54.888840+00:00",
+        "2024-10-20T15:02:54Z",
+        "2024-10-20t15:02:54z",
+        "2024-10-20 15:02:54-05:30",
+        "2024-10-20T15:02:54.5+01:00",
+        "2024-10-20T15:02:54,25-00:00",
+        "2024-10-20T15:02:54.1234567891Z",
+    ],
+)
+def test_fast_path_matches_dateutil(value):
+    fast = _parse_rfc3339(value)
+    assert fast is not None
+    assert fast.isoformat() == parser.parse(value).isoformat()
+    assert normalize_timestamp(value) == parser.parse(value).isoformat()
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2024-10-20",
+        "Oct 20 2024 3pm",
+        "2024-02-30T00:00:00Z",
+        "2024-10-20T15:02:54+24:00",
+    ],
+)
+def test_non_canonical_values_fall_back(value):
+    assert _parse_rfc3339(value) is None
+    try:
+        expected = parser.parse(value).isoformat()
+    except (ParserError, ValueError) as e:
+        with pytest.raises(type(e)):
+            normalize_timestamp(value)
+    else:
+        assert normalize_timestamp(value) == expected
+
+
+def test_invalid_value_raises_parser_error():
+    with pytest.raises(ParserError):
+        parse_timestamp("invalid-datetime")
+
+
+def test_non_string_values_use_dateutil():
+    with pytest.raises(TypeError):
+        parse_timestamp(12345)
+
+
+def test_results_are_cached():
+    clear_cache()
+    normalize_timestamp("2024-10-20T15:02:54Z")
+    normalize_timestamp("2024-10-20T15:02:54Z")
+    assert normalize_timestamp.cache_info().hits == 1
@@ -0,0 +1,114 @@
+from vcon import Vcon
+from vcon.validation import DEFAULT_VALIDATOR, SectionRule, VconValidator
+
+
+def _base():
+    return {
+        "uuid": "018e4f2c-0000-7000-8000-000000000000",
+        "vcon": "0.0.1",
+        "created_at": "2024-01-01T00:00:00+00:00",
+        "parties": [{"tel": "+15551234567"}],
+        "dialog": [],
+        "attachments": [],
+        "analysis": [],
+    }
+
+
+def test_valid_document_has_no_errors():
+    doc = _base()
+    doc["dialog"].append(
+        {
+            "type": "text",
+            "start": "2024-01-01T00:00:00Z",
+            "parties": [0],
+            "mimetype": "audio/wav",
+        }
+    )
+    doc["analysis"].append(
+        {"type": "summary", "dialog": 0, "vendor": "v", "body": "", "encoding": "none"}
+    )
+    assert DEFAULT_VALIDATOR.validate(doc) == []
+
+
+def test_error_strings_and_order_are_unchanged():
+    doc = _base()
+    del doc["uuid"]
+    doc["created_at"] = "not a date"
+    doc["parties"].append("nope")
+    doc["dialog"] = [
+        {"type": "text", "start": "bad", "parties": [0, 5, "x"]},
+        7,
+    ]
+    doc["attachments"] = [{"type": "tags", "encoding": "hex"}]
+    doc["analysis"] = [
+        {
+            "type": "summary",
+            "dialog": [0, 3],
+            "vendor": "v",
+            "body": "",
+            "encoding": "json",
+        },
+        {
+            "type": "summary",
+            "dialog": "0",
+            "vendor": "v",
+            "body": "",
+            "encoding": "json",
+        },
+    ]
+
+    assert DEFAULT_VALIDATOR.validate(doc) == [
+        "Missing required field: uuid",
+        "Invalid created_at format. Must be ISO 8601 datetime string",
+        "Party at index 1 must be a dictionary",
+        "Dialog at index 0 references invalid party index: 5",
+        "Dialog at index 0 references invalid party index: x",
+        "Dialog at index 0 has invalid start format. Must be ISO 8601 datetime string",
+        "Dialog 0 has invalid mimetype: missing",
+        "Dialog at index 1 must be a dictionary",
+        "Attachment at index 0 missing required field: body",
+        "Attachment at index 0 has invalid encoding: hex",
+        "Analysis at index 0 references invalid dialog index: 3",
+        "Analysis at index 1 has invalid dialog reference type",
+    ]
+
+
+def test_sections_must_be_lists():
+    doc = _base()
+    doc["parties"] = {}
+    doc["analysis"] = "x"
+    assert DEFAULT_VALIDATOR.validate(doc) == [
+        "parties must be a list",
+        "analysis must be a list",
+    ]
+
+
+def test_fail_fast_returns_first_error_only():
+    doc = _base()
+    doc["attachments"] = [{"type": "tags"}]
+    doc["analysis"] = [{}]
+    full = DEFAULT_VALIDATOR.validate(doc)
+    assert len(full) > 1
+    assert DEFAULT_VALIDATOR.validate(doc, fail_fast=True) == full[:1]
+
+
+def test_is_valid_fail_fast():
+    vcon = Vcon.build_new()
+    vcon.vcon_dict["dialog"] = [{}, {}]
+    valid, errors = vcon.is_valid(fail_fast=True)
+    assert not valid
+    assert errors == ["Dialog at index 0 missing required field: type"]
+    assert len(vcon.is_valid()[1]) > 1
+
+
+def test_custom_rules():
+    validator = VconValidator(
+        sections=[SectionRule("attachments", "Attachment", required=("purpose",))],
+        required=("uuid",),
+    )
+    errors = validator.validate({"attachments": [{}, "x"]})
+    assert errors == [
+        "Missing required field: uuid",
+        "Attachment at index 0 missing required field: purpose",
+        "Attachment at index 1 must be a dictionary",
+    ]
@@ -702,3 +702,105 @@ def test_validate_file_with_invalid_vcon(tmp_path):
     assert not is_valid
     assert len(errors) > 0
     assert "Missing required field" in errors[0]
+
+
+def test_copy_false_adopts_vcon_dict() -> None:
+    vcon_dict = {"created_at": "2022-01-01T12:00:00Z", "data": {"key": "value"}}
+    vcon = Vcon(vcon_dict, copy=False)
+    assert vcon.vcon_dict is vcon_dict
+    # normalization still happens, in place
+    assert vcon_dict["created_at"] == "2022-01-01T12:00:00+00:00"
+    assert vcon_dict["attachments"] == []
+
+
+def test_build_from_json_adopts_parsed_dict() -> None:
+    vcon = Vcon.build_from_json(test_vcon_string)
+    assert vcon.to_dict() == Vcon(json.loads(test_vcon_string)).to_dict()
+
+
+def test_default_vcon_dict_is_not_shared() -> None:
+    first = Vcon()
+    second = Vcon()
+    assert first.vcon_dict is not second.vcon_dict
+    first.add_attachment(type="test_type", body="test_body")
+    assert second.attachments == []
+
+
+def test_parties_are_cached_until_changed() -> None:
+    vcon = Vcon.build_new()
+    vcon.add_party(Party(name="Alice"))
+    parties = vcon.parties
+    assert vcon.parties is parties
+
+    vcon.add_party(Party(name="Bob"))
+    assert [p.name for p in vcon.parties] == ["Alice", "Bob"]
+
+    vcon.vcon_dict["parties"].pop()
+    assert [p.name for p in vcon.parties] == ["Alice"]
+
+    vcon.vcon_dict["parties"] = [{"name": "Carol"}]
+    assert [p.name for p in vcon.parties] == ["Carol"]
+
+    vcon.vcon_dict["parties"][0]["name"] = "Dave"
+    vcon.invalidate_indexes()
+    assert vcon.parties[0].name == "Dave"
+
+
+def test_dialogs_are_cached_write_through_views() -> None:
+    vcon = Vcon.build_new()
+    for i in range(3):
+        vcon.add_dialog(
+            Dialog(type="text", start="2024-01-01T00:00:00Z", parties=[0], body=str(i))
+        )
+    dialogs = vcon.dialogs
+    assert len(dialogs) == 3
+    assert [d.body for d in dialogs] == ["0", "1", "2"]
+    assert dialogs[1] is vcon.dialogs[1]
+    assert dialogs[-1].body == "2"
+    assert [d.body for d in dialogs[:2]] == ["0", "1"]
+
+    dialogs[0].body = "changed"
+    assert vcon.vcon_dict["dialog"][0]["body"] == "changed"
+
+    vcon.vcon_dict["dialog"][1] = {
+        "type": "text",
+        "start": "x",
+        "parties": [],
+        "body": "new",
+    }
+    assert dialogs[1].body == "new"
+
+    vcon.add_dialog(Dialog(type="text", start="2024-01-01T00:00:00Z", parties=[0]))
+    assert len(dialogs) == 4
+
+
+def test_dialog_view_changes_drop_dialog_indexes() -> None:
+    vcon = Vcon.build_new()
+    for dialog_type in ("text", "recording"):
+        vcon.add_dialog(
+            Dialog(type=dialog_type, start="2024-01-01T00:00:00Z", parties=[0])
+        )
+    vcon.build_index("type", "dialog")
+    vcon.build_index("meta.channel", "dialog")
+    assert vcon.find_dialog("type", "recording").start == vcon.dialog[1]["start"]
+
+    vcon.dialogs[0].type = "recording"
+    vcon.dialogs[1].meta = {"channel": "sms"}
+    assert vcon.find_dialog("type", "recording").to_dict() == vcon.dialog[0]
+    assert vcon.find_dialog("meta.channel", "sms").to_dict() == vcon.dialog[1]
+
+    del vcon.dialogs[0].type
+    vcon.dialogs[1].note = "extension"
+    assert vcon.find_dialog("type", "recording").to_dict() == vcon.dialog[1]
+    assert vcon.dialog[1]["note"] == "extension"
+
+
+def test_find_dialog_returns_detached_copy() -> None:
+    vcon = Vcon.build_new()
+    vcon.add_dialog(
+        Dialog(type="text", start="2024-01-01T00:00:00Z", parties=[0], body="hi")
+    )
+    found = vcon.find_dialog("body", "hi")
+    assert found.start == "2024-01-01T00:00:00+00:00"
+    found.body = "changed"
+    assert vcon.vcon_dict["dialog"][0]["body"] == "hi"
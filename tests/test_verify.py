@@ -0,0 +1,132 @@
+import base64
+import hashlib
+import os
+
+import pytest
+
+from vcon import Vcon
+from vcon.dialog import Dialog
+from vcon.media import MediaBody
+from vcon.verify import (
+    ERROR,
+    EXTERNAL,
+    INLINE,
+    MISMATCH,
+    OK,
+    UNSIGNED,
+    MediaResult,
+    verify_dialog,
+)
+
+AUDIO = os.urandom(10_000)
+
+
+def signature(data: bytes) -> str:
+    return base64.urlsafe_b64encode(hashlib.sha256(data).digest()).decode()
+
+
+def inline(data: bytes, **fields) -> dict:
+    dialog = {
+        "type": "recording",
+        "start": "2024-10-20T15:02:54",
+        "parties": [0],
+        "body": base64.urlsafe_b64encode(data).decode(),
+        "encoding": "base64url",
+        "alg": "sha256",
+        "signature": signature(data),
+    }
+    dialog.update(fields)
+    return dialog
+
+
+def test_verify_dialog_hashes_decoded_bytes() -> None:
+    assert verify_dialog(inline(AUDIO), 3) == MediaResult(3, OK, INLINE, len(AUDIO))
+    unpadded = inline(AUDIO[1:])
+    unpadded["body"] = unpadded["body"].rstrip("=")
+    assert verify_dialog(unpadded).status == OK
+    lazy = inline(AUDIO, body=MediaBody(AUDIO, "base64url"))
+    assert verify_dialog(lazy).status == OK
+
+
+def test_verify_dialog_standard_base64() -> None:
+    dialog = inline(AUDIO, encoding="base64", body=base64.b64encode(AUDIO).decode())
+    assert verify_dialog(dialog).status == OK
+
+
+def test_verify_dialog_text_body() -> None:
+    text = "Hello, I need help with my account. ✓"
+    dialog = {"body": text, "encoding": "none", "signature": signature(text.encode())}
+    assert verify_dialog(dialog).status == OK
+
+
+def test_verify_dialog_accepts_signature_of_encoded_text() -> None:
+    dialog = Dialog(type="recording", start="2024-10-20", parties=[0])
+    dialog.add_inline_data(
+        base64.urlsafe_b64encode(AUDIO).decode(), "a.wav", "audio/x-wav"
+    )
+    assert verify_dialog(dialog.to_dict()).status == OK
+
+
+def test_verify_dialog_failures() -> None:
+    assert verify_dialog(inline(AUDIO, signature=signature(b"x"))).status == MISMATCH
+    assert verify_dialog(inline(AUDIO, signature=None)) == MediaResult(
+        0, UNSIGNED, INLINE
+    )
+    result = verify_dialog(inline(AUDIO, alg="md5"))
+    assert result.status == ERROR
+    assert result.error == "Unsupported alg: md5"
+    result = verify_dialog(inline(AUDIO, body={"not": "text"}))
+    assert result.status == ERROR
+    assert result.error == "Body is not a string: dict"
+
+
+def test_verify_dialog_unreachable_url() -> None:
+    dialog = {"url": "http://127.0.0.1:9/a.wav", "signature": signature(AUDIO)}
+    result = verify_dialog(dialog, timeout=1)
+    assert result.status == ERROR
+    assert result.source == EXTERNAL
+    assert result.error
+
+
+@pytest.mark.parametrize("workers", [0, 1, 4])
+def test_verify_media(make_vcon, workers) -> None:
+    vcon = make_vcon(
+        inline(AUDIO),
+        {"type": "text", "start": "2024-10-20T15:02:55"},
+        inline(AUDIO[1:], signature=signature(AUDIO)),
+        inline(AUDIO[2:], signature=None),
+        inline(AUDIO[3:]),
+    )
+    report = vcon.verify_media(workers=workers)
+
+    assert report.label == vcon.uuid
+    assert [(r.index, r.status) for r in report.results] == [
+        (0, OK),
+        (2, MISMATCH),
+        (3, UNSIGNED),
+        (4, OK),
+    ]
+    assert not report.ok
+    assert [r.index for r in report.failures] == [2]
+    assert report.counts() == {OK: 2, MISMATCH: 1, UNSIGNED: 1, ERROR: 0}
+
+
+def test_verify_media_without_media() -> None:
+    report = Vcon.build_new().verify_media()
+    assert report.ok
+    assert report.results == []
+
+
+def test_is_external_data_changed_hashes_decoded_body(capsys) -> None:
+    dialog = Dialog(
+        type="recording",
+        start="2024-10-20",
+        parties=[0],
+        url="http://127.0.0.1:9/a.wav",
+        **{k: v for k, v in inline(AUDIO).items() if k in ("body", "encoding")},
+        signature=signature(AUDIO),
+    )
+    assert not dialog.is_external_data_changed()
+    dialog.signature = signature(b"x")
+    assert dialog.is_external_data_changed()
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,113 @@
+import base64
+import io
+import json
+import os
+
+import pytest
+
+from vcon import Vcon
+from vcon.lazy import LazyBody
+from vcon.writer import iter_json, write_json
+
+BODY = base64.urlsafe_b64encode(os.urandom(50_000)).decode()
+
+
+@pytest.fixture
+def vcon(make_vcon) -> Vcon:
+    return make_vcon(
+        {"mimetype": "audio/x-wav", "body": BODY, "encoding": "base64url"},
+        {
+            "type": "text",
+            "start": "2024-10-20T15:02:55",
+            "body": 'café "quoted"\n' * 2000,
+        },
+        tags={"queue": "billing"},
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1024, 64 * 1024])
+def test_iter_json_matches_json_dumps(vcon, chunk_size) -> None:
+    text = "".join(vcon.iter_json(chunk_size=chunk_size))
+    assert text == vcon.to_json(backend="json")
+
+
+def test_iter_json_chunk_sizes(vcon) -> None:
+    chunks = list(vcon.iter_json(chunk_size=1024))
+    assert len(chunks) > 50
+    # escaping can at most multiply a slice's length by six
+    assert max(len(chunk) for chunk in chunks) <= 6 * 1024
+
+
+def test_iter_json_values() -> None:
+    obj = {
+        1: [None, True, 1.5, ("a", "b" * 100)],
+        "x☃": {"nested": "y" * 100, "empty": {}},
+        "list": [],
+    }
+    expected = json.dumps(obj)
+    assert "".join(iter_json(obj, chunk_size=16)) == expected
+
+
+def test_iter_json_lazy_body() -> None:
+    source = f'xx"{BODY}"'
+    body = LazyBody(source, 3, 3 + len(BODY))
+    text = "".join(iter_json({"body": body}, chunk_size=1000))
+    assert json.loads(text) == {"body": BODY}
+
+
+def test_iter_json_unserializable() -> None:
+    with pytest.raises(TypeError):
+        "".join(iter_json({"a": object()}))
+
+
+def test_write_to_text_and_binary(vcon) -> None:
+    expected = vcon.to_json(backend="json")
+
+    text = io.StringIO()
+    assert vcon.write_to(text) == len(expected)
+    assert text.getvalue() == expected
+
+    binary = io.BytesIO()
+    vcon.write_to(binary)
+    assert binary.getvalue() == expected.encode("ascii")
+
+
+def test_write_json_text_sink_without_textiobase() -> None:
+    class Sink:
+        def __init__(self) -> None:
+            self.parts = []
+
+        def write(self, text: str) -> None:
+            if not isinstance(text, str):
+                raise TypeError("text only")
+            self.parts.append(text)
+
+    sink = Sink()
+    write_json({"body": BODY}, sink, chunk_size=4096)
+    assert json.loads("".join(sink.parts)) == {"body": BODY}
+
+
+def test_write_json_binary_sink_without_bufferediobase() -> None:
+    class Sink:
+        def __init__(self) -> None:
+            self.data = bytearray()
+
+        def write(self, data: bytes) -> None:
+            self.data += memoryview(data)
+
+    sink = Sink()
+    write_json({"body": BODY}, sink, chunk_size=4096)
+    assert json.loads(bytes(sink.data)) == {"body": BODY}
+
+
+def test_write_json_file(tmp_path) -> None:
+    path = tmp_path / "out.json"
+    with open(path, "wb") as f:
+        write_json({"body": BODY}, f, chunk_size=4096)
+    assert json.loads(path.read_bytes()) == {"body": BODY}
+
+
+def test_save_uses_writer(vcon, tmp_path) -> None:
+    path = tmp_path / "saved.vcon.json"
+    vcon.save(str(path))
+    assert path.read_text() == vcon.to_json(backend="json")